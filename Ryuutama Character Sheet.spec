@@ -6,7 +6,9 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    # Tabs are imported by name when first shown (see MainWindow.TABS)
+    hiddenimports=['views.character_tab', 'views.stats_tab', 'views.equipment_tab',
+                   'views.travel_tab', 'views.conditions_tab'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
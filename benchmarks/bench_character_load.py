@@ -0,0 +1,66 @@
+"""
+Benchmark: loading a library of JSON saves into Character objects.
+
+Compares the schema loader (models/schema.py) with the loop it replaced,
+which built a default Character and then assigned every save key.
+
+Usage: python benchmarks/bench_character_load.py [library_size]
+"""
+
+import json
+import sys
+import time
+
+from sample_characters import make_character
+
+from models.character import Character
+from models.equipment import Weapon, Shield, Armor, Item
+from models.schema import load_character
+
+
+def previous_from_dict(data):
+    """Character.from_dict before the schema loader"""
+    character = Character()
+    for key, value in data.items():
+        if key != "schema_version":
+            setattr(character, key, value)
+    if data.get("weapons"):
+        character.weapons = [Weapon.from_dict(w) for w in data["weapons"]]
+    if data.get("shield"):
+        character.shield = Shield.from_dict(data["shield"])
+    if data.get("armor"):
+        character.armor = Armor.from_dict(data["armor"])
+    if data.get("travelers_outfit"):
+        character.travelers_outfit = [Item.from_dict(i) for i in data["travelers_outfit"]]
+    return character
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        times.append(time.process_time() - start)
+    return min(times)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    # Saves as they come out of json.load (ability levels become string keys)
+    texts = [json.dumps(make_character(i).to_dict()) for i in range(size)]
+    dicts = [json.loads(text) for text in texts]
+
+    previous = best_of(lambda: [previous_from_dict(d) for d in dicts])
+    schema = best_of(lambda: [load_character(d)[0] for d in dicts])
+    previous_total = best_of(lambda: [previous_from_dict(json.loads(t)) for t in texts])
+    schema_total = best_of(lambda: [load_character(json.loads(t))[0] for t in texts])
+
+    print(f"{size} saves")
+    print(f"  dict -> Character, previous loop:   {previous * 1000:8.1f} ms")
+    print(f"  dict -> Character, schema loader:   {schema * 1000:8.1f} ms")
+    print(f"  JSON -> Character, previous loop:   {previous_total * 1000:8.1f} ms")
+    print(f"  JSON -> Character, schema loader:   {schema_total * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: memory held per loaded Character.
+
+Usage: python benchmarks/bench_character_memory.py [character_count]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from sample_characters import make_character
+
+from models.character import Character
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    # Loaded saves: JSON text, so no objects are shared with the generator
+    saves = [json.dumps(make_character(i % 500).to_dict()) for i in range(count)]
+    dicts = [json.loads(save) for save in saves]
+    del saves
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    characters = [Character.from_dict(d) for d in dicts]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Strings are shared with the source dictionaries, so this is the cost of the model itself
+    print(f"{count} characters: {(after - before) / count:8.0f} bytes/character (model objects)")
+
+    start = time.perf_counter()
+    for _ in range(20):
+        total = 0
+        for character in characters:
+            total += character.str["value"] + character.dex["value"] + character.hp["current"]
+    elapsed = time.perf_counter() - start
+    print(f"dict-style stat access: {elapsed / (20 * count * 3) * 1e9:6.1f} ns per lookup")
+
+    start = time.perf_counter()
+    for _ in range(20):
+        total = 0
+        for character in characters:
+            total += character.str.value + character.dex.value + character.hp.current
+    elapsed = time.perf_counter() - start
+    print(f"attribute stat access:  {elapsed / (20 * count * 3) * 1e9:6.1f} ns per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: check success rates, random.randint loop vs DiceEngine.
+
+Usage: python benchmarks/bench_dice.py [trials]
+"""
+
+import random
+import sys
+import time
+
+from sample_characters import make_character
+
+from models.dice import DiceEngine, die_faces
+from models.party_frame import PartyFrame
+
+TARGET = 8
+
+
+def loop_rates(first_faces, second_faces, trials):
+    """Success rate of a check rolled one check at a time with random"""
+    successes = 0
+    for _ in range(trials):
+        first = random.randint(1, first_faces)
+        second = random.randint(1, second_faces)
+        critical = (first == first_faces and second == second_faces) or (first == 6 and second == 6)
+        fumble = first == 1 and second == 1
+        if (first + second >= TARGET or critical) and not fumble:
+            successes += 1
+    return successes / trials
+
+
+def main():
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    engine = DiceEngine(seed=1)
+
+    start = time.perf_counter()
+    loop = loop_rates(die_faces("d8"), die_faces("d6"), trials)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rates = engine.check_rates("d8", "d6", TARGET, trials=trials)
+    engine_time = time.perf_counter() - start
+
+    characters = [make_character(i) for i in range(500)]
+    frame = PartyFrame(characters)
+    start = time.perf_counter()
+    engine.party_check_rates(frame, "str", "spi", TARGET, trials=10_000)
+    party_time = time.perf_counter() - start
+
+    print(f"[d8 + d6] vs {TARGET}, {trials} trials")
+    print(f"  random loop:   {loop_time * 1000:9.1f} ms  success {loop:.4f}")
+    print(f"  DiceEngine:    {engine_time * 1000:9.1f} ms  success {rates['success']:.4f} "
+          f"critical {rates['critical']:.4f} fumble {rates['fumble']:.4f}")
+    print(f"500-character party [STR + SPI], 10000 trials each: {party_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
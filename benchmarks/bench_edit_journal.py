@@ -0,0 +1,89 @@
+"""
+Benchmark: edit journal overhead per edit and crash recovery time.
+
+Edits are journaled as the fields they changed, as AppController does.
+For comparison, the whole character is also converted and diffed per
+edit. Compaction writes the character to a fresh save next to the
+journal, which recovery then reads instead of the records.
+
+Usage: python benchmarks/bench_edit_journal.py [edit_count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from sample_characters import make_character
+
+from controllers import edit_journal
+from controllers.edit_journal import EditJournal
+from controllers.file_controller import FileController
+from utils.atomic_file import write_atomic
+
+
+def type_notes(character, journal, edit_count, whole_character=False):
+    """Simulate typing into the notes field, one journaled edit per keystroke"""
+    start = time.perf_counter()
+    for index in range(edit_count):
+        character.notes += "abcdefghij"[index % 10]
+        character.hp["current"] = index % 20
+        if whole_character:
+            journal.record(character.to_dict())
+        else:
+            journal.record({field: character.field_to_dict(field) for field in ("notes", "hp")})
+    journal.sync()
+    return time.perf_counter() - start
+
+
+def main():
+    edit_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        file_controller = FileController()
+        character = make_character(1)
+        save_path = os.path.join(save_dir, "character.json")
+        write_atomic(save_path, file_controller.encode_character(character.to_dict(), save_path))
+
+        # Baseline: rewrite the whole save on every edit
+        start = time.perf_counter()
+        for index in range(min(edit_count, 200)):
+            character.notes += "x"
+            write_atomic(save_path, file_controller.encode_character(character.to_dict(), save_path))
+        full_save = (time.perf_counter() - start) / min(edit_count, 200)
+        print(f"full atomic save per edit:   {full_save * 1e6:9.1f} us")
+
+        # Keep the benchmark journal below the compaction threshold
+        edit_journal.COMPACT_THRESHOLD = 1 << 40
+        journal = EditJournal.for_save(save_dir, save_path)
+        journal.start(save_path)
+        elapsed = type_notes(character, journal, edit_count, whole_character=True)
+        print(f"journal per edit, diff all:  {elapsed / edit_count * 1e6:9.1f} us")
+
+        journal.start(save_path)
+        elapsed = type_notes(character, journal, edit_count)
+        size = os.path.getsize(journal.journal_path)
+        print(f"journal per edit:            {elapsed / edit_count * 1e6:9.1f} us "
+              f"({edit_count} edits, {size / 1024:.0f} KiB journal)")
+        journal.close()
+
+        start = time.perf_counter()
+        state, _, records = edit_journal.replay(journal.journal_path, file_controller.read_character_dict)
+        replay_time = time.perf_counter() - start
+        assert state["notes"] == character.notes
+        print(f"recovery, {records} records:    {replay_time * 1000:9.2f} ms")
+
+        journal.compact(character.to_dict())
+        journal.close()
+        start = time.perf_counter()
+        state, _, records = edit_journal.replay(journal.journal_path, file_controller.read_character_dict)
+        replay_time = time.perf_counter() - start
+        assert state["notes"] == character.notes
+        print(f"recovery after compaction:   {replay_time * 1000:9.2f} ms "
+              f"({os.path.getsize(journal.journal_path)} B journal, "
+              f"{os.path.getsize(journal.compacted_path) / 1024:.0f} KiB save)")
+        journal.discard()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark: Treeview rows written when buying, editing and removing items
+of a large traveler's outfit.
+
+Before: every change deleted all rows, inserted them again with list
+indices as ids and summed the sizes. After: rows are keyed by item uid
+and only the changed rows are written (views/keyed_tree.py); lists over
+the virtualization threshold only hold the rows in view.
+
+Runs without a display: the Treeview is replaced by a stand-in that keeps
+the rows and counts the calls, so the numbers count Tk calls, not the
+time Tk spends drawing.
+
+Usage: python benchmarks/bench_equipment_rows.py [item_count]
+"""
+
+import random
+import sys
+import time
+
+from sample_characters import make_character
+
+from models.rulebook import get_catalog
+from views.keyed_tree import KeyedTreeview
+
+OPERATIONS = 200
+VISIBLE_ROWS = 15
+
+
+class FakeTree:
+    """Rows and call counts of a ttk.Treeview"""
+
+    def __init__(self):
+        self.rows = []  # iids in order
+        self.values = {}
+        self.calls = 0
+
+    def get_children(self):
+        self.calls += 1
+        return tuple(self.rows)
+
+    def delete(self, *iids):
+        self.calls += 1
+        for iid in iids:
+            self.rows.remove(iid)
+            del self.values[iid]
+
+    def insert(self, parent, index, iid, values):
+        self.calls += 1
+        if iid in self.values:
+            raise ValueError(f"Item {iid} already exists")
+        self.rows.insert(len(self.rows) if index == "end" else index, iid)
+        self.values[iid] = values
+
+    def item(self, iid, values):
+        self.calls += 1
+        self.values[iid] = values
+
+    def move(self, iid, parent, index):
+        self.calls += 1
+        self.rows.remove(iid)
+        self.rows.insert(index, iid)
+
+    def bind(self, sequence, callback, add=None):
+        pass
+
+    def configure(self, **options):
+        pass
+
+    def winfo_height(self):
+        return 0
+
+    def cget(self, option):
+        return VISIBLE_ROWS
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        pass
+
+    def configure(self, **options):
+        pass
+
+
+def row(item):
+    return item.name, item.size, item.durability, item.description
+
+
+def refresh_before(tree, items):
+    """The old refresh: rebuild every row, then sum the sizes"""
+    for iid in tree.get_children():
+        tree.delete(iid)
+    for i, item in enumerate(items):
+        tree.insert("", "end", iid=str(i), values=row(item))
+    return sum(item.size for item in items)
+
+
+def refresh_after(rows, items):
+    rows.update((item.uid, row(item)) for item in items)
+    return rows.total
+
+
+def operations(items, rng):
+    """Buy, edit or remove one item at a time"""
+    catalog_items = get_catalog().query(kind="item")
+    for index in range(OPERATIONS):
+        choice = index % 3
+        if choice == 0:
+            items.append(rng.choice(catalog_items).create())
+        elif choice == 1:
+            position = rng.randrange(len(items))
+            edited = rng.choice(catalog_items).create()
+            edited.uid = items[position].uid
+            items[position] = edited
+        else:
+            items.pop(rng.randrange(len(items)))
+        yield
+
+
+def measure(item_count, keyed):
+    character = make_character(0)
+    rng = random.Random(item_count)
+    catalog_items = get_catalog().query(kind="item")
+    items = [rng.choice(catalog_items).create() for _ in range(item_count)]
+    character.travelers_outfit = items
+
+    tree = FakeTree()
+    rows = KeyedTreeview(tree, FakeScrollbar(), total_column=1)
+    refresh = (lambda: refresh_after(rows, items)) if keyed else (lambda: refresh_before(tree, items))
+    refresh()
+
+    tree.calls = 0
+    seconds = 0.0
+    for _ in operations(items, rng):
+        start = time.perf_counter()
+        total = refresh()
+        seconds += time.perf_counter() - start
+        assert total == sum(item.size for item in items)
+    if keyed and not rows.virtual:
+        assert tree.rows == [str(item.uid) for item in items]
+    return tree.calls / OPERATIONS, seconds / OPERATIONS, len(tree.rows)
+
+
+def main():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    get_catalog()
+
+    print(f"{OPERATIONS} purchases, edits and removals on an outfit of {item_count} items "
+          f"({VISIBLE_ROWS} rows in view)")
+    print(f"{'':14} {'Tk calls':>9} {'refresh':>11} {'rows held':>10}")
+    for label, keyed in (("rebuild", False), ("keyed diff", True)):
+        calls, seconds, held = measure(item_count, keyed)
+        print(f"{label:14} {calls:9.1f} {seconds * 1e6:8.1f} us {held:10}")
+    print("(per operation)")
+
+
+if __name__ == "__main__":
+    main()
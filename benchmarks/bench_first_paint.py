@@ -0,0 +1,67 @@
+"""
+Benchmark: time from creating the main window to its first paint.
+
+Tabs are built when they are first shown, so the first paint only pays
+for the Character tab. With --eager every tab is built before the first
+paint, as MainWindow did before tabs were built lazily; run both to
+compare. Each run is a fresh process, so both pay the same imports.
+
+Needs a display (or Xvfb). Runs with a temporary home directory, so no
+crash journal of a real session is offered for recovery.
+
+Usage: python benchmarks/bench_first_paint.py [--eager]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Point the save directory at an empty home before the application modules read it
+os.environ["HOME"] = tempfile.mkdtemp(prefix="ryuutama-bench-")
+
+from views.main_window import MainWindow
+
+
+def main():
+    eager = "--eager" in sys.argv[1:]
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Error: this benchmark needs a display ({e})")
+        return 1
+
+    start = time.perf_counter()
+    window = MainWindow(root)
+    if eager:
+        for page in window.notebook.tabs():
+            window._build_tab(str(page))
+    constructed = time.perf_counter()
+    root.update()
+    first_paint = time.perf_counter()
+
+    # Show the other tabs, building the ones that are not built yet
+    tab_times = []
+    for page in window.notebook.tabs()[1:]:
+        tab_start = time.perf_counter()
+        window.notebook.select(page)
+        root.update()
+        tab_times.append((window.notebook.tab(page, "text"), time.perf_counter() - tab_start))
+
+    mode = "eager" if eager else "lazy"
+    print(f"MainWindow constructed:   {(constructed - start) * 1000:7.1f} ms ({mode} tabs)")
+    print(f"first paint:              {(first_paint - start) * 1000:7.1f} ms")
+    for title, seconds in tab_times:
+        print(f"  first show of {title + ':':12} {seconds * 1000:7.1f} ms")
+
+    window.app_controller.file_controller.save_worker.stop()
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
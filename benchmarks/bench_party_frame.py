@@ -0,0 +1,60 @@
+"""
+Benchmark: derived stats for a roster, per character vs PartyFrame.
+
+Usage: python benchmarks/bench_party_frame.py [roster_size]
+"""
+
+import sys
+import time
+
+from sample_characters import make_character
+
+from models.party_frame import PartyFrame
+
+ROUNDS = 50
+
+
+def per_character(characters):
+    """Derived values computed one Character at a time"""
+    return [
+        (character.calculate_initiative(),
+         character.get_traveling_check_bonus("movement"),
+         character.get_traveling_check_bonus("direction"),
+         character.get_traveling_check_bonus("camp"),
+         character.str["value"] * 2,
+         character.spi["value"] * 2)
+        for character in characters
+    ]
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    characters = [make_character(i) for i in range(size)]
+    frame = PartyFrame(characters)
+
+    loop = timed(lambda: per_character(characters))
+    build = timed(lambda: PartyFrame(characters))
+    compute = timed(frame.compute)
+    write_back = timed(frame.write_back)
+
+    # Same answers both ways
+    derived = frame.compute()
+    expected = per_character(characters)
+    assert derived["movement"].tolist() == [row[1] for row in expected]
+
+    print(f"{size} characters")
+    print(f"  per-character loop:      {loop * 1000:8.3f} ms")
+    print(f"  PartyFrame build:        {build * 1000:8.3f} ms")
+    print(f"  PartyFrame compute:      {compute * 1000:8.3f} ms")
+    print(f"  PartyFrame write_back:   {write_back * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
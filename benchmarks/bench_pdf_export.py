@@ -0,0 +1,55 @@
+"""
+Benchmark: per-sheet PDF export time for a single character and a party.
+
+Each sheet gets a fresh PDFExporter, the way FileController.export_to_pdf
+uses it. CPU time is measured and the best of a few rounds is reported,
+since wall-clock times on a busy machine vary more than the difference
+being measured.
+
+Usage: python benchmarks/bench_pdf_export.py [party_size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from sample_characters import make_character, NOTES
+
+from utils.pdf_exporter import PDFExporter
+
+
+ROUNDS = 3
+
+
+def export_all(characters, output_dir):
+    """Export every character; returns the per-sheet CPU times in seconds"""
+    times = []
+    for index, character in enumerate(characters):
+        start = time.process_time()
+        ok = PDFExporter().export_character(character, os.path.join(output_dir, f"c{index}.pdf"))
+        times.append(time.process_time() - start)
+        if not ok:
+            raise RuntimeError(f"Export of {character.name} failed")
+    return times
+
+
+def main():
+    party_size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    characters = [make_character(i) for i in range(party_size)]
+    for character in characters:
+        # Keep the notes short enough for every exporter version to lay out
+        character.notes = NOTES * 3
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        # The first export in a process also pays for font and module setup
+        first = export_all(characters[:1], output_dir)[0] * 1000
+        print(f"first sheet in process: {first:7.1f} ms")
+
+        for count in (1, party_size):
+            best = min(sum(export_all(characters[:count], output_dir)) for _ in range(ROUNDS))
+            print(f"{count:4d} sheet(s): {best / count * 1000:6.2f} ms/sheet, total {best:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: saves and memory of rulebook equipment, with descriptions
+copied into every item versus referring to the rulebook catalog.
+
+Usage: python benchmarks/bench_rulebook_catalog.py [character_count]
+"""
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+
+from sample_characters import make_character
+
+from models.character import Character
+from models.rulebook import get_catalog
+from utils import binary_format
+
+
+def outfit(index, copy_descriptions):
+    """A character with rulebook equipment only"""
+    catalog = get_catalog()
+    rng = random.Random(index)
+    character = make_character(index)
+    items = catalog.query(kind="item")
+
+    equipment = [rng.choice(catalog.query(kind="weapon"))]
+    equipment += [rng.choice(items) for _ in range(rng.randint(3, 30))]
+    created = [entry.create() for entry in equipment]
+    shield = catalog.query(kind="shield")[0].create()
+    armor = catalog.query(kind="armor")[1].create()
+    if copy_descriptions:
+        # How bought equipment was stored before the catalog
+        for piece in created + [shield, armor]:
+            piece.effect = piece.catalog_entry.description
+            piece.catalog_id = ""
+
+    character.weapons = created[:1]
+    character.travelers_outfit = created[1:]
+    character.shield = shield
+    character.armor = armor
+    return character
+
+
+def measure(count, copy_descriptions):
+    dicts = [outfit(i, copy_descriptions).to_dict() for i in range(count)]
+    json_size = sum(len(json.dumps(d)) for d in dicts)
+    binary_size = sum(len(binary_format.dumps(d)) for d in dicts)
+
+    # Memory held after loading the saves, including the strings parsed from them
+    saves = [json.dumps(d) for d in dicts]
+    del dicts
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    characters = [Character.from_dict(json.loads(save)) for save in saves]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del characters
+    return json_size / count, binary_size / count, (after - before) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    get_catalog()
+    print(f"{count} characters with rulebook equipment (per character)")
+    print(f"{'':22} {'JSON':>10} {'binary':>10} {'memory':>10}")
+    for label, copy_descriptions in (("copied descriptions", True), ("catalog references", False)):
+        json_size, binary_size, memory = measure(count, copy_descriptions)
+        print(f"{label:22} {json_size:9.0f}B {binary_size:9.0f}B {memory:9.0f}B")
+
+
+if __name__ == "__main__":
+    main()
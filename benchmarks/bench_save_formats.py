@@ -0,0 +1,77 @@
+"""
+Benchmark: JSON vs binary (*.ryu) save formats on a large library.
+
+Loads include building the Character with the schema loader. Each step
+runs three times and the fastest run is shown.
+
+Usage: python benchmarks/bench_save_formats.py [character_count]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from sample_characters import make_character
+
+from models.character import Character
+from utils import binary_format, save_header
+
+
+def bench(label, count, func, repeats=3):
+    """Run func a few times and print the best per-character time"""
+    elapsed = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms total  {elapsed / count * 1e6:8.1f} us/character")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    characters = [make_character(i) for i in range(count)]
+    dicts = [c.to_dict() for c in characters]
+
+    with tempfile.TemporaryDirectory() as library:
+        json_paths = [os.path.join(library, f"c{i}.json") for i in range(count)]
+        binary_paths = [os.path.join(library, f"c{i}.ryu") for i in range(count)]
+
+        def save_json():
+            for d, path in zip(dicts, json_paths):
+                with open(path, "wb") as f:
+                    f.write(save_header.dumps_character(d).encode("utf-8"))
+
+        def save_binary():
+            for d, path in zip(dicts, binary_paths):
+                with open(path, "wb") as f:
+                    f.write(binary_format.dumps(d))
+
+        def load_json():
+            for path in json_paths:
+                with open(path, "r", encoding="utf-8") as f:
+                    Character.from_dict(save_header.strip_header(json.load(f)))
+
+        def load_binary():
+            for path in binary_paths:
+                with open(path, "rb") as f:
+                    Character.from_dict(binary_format.loads(f.read()))
+
+        print(f"{count} characters")
+        json_save = bench("save JSON", count, save_json)
+        binary_save = bench("save binary", count, save_binary)
+        json_load = bench("load JSON", count, load_json)
+        binary_load = bench("load binary", count, load_binary)
+        bench("preview JSON (header line)", count, lambda: [save_header.read_header(p) for p in json_paths])
+        bench("preview binary", count, lambda: [binary_format.read_preview(p) for p in binary_paths])
+
+        json_size = sum(os.path.getsize(p) for p in json_paths)
+        binary_size = sum(os.path.getsize(p) for p in binary_paths)
+        print(f"  library size: JSON {json_size / 1024:.0f} KiB, binary {binary_size / 1024:.0f} KiB")
+        print(f"  binary vs JSON time: save x{binary_save / json_save:.2f}, load x{binary_load / json_load:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark: building the rulebook search index and searching it per keystroke.
+
+Usage: python benchmarks/bench_search.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.search_index import SearchIndex
+
+QUERIES = ("h", "he", "her", "herb", "r", "ra", "rai", "rain", "rain b", "rain boots", "poison", "mp")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = os.path.join(directory, "search_index.json")
+
+        start = time.perf_counter()
+        SearchIndex(cache_path)
+        print(f"build index:        {(time.perf_counter() - start) * 1000:7.2f} ms")
+
+        start = time.perf_counter()
+        index = SearchIndex(cache_path)
+        print(f"load cached index:  {(time.perf_counter() - start) * 1000:7.2f} ms "
+              f"({len(index.documents)} documents, {len(index.words)} words)")
+
+    repeats = 1000
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            results = index.search(query)
+        elapsed = (time.perf_counter() - start) / repeats
+        print(f"{query!r:14} {elapsed * 1e6:8.1f} us  {len(results):3} results")
+
+
+if __name__ == "__main__":
+    main()
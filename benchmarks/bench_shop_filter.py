@@ -0,0 +1,138 @@
+"""
+Benchmark: Treeview calls for a round of shopping in the rulebook.
+
+Before: each Buy button built a new dialog and inserted the rows of its
+kind, and every item category chosen deleted the list and inserted that
+category's rows. There was no search, so finding an item meant browsing
+the item categories. After: one shop window holds a row for every entry
+and filters, sorts and greys out rows in place (views/shop_dialog.py);
+the same round also sorts twice and types a search word letter by letter.
+
+Runs without a display: the Treeview is replaced by a stand-in that keeps
+the rows and counts the calls, so the numbers count Tk calls, not the
+time Tk spends drawing.
+
+Usage: python benchmarks/bench_shop_filter.py [rounds]
+"""
+
+import sys
+import time
+
+from sample_characters import make_character  # noqa: F401 (sets up the import path)
+
+from models.rulebook import get_catalog
+from views.shop_dialog import ShopRows, ALL_ITEMS
+
+
+class FakeTree:
+    """Attached rows and call counts of a ttk.Treeview"""
+
+    def __init__(self):
+        self.rows = []  # attached iids in order
+        self.values = {}
+        self.calls = 0
+
+    def tag_configure(self, tag, **options):
+        self.calls += 1
+
+    def get_children(self):
+        self.calls += 1
+        return tuple(self.rows)
+
+    def insert(self, parent, index, iid, values):
+        self.calls += 1
+        self.values[iid] = values
+        self.rows.insert(len(self.rows) if index == "end" else index, iid)
+
+    def delete(self, *iids):
+        self.calls += 1
+        for iid in iids:
+            self.rows.remove(iid)
+            del self.values[iid]
+
+    def set_children(self, item, *iids):
+        self.calls += 1
+        self.rows = list(iids)
+
+    def item(self, iid, **options):
+        self.calls += 1
+
+
+def typed(text):
+    """Search field contents while text is typed"""
+    return [text[:length] for length in range(1, len(text) + 1)]
+
+
+def round_before(tree, catalog):
+    """Buy a weapon, a shield and armor, then browse the item categories"""
+    for kind in ("weapon", "shield", "armor"):
+        tree.rows, tree.values = [], {}  # A new dialog
+        for entry in catalog.query(kind=kind):
+            tree.insert("", "end", iid=entry.id, values=(entry.name, entry.price, entry.size))
+    tree.rows, tree.values = [], {}
+    for category in catalog.categories("item"):
+        for iid in tree.get_children():
+            tree.delete(iid)
+        for entry in catalog.query(kind="item", category=category):
+            tree.insert("", "end", iid=entry.id, values=(entry.name, entry.price, entry.size))
+
+
+def round_after(rows, catalog, gold):
+    """The same purchases in the shop, finding the item by typing its name"""
+    for category in ("Weapons", "Shields", "Armor"):
+        rows.set_gold(gold)
+        rows.filter(category, "")
+        gold -= 10
+    rows.set_gold(gold)
+    rows.filter(ALL_ITEMS, "")
+    for category in catalog.categories("item"):
+        rows.filter(category)
+    rows.sort_by("price")
+    for query in typed("rain boots"):
+        rows.filter(ALL_ITEMS, query)
+    rows.sort_by("name")
+
+
+def check(rows, catalog):
+    """The attached rows are the filtered entries in sort order"""
+    words = rows.query.lower().split()
+    expected = [entry_id for entry_id in rows._order()
+                if entry_id in rows.categories[rows.category]
+                and all(any(word.startswith(prefix) for word in rows._words[entry_id]) for prefix in words)]
+    assert rows.tree.rows == rows.shown == expected, (rows.tree.rows, expected)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    catalog = get_catalog()
+
+    tree = FakeTree()
+    for _ in range(rounds):
+        round_before(tree, catalog)
+    before_calls = tree.calls
+
+    tree = FakeTree()
+    rows = ShopRows(tree, catalog)
+    build_calls = tree.calls
+    for index in range(rounds):
+        round_after(rows, catalog, 200 + 150 * index)
+        check(rows, catalog)
+    after_calls = tree.calls - build_calls
+
+    # Python time of filtering per keystroke, searching every category
+    keystrokes = typed("rain boots") * rounds
+    start = time.perf_counter()
+    for query in keystrokes:
+        rows.filter("All", query)
+    per_keystroke = (time.perf_counter() - start) / len(keystrokes)
+
+    print(f"{rounds} rounds of shopping in a rulebook of {len(catalog.entries)} entries")
+    print(f"{'':20} {'Tk calls':>10} {'per round':>10}")
+    print(f"{'dialog per kind':20} {before_calls:10} {before_calls / rounds:10.1f}")
+    print(f"{'persistent shop':20} {after_calls:10} {after_calls / rounds:10.1f}")
+    print(f"(plus {build_calls} calls to build the shop's rows, paid once)")
+    print(f"search as you type: {per_keystroke * 1e6:.1f} us per keystroke")
+
+
+if __name__ == "__main__":
+    main()
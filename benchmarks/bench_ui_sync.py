@@ -0,0 +1,124 @@
+"""
+Benchmark: time spent in key handlers while typing into the notes field.
+
+Before: every key release copied all fields of the tab into the character
+and recorded an unsaved change (journal entry and window title). After:
+a key release marks the field dirty and the sync timer copies and records
+the whole burst at once.
+
+Runs without a display: the widgets are replaced by plain values, so the
+Tk cost of reading a large Text widget is not included.
+
+Usage: python benchmarks/bench_ui_sync.py [keystrokes]
+"""
+
+import sys
+import tempfile
+import time
+
+from sample_characters import make_character
+
+from controllers.app_controller import AppController
+from controllers.ui_sync import SYNC_DELAY_MS
+
+# Typing speed: about 8 keys per second
+KEY_INTERVAL_MS = 120
+
+FIELDS = ("name", "player_name", "gender", "age", "character_class", "type", "class_skill", "stats_used",
+          "effect", "mastered_weapon", "specialized_terrain", "personal_item", "appearance", "hometown",
+          "reason_for_travel", "notes")
+
+
+class FakeRoot:
+    """Just enough of a Tk root for AppController and UISync, with a simulated clock"""
+
+    def __init__(self):
+        self.now_ms = 0
+        self.timers = {}  # id -> (due time, callback)
+        self.next_id = 0
+        self.title_calls = 0
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        self.timers[self.next_id] = (self.now_ms + delay_ms, callback)
+        return self.next_id
+
+    def after_cancel(self, timer_id):
+        self.timers.pop(timer_id, None)
+
+    def advance(self, ms):
+        """Let ms pass and run the timers that became due"""
+        self.now_ms += ms
+        due = sorted((when, timer_id) for timer_id, (when, _) in self.timers.items() if when <= self.now_ms)
+        for when, timer_id in due:
+            self.timers.pop(timer_id)[1]()
+
+    def title(self, text):
+        self.title_calls += 1
+
+
+def setup(save_dir):
+    root = FakeRoot()
+    app_controller = AppController(root)
+    app_controller.file_controller.default_save_dir = save_dir
+    app_controller.character = make_character(1)
+    app_controller._reset_journal()
+    widgets = {field: getattr(app_controller.character, field) for field in FIELDS}
+    return root, app_controller, widgets
+
+
+def type_before(keystrokes, save_dir):
+    """Copy every field and record a change on each key release"""
+    root, app_controller, widgets = setup(save_dir)
+    handler_seconds = timer_seconds = 0.0
+    for index in range(keystrokes):
+        widgets["notes"] += "abcdefghij"[index % 10]
+        start = time.perf_counter()
+        character = app_controller.character
+        for field in FIELDS:
+            setattr(character, field, widgets[field])
+        app_controller.mark_unsaved_changes(*FIELDS)
+        handler_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        root.advance(KEY_INTERVAL_MS)
+        timer_seconds += time.perf_counter() - start
+    app_controller.discard_journal()
+    return handler_seconds, timer_seconds, root.title_calls
+
+
+def type_after(keystrokes, save_dir):
+    """Mark the notes field dirty on each key release; the sync timer does the rest"""
+    root, app_controller, widgets = setup(save_dir)
+    ui_sync = app_controller.ui_sync
+    timer_seconds = 0.0
+    for index in range(keystrokes):
+        widgets["notes"] += "abcdefghij"[index % 10]
+        ui_sync.mark("notes", lambda character: setattr(character, "notes", widgets["notes"]))
+
+        start = time.perf_counter()
+        root.advance(KEY_INTERVAL_MS)
+        timer_seconds += time.perf_counter() - start
+    root.advance(SYNC_DELAY_MS)
+    assert app_controller.character.notes == widgets["notes"]
+    app_controller.discard_journal()
+    # UISync tracks its own handler time
+    return ui_sync.handler_seconds, timer_seconds, root.title_calls
+
+
+def main():
+    keystrokes = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        results = {"before": type_before(keystrokes, save_dir), "after": type_after(keystrokes, save_dir)}
+
+    print(f"{keystrokes} keystrokes into the notes of a large character, one every {KEY_INTERVAL_MS} ms")
+    print(f"{'':8} {'key handler':>12} {'timers':>12} {'title sets':>11}")
+    for label, (handler_seconds, timer_seconds, title_calls) in results.items():
+        print(f"{label:8} {handler_seconds / keystrokes * 1e6:9.1f} us {timer_seconds / keystrokes * 1e6:9.1f} us "
+              f"{title_calls:11}")
+    print("(per keystroke; timers are the sync flushes and journal fsyncs run later by the event loop)")
+
+
+if __name__ == "__main__":
+    main()
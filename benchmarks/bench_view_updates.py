@@ -0,0 +1,165 @@
+"""
+Benchmark: widgets written when switching characters, buying an item and
+rolling a condition check.
+
+The baseline refreshes every field of every tab after each operation, as
+AppController._update_ui did whenever a character was loaded. With field
+events the tabs subscribe to the character fields they render and only
+the fields that changed are shown again; unchanged widgets are not written.
+Equipment is always shown again when the character is replaced, even by
+an identical copy ("reload same"), because the Treeview rows are keyed
+by the uids of the previous character's equipment objects.
+
+Runs without a display: each tab is replaced by one Tcl variable per field
+it renders (Treeview lists write one row per entry), so the numbers count
+widgets, not the Tk time of redrawing them.
+
+Usage: python benchmarks/bench_view_updates.py [repeats]
+"""
+
+import copy
+import random
+import sys
+import time
+import tkinter as tk
+
+from sample_characters import make_character
+
+from controllers.app_controller import AppController
+from controllers.view_updates import update_var
+from models.rulebook import get_catalog
+
+# Character fields rendered by each tab (see the field_views of the views)
+TAB_FIELDS = {
+    "character_tab": ("name", "player_name", "level", "exp", "gender", "age", "character_class", "type",
+                      "class_skill", "stats_used", "effect", "mastered_weapon", "specialized_terrain",
+                      "personal_item", "portrait_id", "appearance", "hometown", "reason_for_travel", "notes"),
+    "stats_tab": ("str", "dex", "int", "spi", "hp", "mp", "initiative", "fumble_points", "condition_checks",
+                  "abilities"),
+    "equipment_tab": ("gold", "weapons", "shield", "armor", "travelers_outfit"),
+    "travel_tab": ("current_terrain", "current_weather"),
+    "conditions_tab": ("status_effects", "condition_checks", "str", "dex", "int", "spi"),
+}
+
+
+class VariableTab:
+    """Stand-in for a tab: one variable per field, one row per list entry"""
+
+    def __init__(self, interpreter, fields, subscribe):
+        self.variables = {field: tk.StringVar(interpreter) for field in fields}
+        if subscribe:
+            self.field_views = {field: self._show for field in fields}
+
+    def _show(self, field, value):
+        if isinstance(value, list):
+            # Treeviews are rebuilt row by row
+            for row in value:
+                self.variables[field].set(repr(row))
+            return len(value)
+        return update_var(self.variables[field], repr(value))
+
+    def update_from_character(self, character):
+        """Full refresh, as every tab did before"""
+        for field, variable in self.variables.items():
+            value = getattr(character, field)
+            if isinstance(value, list):
+                for row in value:
+                    variable.set(repr(row))
+                self.written += len(value)
+            else:
+                variable.set(repr(value))
+                self.written += 1
+
+
+def setup(subscribe):
+    interpreter = tk.Tcl()
+    app_controller = AppController(None)
+    app_controller.character = make_character(0)
+    tabs = [VariableTab(interpreter, fields, subscribe) for fields in TAB_FIELDS.values()]
+    for element_id, tab in zip(TAB_FIELDS, tabs):
+        tab.written = 0
+        app_controller.register_ui_element(element_id, tab)
+    return app_controller, tabs
+
+
+def operations(app_controller):
+    """(label, function) of the measured operations"""
+    catalog = get_catalog()
+    items = catalog.query(kind="item")
+    rng = random.Random(1)
+    characters = [make_character(index) for index in range(1, 4)]
+
+    def switch():
+        # Like AppController.load_character after the file was read
+        app_controller._replace_character(copy.deepcopy(rng.choice(characters)), "load")
+
+    def reload():
+        app_controller._replace_character(copy.deepcopy(app_controller.character), "load")
+
+    def buy():
+        character = app_controller.character
+        entry = rng.choice(items)
+        character.gold -= entry.price
+        character.travelers_outfit.append(entry.create())
+        app_controller.notify_changed("buy item", "gold", "travelers_outfit")
+
+    def roll():
+        character = app_controller.character
+        character.condition_checks["str"] = rng.randint(2, 20)
+        character.status_effects["injury"] = False
+        app_controller.notify_changed("condition roll", "condition_checks", "status_effects")
+
+    return [("load another", switch), ("reload same", reload), ("buy item", buy), ("condition roll", roll)]
+
+
+def measure_before(repeats):
+    """Full refresh of every tab after each operation"""
+    app_controller, tabs = setup(subscribe=False)
+    results = {}
+    for label, operation in operations(app_controller):
+        written = 0
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for tab in tabs:
+                tab.written = 0
+            operation()
+            app_controller._update_ui()
+            written += sum(tab.written for tab in tabs)
+        results[label] = (written / repeats, (time.perf_counter() - start) / repeats)
+    return results
+
+
+def measure_after(repeats):
+    """Field events: only the views of changed fields run"""
+    app_controller, tabs = setup(subscribe=True)
+    results = {}
+    for label, operation in operations(app_controller):
+        written = 0
+        start = time.perf_counter()
+        for _ in range(repeats):
+            operation()
+            written += app_controller.view_updates.widgets
+        results[label] = (written / repeats, (time.perf_counter() - start) / repeats)
+    return app_controller, results
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    before = measure_before(repeats)
+    app_controller, after = measure_after(repeats)
+
+    print(f"Widgets written per operation ({repeats} runs each; times include the model change)")
+    print(f"{'':16} {'full refresh':>22} {'field events':>22}")
+    for label in before:
+        (before_widgets, before_seconds), (after_widgets, after_seconds) = before[label], after[label]
+        print(f"{label:16} {before_widgets:9.1f} {before_seconds * 1e6:9.1f} us "
+              f"{after_widgets:9.1f} {after_seconds * 1e6:9.1f} us")
+    print()
+    print("ViewUpdates report:")
+    for line in app_controller.view_updates.report():
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Ryuutama Character Sheet - Benchmark Data
+Builds realistic characters for the benchmark scripts
+"""
+
+import os
+import random
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.character import Character
+from models.equipment import Weapon, Shield, Armor, Item
+from utils.class_skills_data import CLASS_SKILLS
+
+CLASSES = list(CLASS_SKILLS)
+TYPES = ["Attack", "Technical", "Magic"]
+DIE_SIZES = ["d4", "d6", "d8", "d10", "d12"]
+NOTES = ("The caravan stopped at the river crossing while the rain kept falling. "
+         "Our minstrel wrote another verse about the dragon we never saw. ")
+
+
+def make_character(index, seed=0):
+    """Create a filled-in character; the same index and seed always give the same character"""
+    rng = random.Random(seed * 100003 + index)
+    character = Character()
+    character.name = f"Traveler {index}"
+    character.player_name = f"Player {index % 7}"
+    character.level = rng.randint(1, 10)
+    character.exp = rng.randint(0, 5000)
+    character.character_class = rng.choice(CLASSES)
+    character.type = rng.choice(TYPES)
+    character.gold = rng.randint(0, 5000)
+    character.class_skill = ", ".join(CLASS_SKILLS[character.character_class]["skills"])
+    character.effect = "+1 to Journey Checks"
+    character.hometown = "Riverside"
+    character.reason_for_travel = "To see the world"
+    character.notes = NOTES * rng.randint(5, 40)
+
+    for stat in ("str", "dex", "int", "spi"):
+        die_size = rng.choice(DIE_SIZES)
+        getattr(character, stat)["die_size"] = die_size
+        getattr(character, stat)["value"] = int(die_size[1:])
+    character.hp = {"max": character.str["value"] * 2, "current": character.str["value"] * 2}
+    character.mp = {"max": character.spi["value"] * 2, "current": character.spi["value"] * 2}
+
+    character.weapons = [Weapon("Blade", "A weapon with a long, flat blade.", 3, 0, 0)
+                         for _ in range(rng.randint(1, 3))]
+    character.shield = Shield("Light shield", "A shield that can be held in one hand.", 3, 1)
+    character.armor = Armor("Light Armor", "Armor constructed from the hide of animals.", 3, 1, 0)
+    character.travelers_outfit = [Item(f"Item {n}", "Portable food that can be taken on a trip", 1, 1)
+                                  for n in range(rng.randint(3, 30))]
+    character.abilities = {level: f"Level {level} ability text" for level in range(1, 6)}
+    return character
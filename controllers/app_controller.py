@@ -1,8 +1,31 @@
+import copy
 import os
+import queue
 import tkinter as tk
 from tkinter import messagebox, filedialog
 from models.character import Character
 from controllers.file_controller import FileController
+from controllers import edit_journal
+from controllers import session_cache
+from controllers.edit_journal import EditJournal
+from controllers.ui_sync import UISync
+from controllers.view_updates import ViewUpdates
+
+# File types offered by the open/save dialogs; JSON stays the default interchange format
+CHARACTER_FILETYPES = [
+    ("Ryuutama Character", "*.json"),
+    ("Ryuutama Binary Character", "*.ryu"),
+    ("All Files", "*.*")
+]
+
+CAMPAIGN_FILETYPES = [("Campaign Archive", "*.zip"), ("All Files", "*.*")]
+
+# How often the Tk thread checks for finished background saves
+SAVE_POLL_INTERVAL_MS = 50
+
+# Fields holding Equipment; their views key rows by Equipment.uid, which
+# differs between characters even when the equipment is the same
+EQUIPMENT_FIELDS = ("weapons", "travelers_outfit", "shield", "armor")
 
 
 class AppController:
@@ -13,32 +36,54 @@ class AppController:
         self.character = Character()  # Current character
         self.file_controller = FileController(self)
         self.current_file_path = None  # Path to currently loaded file
+        self._file_stamp = None  # Stamp of the loaded file while the character matches it (session cache)
         self.unsaved_changes = False  # Flag for tracking unsaved changes
+        self._change_generation = 0  # Bumped on every edit, used to match saves to edits
+        self._saves_in_flight = 0  # Saves handed to the writer thread but not yet finished
+        self._save_poll_scheduled = False
+        self._window_title = None  # Last title set, to skip redundant updates
+
+        # Edited widgets are copied into the character in batches
+        self.ui_sync = UISync(self)
+
+        # Crash recovery: edits are journaled next to the open save until it is saved again
+        self.journal = None
+        self._journal_baseline = None  # Character state the journal starts from
+        self._edited_fields = set()  # Fields changed (see notify_changed) since the last journal record
+        self._journal_sync_scheduled = False
+        self._reset_journal()
 
         # References to UI elements that need updating
         self.ui_elements = {}
 
+        # Widgets refreshed by each operation, for profiling
+        self.view_updates = ViewUpdates()
+
     def new_character(self):
         """Create a new blank character"""
+        self.ui_sync.flush()
         if self.unsaved_changes:
             if not self._confirm_discard_changes():
                 return False
 
-        self.character = Character()
+        self.ui_sync.discard()
+        self._replace_character(Character(), "new")
         self.current_file_path = None
+        self._file_stamp = None
         self.unsaved_changes = False
-        self._update_ui()
+        self._reset_journal()
         self._update_window_title()
         return True
 
     def save_character(self, save_as=False):
         """Save the current character"""
+        self.ui_sync.flush()
         if self.current_file_path is None or save_as:
             initial_dir = self.file_controller.default_save_dir
             filename = f"{self.character.name or 'unnamed'}.json"
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".json",
-                filetypes=[("Ryuutama Character", "*.json"), ("All Files", "*.*")],
+                filetypes=CHARACTER_FILETYPES,
                 initialdir=initial_dir,
                 initialfile=filename
             )
@@ -46,18 +91,68 @@ class AppController:
                 return False
             self.current_file_path = file_path
 
-        success = self.file_controller.save_character(self.character, self.current_file_path)
-        if success:
-            self.unsaved_changes = False
-            self._update_window_title()
-            messagebox.showinfo("Save Complete", "Character saved successfully.")
-            return True
+        # Serialize and write on the writer thread; completion comes back via _poll_save_results
+        self.file_controller.save_character_async(self.character, self.current_file_path, self._change_generation)
+        self._saves_in_flight += 1
+        self._update_window_title()
+
+        if self.root:
+            self._schedule_save_poll()
         else:
-            messagebox.showerror("Save Error", "Failed to save character.")
-            return False
+            self.finish_pending_saves()
+        return True
+
+    def finish_pending_saves(self):
+        """Wait for queued saves to be written and apply their results (e.g. before exit)"""
+        self.file_controller.save_worker.flush()
+        self._process_save_results()
+
+    def _schedule_save_poll(self):
+        """Check for finished saves on the Tk thread"""
+        if not self._save_poll_scheduled:
+            self._save_poll_scheduled = True
+            self.root.after(SAVE_POLL_INTERVAL_MS, self._poll_save_results)
+
+    def _poll_save_results(self):
+        """Timer callback while saves are in flight"""
+        self._save_poll_scheduled = False
+        self._process_save_results()
+        if self._saves_in_flight > 0:
+            self._schedule_save_poll()
+
+    def _process_save_results(self):
+        """Apply the results of completed background saves"""
+        results = self.file_controller.save_worker.results
+        while True:
+            try:
+                file_path, error, generations = results.get_nowait()
+            except queue.Empty:
+                break
+
+            # Coalesced saves are reported together
+            self._saves_in_flight -= len(generations)
+            if error is not None:
+                messagebox.showerror("Save Error", f"Failed to save character.\n\n{error}")
+                continue
+
+            self.file_controller.finish_save(file_path)
+            if file_path != self.current_file_path:
+                continue
+
+            # Only clear the flag if nothing was edited after the snapshot was taken
+            if max(generations) == self._change_generation:
+                self.unsaved_changes = False
+                self._file_stamp = session_cache.file_stamp(file_path)
+                self._reset_journal()
+            else:
+                # The save no longer matches the journal's base; keep the edits as a snapshot
+                self._rebase_journal()
+
+        self._update_window_title()
 
     def load_character(self, file_path=None):
         """Load a character"""
+        self.ui_sync.flush()
         if self.unsaved_changes:
             if not self._confirm_discard_changes():
                 return False
@@ -66,7 +161,7 @@ class AppController:
             initial_dir = self.file_controller.default_save_dir
             file_path = filedialog.askopenfilename(
                 defaultextension=".json",
-                filetypes=[("Ryuutama Character", "*.json"), ("All Files", "*.*")],
+                filetypes=CHARACTER_FILETYPES,
                 initialdir=initial_dir
             )
             if not file_path:  # User cancelled
@@ -74,10 +169,12 @@ class AppController:
 
         loaded_character = self.file_controller.load_character(file_path)
         if loaded_character:
-            self.character = loaded_character
+            self.ui_sync.discard()
+            self._replace_character(loaded_character, "load")
             self.current_file_path = file_path
+            self._file_stamp = session_cache.file_stamp(file_path)
             self.unsaved_changes = False
-            self._update_ui()
+            self._reset_journal()
             self._update_window_title()
             return True
         else:
@@ -86,6 +183,7 @@ class AppController:
 
     def export_to_pdf(self):
         """Export the current character to PDF"""
+        self.ui_sync.flush()
         # If character has no name, prompt to save first
         if not self.character.name:
             messagebox.showwarning(
@@ -119,28 +217,311 @@ class AppController:
             messagebox.showerror("Export Error", "Failed to export character to PDF.")
             return False
 
-    def mark_unsaved_changes(self):
-        """Mark that there are unsaved changes"""
+    def export_campaign(self):
+        """Export every character in the library to a campaign archive"""
+        from utils.campaign_archive import export_campaign
+        from views.progress_dialog import ProgressDialog
+
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".zip",
+            filetypes=CAMPAIGN_FILETYPES,
+            initialfile="campaign.zip"
+        )
+        if not file_path:  # User cancelled
+            return False
+
+        progress = ProgressDialog(self.root, "Exporting Campaign")
+        try:
+            character_count, portrait_count = export_campaign(self.file_controller, file_path, progress.update)
+        except Exception as e:
+            print(f"Error exporting campaign: {e}")
+            progress.close()
+            messagebox.showerror("Export Error", f"Failed to export campaign.\n\n{e}")
+            return False
+        progress.close()
+
+        messagebox.showinfo(
+            "Export Complete",
+            f"Exported {character_count} characters and {portrait_count} portraits.\n\nSaved to: {file_path}"
+        )
+        return True
+
+    def import_campaign(self):
+        """Import the characters of a campaign archive into the library"""
+        from utils.campaign_archive import import_campaign
+        from views.progress_dialog import ProgressDialog
+
+        file_path = filedialog.askopenfilename(filetypes=CAMPAIGN_FILETYPES)
+        if not file_path:  # User cancelled
+            return False
+
+        progress = ProgressDialog(self.root, "Importing Campaign")
+        try:
+            imported, skipped, errors = import_campaign(self.file_controller, file_path, progress.update)
+        except Exception as e:
+            print(f"Error importing campaign: {e}")
+            progress.close()
+            messagebox.showerror("Import Error", f"Failed to import campaign.\n\n{e}")
+            return False
+        progress.close()
+
+        message = f"Imported {imported} files, skipped {skipped} already in the library."
+        if errors:
+            details = "\n".join(f"{entry}: {error}" for entry, error in errors[:10])
+            more = f"\n...and {len(errors) - 10} more" if len(errors) > 10 else ""
+            messagebox.showwarning("Import Complete", f"{message}\n\n{len(errors)} entries were rejected:\n{details}{more}")
+        else:
+            messagebox.showinfo("Import Complete", message)
+        return True
+
+    def mark_unsaved_changes(self, *fields):
+        """
+        Mark that there are unsaved changes. fields are the character fields
+        the change edited, besides those announced with notify_changed() and
+        those edited through ui_sync.
+        """
+        # Fields edited since the last flush are part of this change
+        fields = self._edited_fields.union(fields, self.ui_sync.apply_pending())
+        self._edited_fields = set()
         self.unsaved_changes = True
+        self._change_generation += 1
+        self._journal_edit(fields)
         self._update_window_title()
 
+    def _journal_edit(self, fields):
+        """Append the fields changed by the latest edit to the journal"""
+        try:
+            if self.journal is None:
+                self.journal = EditJournal.for_save(self.file_controller.default_save_dir, self.current_file_path)
+                self.journal.start(self.current_file_path, self._journal_baseline,
+                                   snapshot=self.current_file_path is None)
+            self.journal.record({field: self.character.field_to_dict(field) for field in fields})
+            if self.journal.needs_compaction:
+                self.journal.compact(self.character.to_dict())
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error writing edit journal: {e}")
+            return
+
+        # Make sure the last records of a burst of edits reach the disk too
+        if self.root and self.journal.needs_sync and not self._journal_sync_scheduled:
+            self._journal_sync_scheduled = True
+            self.root.after(int(edit_journal.FSYNC_INTERVAL * 1000), self._sync_journal)
+
+    def _sync_journal(self):
+        """Timer callback: fsync journal records written since the last sync"""
+        self._journal_sync_scheduled = False
+        if self.journal is not None:
+            try:
+                self.journal.sync()
+            except OSError as e:
+                print(f"Error writing edit journal: {e}")
+
+    def _reset_journal(self):
+        """Drop the journal; the current character becomes the new baseline"""
+        if self.journal is not None:
+            self.journal.discard()
+            self.journal = None
+        self._edited_fields = set()
+        # Deep copy, since stat and HP dictionaries are edited in place
+        self._journal_baseline = copy.deepcopy(self.character.to_dict())
+
+    def _rebase_journal(self):
+        """Restart the journal from a snapshot of the current character"""
+        self._reset_journal()
+        try:
+            self.journal = EditJournal.for_save(self.file_controller.default_save_dir, self.current_file_path)
+            self.journal.start(self.current_file_path, self._journal_baseline, snapshot=True)
+        except OSError as e:
+            print(f"Error writing edit journal: {e}")
+            self.journal = None
+
+    def discard_journal(self):
+        """Delete the journal, e.g. when the user exits without saving"""
+        if self.journal is not None:
+            self.journal.discard()
+            self.journal = None
+
+    def recover_from_journal(self):
+        """Offer to restore edits journaled by a session that did not exit cleanly"""
+        save_dir = self.file_controller.default_save_dir
+        recovery = edit_journal.find_recovery(save_dir)
+        if recovery is None:
+            return False
+
+        journal_path, _ = recovery
+        found = EditJournal(journal_path, os.path.join(save_dir, edit_journal.RECOVERY_POINTER))
+        try:
+            character_dict, base_path, record_count = edit_journal.replay(
+                journal_path, self.file_controller.read_character_dict
+            )
+            character = Character.from_dict(character_dict)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"Error replaying edit journal: {e}")
+            messagebox.showwarning(
+                "Recovery Failed",
+                f"Unsaved changes from the last session could not be restored.\n\n{e}"
+            )
+            found.discard()
+            return False
+
+        name = character.name or "Unnamed Character"
+        if not messagebox.askyesno(
+            "Recover Unsaved Changes",
+            f"The last session ended with unsaved changes to {name} ({record_count} edits).\n\n"
+            "Do you want to restore them?"
+        ):
+            found.discard()
+            return False
+
+        self.ui_sync.discard()
+        self._replace_character(character, "recover")
+        self.current_file_path = base_path if base_path and os.path.exists(base_path) else None
+        self._file_stamp = None
+        # Journal the restored state before the old journal goes away
+        self._rebase_journal()
+        old_files = [found.compacted_path]
+        if self.journal is None or self.journal.journal_path != journal_path:
+            old_files.append(journal_path)
+        for path in old_files:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error removing journal file: {e}")
+        self.unsaved_changes = True
+        self._change_generation += 1
+        self._update_window_title()
+        return True
+
+    def restore_session(self):
+        """
+        Reopen the character of the last session from the session cache.
+        Returns the cached session (for its theme and tab), or None.
+        """
+        session = session_cache.read_session(self.file_controller.default_save_dir)
+        if session is None:
+            return None
+
+        file_path = session.get("file_path")
+        if not file_path or not os.path.exists(file_path):
+            return session
+
+        character = None
+        if session_cache.snapshot_is_current(session):
+            from models.schema import load_character
+            try:
+                character, errors = load_character(session["character"])
+            except (TypeError, ValueError, AttributeError) as e:
+                errors = [("", str(e))]
+            if errors:
+                print(f"Error in session cache for {file_path}; loading the save instead")
+                character = None
+            else:
+                self.file_controller.portrait_store.preload_ui_data(session.get("portrait_id"),
+                                                                     session.get("portrait_data"))
+        if character is None:
+            # The save changed since the last session (or was never cached)
+            character = self.file_controller.load_character(file_path)
+            if character is None:
+                return session
+
+        self.ui_sync.discard()
+        self._replace_character(character, "restore")
+        self.current_file_path = file_path
+        self._file_stamp = session_cache.file_stamp(file_path)
+        self.unsaved_changes = False
+        self._reset_journal()
+        self._update_window_title()
+        return session
+
+    def save_session(self, theme=None, tab=None):
+        """Write the session cache for the next launch (on exit)"""
+        file_path = self.current_file_path
+        character_dict = None
+        portrait_id = ""
+        portrait_data = None
+        # The snapshot is only valid while the character is exactly the save on disk
+        if file_path and not self.unsaved_changes and self._file_stamp is not None:
+            character_dict = self.character.to_dict()
+            portrait_id = self.character.portrait_id
+            try:
+                portrait_data = self.file_controller.portrait_store.ui_data(portrait_id)
+            except OSError as e:
+                print(f"Error reading portrait: {e}")
+        return session_cache.write_session(self.file_controller.default_save_dir, file_path, self._file_stamp,
+                                           character_dict, theme, tab, portrait_id, portrait_data)
+
     def register_ui_element(self, element_id, element_ref):
-        """Register a UI element for updates"""
+        """
+        Register a UI element for updates. Elements with field_views (field ->
+        view(field, value) returning the number of widgets it wrote) are
+        subscribed to those fields of the character and shown right away.
+        """
         self.ui_elements[element_id] = element_ref
+        for field, view in getattr(element_ref, "field_views", {}).items():
+            self.character.subscribe(field, self._counted_view(view))
+        self._refresh_element(element_ref)
 
-    def _update_ui(self):
-        """Update UI elements with current character data"""
-        for element_id, element_ref in self.ui_elements.items():
+    def _counted_view(self, view):
+        """Field observer that runs view and counts the widgets it wrote"""
+        def observer(field, value):
+            self.view_updates.count(field, view(field, value) or 0)
+        return observer
+
+    def notify_changed(self, operation, *fields):
+        """
+        Refresh the views of the given character fields after operation
+        (e.g. "buy item") changed them; they are journaled with the next
+        mark_unsaved_changes(). Returns the number of widgets written.
+        """
+        self._edited_fields.update(fields)
+        self.view_updates.begin(operation)
+        self.character.notify(*fields)
+        return self.view_updates.end()
+
+    def _replace_character(self, character, operation):
+        """
+        Make character the current one. The views keep their subscriptions
+        and only the fields that differ from the previous character are
+        shown, plus the equipment, whose rows belong to the previous objects.
+        """
+        previous, previous_dict = self.character, self.character.to_dict()
+        previous.hand_over_observers(character)
+        self.character = character
+        changed = [field for field, value in character.to_dict().items()
+                   if field != "schema_version" and field not in EQUIPMENT_FIELDS
+                   and previous_dict.get(field) != value]
+        self.notify_changed(operation, *changed, *EQUIPMENT_FIELDS)
+
+    def _refresh_element(self, element_ref):
+        """Show every field of the current character in one UI element"""
+        field_views = getattr(element_ref, "field_views", None)
+        if field_views is None:
             if hasattr(element_ref, "update_from_character"):
                 element_ref.update_from_character(self.character)
+            return
+        for field, view in field_views.items():
+            self.view_updates.count(field, view(field, getattr(self.character, field)) or 0)
+
+    def _update_ui(self):
+        """
+        Update UI elements with current character data. Tabs that are not
+        built yet are not registered; they show the character once they are.
+        """
+        for element_id, element_ref in self.ui_elements.items():
+            self._refresh_element(element_ref)
 
     def _update_window_title(self):
         """Update the window title to show character name and save status"""
         if self.root:
             character_name = self.character.name or "Unnamed Character"
             unsaved_marker = "*" if self.unsaved_changes else ""
-            title = f"Ryuutama Character Sheet - {character_name}{unsaved_marker}"
-            self.root.title(title)
+            saving_marker = " (saving...)" if self._saves_in_flight > 0 else ""
+            title = f"Ryuutama Character Sheet - {character_name}{unsaved_marker}{saving_marker}"
+            if title != self._window_title:
+                self.root.title(title)
+                self._window_title = title
 
     def _confirm_discard_changes(self):
         """Ask user to confirm discarding unsaved changes"""
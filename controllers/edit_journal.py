@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import time
+
+from utils import save_header
+from utils.atomic_file import write_atomic
+
+# The journal of a save lives next to it: "<save>.journal"
+JOURNAL_SUFFIX = ".journal"
+# Journal used while the character has never been saved
+UNTITLED_JOURNAL = ".untitled.journal"
+# Points at the active journal so it can be found after a crash
+RECOVERY_POINTER = ".recovery.json"
+# Compaction writes the character to "<journal>.base", a fresh save the journal restarts on
+COMPACTED_SUFFIX = ".base"
+
+# Appended records are fsynced in batches: after this many records...
+FSYNC_BATCH = 32
+# ...or when the oldest unsynced record is this old (seconds)
+FSYNC_INTERVAL = 1.0
+
+# Past this size the journal is compacted into a fresh save
+COMPACT_THRESHOLD = 256 * 1024
+
+
+def encode_fields(character_dict):
+    """Encode each top-level field of a (partial) character dictionary as compact JSON"""
+    return {
+        key: json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        for key, value in character_dict.items()
+    }
+
+
+def file_hash(file_path):
+    """SHA-256 of a file's content, or None if it cannot be read"""
+    try:
+        with open(file_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class EditJournal:
+    """Append-only log of field-level edits to the open character.
+
+    The first line names the file the edits apply to (and its content hash),
+    or holds a "snapshot" of the complete character; every following line
+    sets one or more top-level Character fields, as edited. Replaying the
+    records over the base restores the edited character after a crash.
+    Compaction writes the current character to a fresh save next to the
+    journal and restarts the journal on top of it, so recovery reads that
+    save and no records. The user's own save is only written by saving.
+    """
+
+    def __init__(self, journal_path, pointer_path):
+        self.journal_path = journal_path
+        self.pointer_path = pointer_path
+        self.compacted_path = journal_path + COMPACTED_SUFFIX
+        self.save_path = None
+        self._file = None
+        self._fields = {}  # field -> encoded value, as last recorded
+        self._unsynced = 0
+        self._oldest_unsynced = None
+        self.records_written = 0
+
+    @classmethod
+    def for_save(cls, save_dir, file_path):
+        """Journal for a save file (or for an unsaved character if file_path is None)"""
+        if file_path:
+            journal_path = file_path + JOURNAL_SUFFIX
+        else:
+            journal_path = os.path.join(save_dir, UNTITLED_JOURNAL)
+        return cls(journal_path, os.path.join(save_dir, RECOVERY_POINTER))
+
+    @property
+    def is_open(self):
+        """Check whether the journal is accepting records"""
+        return self._file is not None
+
+    def start(self, save_path, character_dict=None, snapshot=False, base_path=None):
+        """
+        Start a new journal for edits to the character of save_path (None for a
+        new character). The edits apply on top of base_path (the save itself
+        unless given); with snapshot=True (always for a new character)
+        character_dict is stored in full instead of relying on a file.
+        """
+        self.close()
+        self.save_path = save_path
+        self._fields = {}
+        base_path = base_path or save_path
+        header = {"journal": 1, "base": base_path, "save": save_path}
+        if snapshot or base_path is None:
+            header["snapshot"] = character_dict
+        else:
+            header["base_hash"] = file_hash(base_path)
+        write_atomic(self.journal_path, (json.dumps(header, ensure_ascii=False) + "\n").encode("utf-8"))
+        self._file = open(self.journal_path, 'ab')
+        self._write_pointer(save_path)
+
+    def record(self, values):
+        """
+        Append the edited fields ({field: value as in Character.to_dict()})
+        whose value differs from the one last recorded; returns the number
+        of fields written.
+        """
+        fields = encode_fields(values)
+        changed = [key for key, value in fields.items() if self._fields.get(key) != value]
+        if not changed:
+            return 0
+
+        members = ",".join(f"{json.dumps(key)}:{fields[key]}" for key in changed)
+        line = f'{{"t":{time.time():.3f},"set":{{{members}}}}}\n'
+        self._file.write(line.encode("utf-8"))
+        self._file.flush()
+        self._fields.update(fields)
+        self.records_written += 1
+
+        self._unsynced += 1
+        if self._oldest_unsynced is None:
+            self._oldest_unsynced = time.monotonic()
+        if self._unsynced >= FSYNC_BATCH or time.monotonic() - self._oldest_unsynced >= FSYNC_INTERVAL:
+            self.sync()
+        return len(changed)
+
+    @property
+    def needs_compaction(self):
+        """Check whether the journal has grown past COMPACT_THRESHOLD"""
+        return self._file is not None and self._file.tell() > COMPACT_THRESHOLD
+
+    @property
+    def needs_sync(self):
+        """Check whether records are waiting for an fsync"""
+        return self._unsynced > 0
+
+    def sync(self):
+        """fsync the records written so far"""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._oldest_unsynced = None
+
+    def compact(self, character_dict):
+        """Write the current character to a fresh save and restart the journal on it"""
+        self.close()
+        data = save_header.dumps_character(character_dict).encode("utf-8")
+        write_atomic(self.compacted_path, data)
+        self.start(self.save_path, base_path=self.compacted_path)
+
+    def close(self):
+        """Sync and close the journal file (the journal stays on disk)"""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """Close and delete the journal, e.g. after the character was saved"""
+        self.close()
+        for path in (self.journal_path, self.compacted_path, self.pointer_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error removing journal file: {e}")
+
+    def _write_pointer(self, base_path):
+        """Remember where the active journal is"""
+        pointer = {"journal": self.journal_path, "base": base_path}
+        write_atomic(self.pointer_path, json.dumps(pointer).encode("utf-8"))
+
+
+def find_recovery(save_dir):
+    """Journal left behind by a crash, as (journal_path, base_path), or None"""
+    pointer_path = os.path.join(save_dir, RECOVERY_POINTER)
+    try:
+        with open(pointer_path, 'r', encoding='utf-8') as f:
+            pointer = json.load(f)
+        journal_path = pointer["journal"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if not os.path.exists(journal_path):
+        try:
+            os.remove(pointer_path)
+        except OSError:
+            pass
+        return None
+    return journal_path, pointer.get("base")
+
+
+def replay(journal_path, load_base):
+    """
+    Rebuild the edited character dictionary from a journal.
+    load_base(path) must return the saved character dictionary (or None).
+    Returns (character_dict, save_path, record_count), save_path being the
+    save the character belongs to; raises ValueError if the journal cannot
+    be applied (e.g. the base save changed since).
+    """
+    with open(journal_path, 'rb') as f:
+        lines = f.read().split(b"\n")
+
+    header = json.loads(lines[0])
+    base_path = header.get("base")
+    if "snapshot" in header:
+        state = header["snapshot"]
+    else:
+        if file_hash(base_path) != header.get("base_hash"):
+            raise ValueError("the save file changed after the journal was started")
+        state = load_base(base_path)
+        if state is None:
+            raise ValueError("the save file could not be read")
+
+    count = 0
+    for line in lines[1:]:
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # A torn write at the end of the journal
+            break
+        state.update(entry.get("set", {}))
+        count += 1
+
+    # Journals from before compaction into a save only name the base
+    return state, header.get("save", base_path), count
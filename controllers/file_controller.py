@@ -1,8 +1,11 @@
+import copy
 import json
 import os
 import datetime
-from pathlib import Path
-from models.character import Character
+from utils import save_header
+from utils import binary_format
+from utils.atomic_file import write_atomic
+from controllers.save_worker import SaveWorker
 
 
 class FileController:
@@ -13,31 +16,101 @@ class FileController:
         self.default_save_dir = os.path.join(os.path.expanduser("~"), "RyuutamaCharacters")
         # Ensure save directory exists
         os.makedirs(self.default_save_dir, exist_ok=True)
+        # Library index and portrait store are created on first use
+        self._library_index = None
+        self._portrait_store = None
+        # Writer thread for saves started from the UI
+        self.save_worker = SaveWorker(self.encode_character)
+
+    @property
+    def library_index(self):
+        """Persistent index of the saves in the default directory"""
+        if self._library_index is None:
+            from utils.library_index import LibraryIndex
+            self._library_index = LibraryIndex(self.default_save_dir)
+        return self._library_index
+
+    @property
+    def portrait_store(self):
+        """Pre-scaled character portraits, shared by all saves"""
+        if self._portrait_store is None:
+            from utils.portrait_store import PortraitStore
+            self._portrait_store = PortraitStore(self.default_save_dir)
+        return self._portrait_store
 
     def save_character(self, character, file_path=None):
         """Save character to JSON file"""
         if file_path is None:
-            # Generate default filename based on character name
-            filename = f"{character.name or 'unnamed'}.json"
-            file_path = os.path.join(self.default_save_dir, filename)
+            file_path = self.default_file_path(character)
 
         # Convert character to dictionary
         character_dict = character.to_dict()
 
-        # Save to JSON file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(character_dict, f, ensure_ascii=False, indent=2)
+        # Write through a temp file so a crash never leaves a partial save
+        write_atomic(file_path, self.encode_character(character_dict, file_path))
+
+        # Keep the library index in sync with the new file
+        self.library_index.update_file(file_path)
+
+        return file_path
+
+    def save_character_async(self, character, file_path=None, token=None):
+        """
+        Snapshot the character and hand it to the writer thread.
+        Completion is reported on save_worker.results; see finish_save().
+        """
+        if file_path is None:
+            file_path = self.default_file_path(character)
 
+        # Deep copy so later edits on the Tk thread can't leak into the snapshot
+        character_dict = copy.deepcopy(character.to_dict())
+        self.save_worker.submit(file_path, character_dict, token)
         return file_path
 
+    def finish_save(self, file_path):
+        """Bookkeeping for a completed background save (runs on the Tk thread)"""
+        self.library_index.update_file(file_path)
+
+    def encode_character(self, character_dict, file_path):
+        """Serialize a character dictionary for the given file (format chosen by extension)"""
+        if self.is_binary_save(file_path):
+            return binary_format.dumps(character_dict)
+        # Save as JSON, with the preview header on the first line
+        return save_header.dumps_character(character_dict).encode('utf-8')
+
+    @staticmethod
+    def is_binary_save(file_path):
+        """Check whether a path uses the compact binary format"""
+        return file_path.lower().endswith(binary_format.BINARY_EXTENSION)
+
+    def default_file_path(self, character):
+        """Generate default filename based on character name"""
+        filename = f"{character.name or 'unnamed'}.json"
+        return os.path.join(self.default_save_dir, filename)
+
+    def read_character_dict(self, file_path):
+        """Read a JSON or binary save file into a character dictionary"""
+        if self.is_binary_save(file_path):
+            with open(file_path, 'rb') as f:
+                return binary_format.loads(f.read())
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            character_dict = json.load(f)
+        return save_header.strip_header(character_dict)
+
     def load_character(self, file_path):
-        """Load character from JSON file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                character_dict = json.load(f)
+        """Load character from a JSON or binary save file"""
+        from models.schema import load_character
 
-            # Create Character object from dictionary
-            character = Character.from_dict(character_dict)
+        try:
+            character_dict = self.read_character_dict(file_path)
+
+            # Create Character object from dictionary; bad fields fall back to their defaults
+            character, errors = load_character(character_dict)
+            for path, message in errors:
+                print(f"Error in {file_path} at {path}: {message}")
+            # Older saves point at the original image; move it into the portrait store
+            self.portrait_store.resolve(character)
             return character
         except Exception as e:
             print(f"Error loading character: {e}")
@@ -53,33 +126,51 @@ class FileController:
             filename = f"{character.name or 'unnamed'}_{date_str}.pdf"
             file_path = os.path.join(self.default_save_dir, filename)
 
-        exporter = PDFExporter()
+        exporter = PDFExporter(self.portrait_store)
         result = exporter.export_character(character, file_path)
 
         return result, file_path
 
     def get_recent_characters(self, max_count=5):
         """Get list of recently saved characters"""
-        character_files = []
+        self.library_index.refresh()
+        return [preview["file_path"] for preview in self.library_index.recent(max_count)]
 
-        # List all JSON files in save directory
-        for filename in os.listdir(self.default_save_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(self.default_save_dir, filename)
-                modified_time = os.path.getmtime(file_path)
-                character_files.append((file_path, modified_time))
+    def get_characters_by_class(self, character_class):
+        """Get previews of all saved characters of a class"""
+        self.library_index.refresh()
+        return self.library_index.by_class(character_class)
 
-        # Sort by modification time (newest first)
-        character_files.sort(key=lambda x: x[1], reverse=True)
-
-        # Return file paths for the most recent files
-        return [file_path for file_path, _ in character_files[:max_count]]
+    def get_characters_by_level(self, min_level, max_level=None):
+        """Get previews of all saved characters within a level range"""
+        self.library_index.refresh()
+        return self.library_index.by_level(min_level, max_level)
 
     def get_character_preview(self, file_path):
         """Get a preview of character information from a save file"""
+        preview = self.library_index.get(file_path)
+        if preview is not None:
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                stat_result = None
+            # Use the indexed preview as long as the file has not changed; otherwise index it again
+            if stat_result is not None and (preview["mtime"], preview["size"]) == (
+                    stat_result.st_mtime, stat_result.st_size):
+                return preview
+            if self.library_index.update_file(file_path):
+                return self.library_index.get(file_path)
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                character_dict = json.load(f)
+            # Only the header line is read for files that have one;
+            # older files fall back to a full parse
+            if self.is_binary_save(file_path):
+                character_dict = binary_format.read_preview(file_path)
+            else:
+                character_dict = save_header.read_header(file_path)
+            if character_dict is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    character_dict = json.load(f)
 
             # Extract basic info for preview
             preview = {
@@ -96,4 +187,4 @@ class FileController:
             return preview
         except Exception as e:
             print(f"Error reading character preview: {e}")
-            return None
\ No newline at end of file
+            return None
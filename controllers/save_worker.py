@@ -0,0 +1,83 @@
+import queue
+import threading
+
+from utils.atomic_file import write_atomic
+
+
+class SaveWorker:
+    """Background writer thread for character saves.
+
+    Snapshots are serialized and written off the Tk thread. If several saves of
+    the same file are queued before the writer gets to them, only the newest
+    snapshot is written. Results are put on a queue that the Tk thread polls.
+    """
+
+    def __init__(self, encode):
+        self._encode = encode  # Callable(character_dict, file_path) -> bytes
+        self._pending = {}  # file_path -> (character_dict, [tokens])
+        self._condition = threading.Condition()
+        self._busy = False
+        self._stopping = False
+        self._thread = None
+        self.results = queue.Queue()  # (file_path, error, tokens)
+
+    def submit(self, file_path, character_dict, token=None):
+        """Queue a snapshot for writing; replaces any queued snapshot of the same file"""
+        with self._condition:
+            if file_path in self._pending:
+                _, tokens = self._pending.pop(file_path)
+            else:
+                tokens = []
+            tokens.append(token)
+            self._pending[file_path] = (character_dict, tokens)
+
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def has_pending(self):
+        """Check whether any save is queued or being written"""
+        with self._condition:
+            return bool(self._pending) or self._busy
+
+    def flush(self, timeout=None):
+        """Block until every queued save has been written"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def stop(self, timeout=None):
+        """Write any queued saves and stop the thread"""
+        with self._condition:
+            thread = self._thread
+            self._stopping = True
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+        with self._condition:
+            if self._thread is thread:
+                self._thread = None
+
+    def _run(self):
+        """Writer thread main loop"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._stopping)
+                if not self._pending:
+                    return
+                file_path = next(iter(self._pending))
+                character_dict, tokens = self._pending.pop(file_path)
+                self._busy = True
+
+            error = None
+            try:
+                write_atomic(file_path, self._encode(character_dict, file_path))
+            except Exception as e:
+                print(f"Error saving character: {e}")
+                error = e
+
+            self.results.put((file_path, error, tokens))
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
@@ -0,0 +1,82 @@
+"""
+Ryuutama Character Sheet - Session Cache
+Warm start: the last session is written on exit and restored at launch.
+
+The cache is one small JSON file in the save directory holding the open
+save's path, a snapshot of the character as loaded from it (already
+validated, at the current schema version), the theme, the tab last
+viewed and the portrait thumbnail as base64 PNG, which Tk's PhotoImage
+takes as is. Restoring reads only this file: the save itself is just
+stat()ed, and the snapshot is used only if the save's modification time
+and size are the ones recorded with it. Otherwise the save is loaded
+normally, still without asking for the file.
+"""
+
+import json
+import os
+
+from utils.atomic_file import write_atomic
+
+SESSION_CACHE = ".session_cache.json"
+
+# Bumped when the layout of the cache changes; other versions are ignored
+CACHE_VERSION = 1
+
+
+def file_stamp(file_path):
+    """(mtime in ns, size) of a file, or None if it cannot be read"""
+    try:
+        stat = os.stat(file_path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def read_session(save_dir):
+    """The cached session as a dictionary, or None if there is no usable cache"""
+    cache_path = os.path.join(save_dir, SESSION_CACHE)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            session = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error reading session cache: {e}")
+        return None
+
+    if not isinstance(session, dict) or session.get("version") != CACHE_VERSION:
+        return None
+    return session
+
+
+def write_session(save_dir, file_path=None, stamp=None, character_dict=None, theme=None, tab=None,
+                  portrait_id="", portrait_data=None):
+    """
+    Write the session for the next launch. character_dict is the snapshot of
+    the save at file_path as of stamp (see file_stamp); leave it out when the character
+    on screen differs from the save.
+    """
+    session = {
+        "version": CACHE_VERSION,
+        "file_path": file_path,
+        "file_stamp": stamp,
+        "character": character_dict,
+        "theme": theme,
+        "tab": tab,
+        "portrait_id": portrait_id,
+        "portrait_data": portrait_data,
+    }
+    try:
+        data = json.dumps(session, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        write_atomic(os.path.join(save_dir, SESSION_CACHE), data)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error writing session cache: {e}")
+        return False
+    return True
+
+
+def snapshot_is_current(session):
+    """Check whether the cached character still matches its save on disk"""
+    stamp = session.get("file_stamp")
+    return (session.get("character") is not None and stamp is not None
+            and file_stamp(session.get("file_path")) == stamp)
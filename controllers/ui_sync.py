@@ -0,0 +1,112 @@
+"""
+Ryuutama Character Sheet - UI Sync
+Copies edited widgets into the character in coalesced batches.
+
+Typing used to copy every field of a tab into the Character (including
+the full notes text) and record an unsaved change, with a journal entry
+and a new window title, on each key release. Now a key release only
+marks its field dirty. A short timer later copies the dirty fields and
+records the whole burst as one change. Anything that needs the model to
+be current (saving, exporting, switching characters) calls flush() first.
+"""
+
+import time
+import tkinter as tk
+
+# How long a burst of keystrokes is collected before it is copied into the model
+SYNC_DELAY_MS = 200
+
+
+class UISync:
+    """Pending widget -> model copies of one AppController"""
+
+    def __init__(self, app_controller, delay_ms=SYNC_DELAY_MS):
+        self.app_controller = app_controller
+        self.delay_ms = delay_ms
+        self._pending = {}  # field key -> apply(character), last edit wins
+        self._changed = set()  # Fields edited directly in the model whose change is not recorded yet
+        self._after_id = None
+
+        # Time spent in key handlers (mark/changed) and in flushes, for profiling
+        self.handler_calls = 0
+        self.handler_seconds = 0.0
+        self.flush_calls = 0
+        self.flush_seconds = 0.0
+
+    def mark(self, key, apply):
+        """
+        Field key ("notes", or "abilities.2" for part of a field) was edited;
+        apply(character) copies its widget into the model. Called from key
+        handlers, so it only queues the copy.
+        """
+        start = time.perf_counter()
+        self._pending[key] = apply
+        self._schedule()
+        self.handler_calls += 1
+        self.handler_seconds += time.perf_counter() - start
+
+    def changed(self, *fields):
+        """A handler already updated these fields of the model; record the change with the next flush"""
+        start = time.perf_counter()
+        self._changed.update(fields)
+        self._schedule()
+        self.handler_calls += 1
+        self.handler_seconds += time.perf_counter() - start
+
+    @property
+    def pending(self):
+        """Whether edits are waiting to be copied or recorded"""
+        return bool(self._pending or self._changed)
+
+    def apply_pending(self):
+        """
+        Copy the dirty fields into the character. The caller records the
+        change (see AppController.mark_unsaved_changes). Returns the set of
+        character fields edited since the last call.
+        """
+        pending, self._pending = self._pending, {}
+        fields, self._changed = self._changed, set()
+        character = self.app_controller.character
+        for key, apply in pending.items():
+            try:
+                apply(character)
+            except (tk.TclError, ValueError):
+                # Partly typed value (e.g. an empty number field); the model keeps the last valid one
+                pass
+        fields.update(key.split(".")[0] for key in pending)
+        return fields
+
+    def flush(self):
+        """Copy all pending edits now and record them as one unsaved change"""
+        self._cancel_timer()
+        if not self.pending:
+            return False
+        start = time.perf_counter()
+        # mark_unsaved_changes applies the pending fields before journaling
+        self.app_controller.mark_unsaved_changes()
+        self.flush_calls += 1
+        self.flush_seconds += time.perf_counter() - start
+        return True
+
+    def discard(self):
+        """Drop pending edits, e.g. when the widgets are about to show another character"""
+        self._cancel_timer()
+        self._pending.clear()
+        self._changed.clear()
+
+    def _schedule(self):
+        """Flush after the delay; later edits in the same burst join this flush"""
+        root = self.app_controller.root
+        if root is None:
+            self.flush()
+        elif self._after_id is None:
+            self._after_id = root.after(self.delay_ms, self._on_timer)
+
+    def _on_timer(self):
+        self._after_id = None
+        self.flush()
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            self.app_controller.root.after_cancel(self._after_id)
+            self._after_id = None
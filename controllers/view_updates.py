@@ -0,0 +1,77 @@
+"""
+Ryuutama Character Sheet - View Updates
+Counts the widgets the views refresh for each operation.
+
+Views subscribe to the character fields they render (see
+Character.subscribe and AppController.register_ui_element). Their field
+views return how many widgets they wrote, which is tallied here per
+operation ("load", "buy item", "condition roll", ...), so a change that
+repaints more than it should shows up in the numbers.
+"""
+
+import tkinter as tk
+
+
+def update_var(var, value):
+    """Set a Tk variable if it shows something else; returns 1 if it was written, else 0"""
+    try:
+        if var.get() == value:
+            return 0
+    except tk.TclError:
+        pass  # Empty or partly typed number
+    var.set(value)
+    return 1
+
+
+def update_text(text_widget, value):
+    """Replace the contents of a Text widget if they differ; returns 1 if it was written, else 0"""
+    if text_widget.get("1.0", "end-1c") == value:
+        return 0
+    text_widget.delete("1.0", tk.END)
+    if value:
+        text_widget.insert("1.0", value)
+    return 1
+
+
+class ViewUpdates:
+    """Widget update counts of one AppController"""
+
+    def __init__(self):
+        self.operation = None  # Operation being counted, if any
+        self.widgets = 0  # Widgets written during the current operation
+        self.fields = {}  # field -> widgets written during the current operation
+        self.last = {}  # operation -> (widgets, {field: widgets}) of its latest run
+        self.totals = {}  # operation -> [runs, widgets]
+
+    def begin(self, operation):
+        """Start counting for operation"""
+        self.operation = operation
+        self.widgets = 0
+        self.fields = {}
+
+    def count(self, field, widgets):
+        """A field view wrote widgets widgets"""
+        self.widgets += widgets
+        self.fields[field] = self.fields.get(field, 0) + widgets
+
+    def end(self):
+        """Finish the current operation; returns the number of widgets it wrote"""
+        if self.operation is None:
+            return self.widgets
+        self.last[self.operation] = (self.widgets, self.fields)
+        totals = self.totals.setdefault(self.operation, [0, 0])
+        totals[0] += 1
+        totals[1] += self.widgets
+        self.operation = None
+        return self.widgets
+
+    def report(self):
+        """Lines with the widget updates of each operation, for profiling"""
+        lines = []
+        for operation, (runs, widgets) in sorted(self.totals.items()):
+            last_widgets, fields = self.last[operation]
+            busiest = ", ".join(f"{field} {count}" for field, count in
+                                sorted(fields.items(), key=lambda pair: -pair[1])[:3])
+            lines.append(f"{operation}: {runs} runs, {widgets / runs:.1f} widgets per run "
+                         f"(last {last_widgets}: {busiest or 'none'})")
+        return lines
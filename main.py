@@ -6,14 +6,10 @@ A digital character sheet for the Ryuutama tabletop RPG
 
 import os
 import sys
-import tkinter as tk
 
 # Ensure we can import from parent directory
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-# Import needed modules
-from views.main_window import MainWindow
-
 
 def ensure_directories():
     """Create necessary directories if they don't exist"""
@@ -22,8 +18,33 @@ def ensure_directories():
     os.makedirs(save_dir, exist_ok=True)
 
 
+def _report_startup(startup_profile):
+    """Print the startup profile once the main loop first goes idle"""
+    startup_profile.mark("first idle")
+    startup_profile.uninstall()
+    for line in startup_profile.report():
+        print(line)
+
+
 def main():
     """Main application entry point"""
+    # Headless commands don't need Tk
+    if len(sys.argv) > 1 and sys.argv[1] == "export-pdf":
+        from utils.batch_export import main as export_pdf
+        return export_pdf(sys.argv[2:])
+
+    # --profile-startup prints import times and phase timings once the window is idle
+    startup_profile = None
+    if "--profile-startup" in sys.argv[1:]:
+        from utils.startup_profile import StartupProfile
+        startup_profile = StartupProfile()
+        startup_profile.install()
+
+    import tkinter as tk
+    from views.main_window import MainWindow
+    if startup_profile is not None:
+        startup_profile.mark("imports")
+
     # Ensure directories exist
     ensure_directories()
 
@@ -39,9 +60,11 @@ def main():
             root.iconphoto(True, icon)
         except Exception as e:
             print(f"Failed to load application icon: {e}")
+    if startup_profile is not None:
+        startup_profile.mark("root window")
 
     # Create main window
-    app = MainWindow(root)
+    app = MainWindow(root, startup_profile)
 
     # Center window on screen
     root.update_idletasks()
@@ -51,9 +74,13 @@ def main():
     y = (root.winfo_screenheight() // 2) - (height // 2)
     root.geometry(f"+{x}+{y}")
 
+    if startup_profile is not None:
+        startup_profile.mark("layout")
+        root.after_idle(lambda: _report_startup(startup_profile))
+
     # Start main loop
     root.mainloop()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
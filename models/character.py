@@ -1,5 +1,118 @@
+from models.conditions import ConditionChecks, StatusEffects
+from models.derived_stats import DerivedStats
+from models.stats import Stat, Pool
+
+# Save layout version, written as "schema_version" (see models/schema.py); saves without it are version 1
+SCHEMA_VERSION = 3
+
+
+def _record_property(field, convert, doc, derived_input=None):
+    """
+    Attribute that stores a typed record; plain dicts (old code, loaded saves) are converted.
+    Replacing a stat invalidates the derived values that depend on it, and
+    field observers of the attribute (see Character.subscribe) are notified.
+    """
+    slot = "_" + field
+
+    def getter(self):
+        return getattr(self, slot)
+
+    def setter(self, value):
+        setattr(self, slot, convert(value))
+        if derived_input and self._derived is not None:
+            self._derived.watch(derived_input)
+            self._derived.invalidate(derived_input)
+        if self._observers:
+            self.notify(field)
+
+    return property(getter, setter, doc=doc)
+
+
+def _stat_converter(name):
+    return lambda value: value if isinstance(value, Stat) else Stat.from_dict(value, name)
+
+
+def _pool(value):
+    return value if isinstance(value, Pool) else Pool.from_dict(value)
+
+
+def _condition_checks(value):
+    return value if isinstance(value, ConditionChecks) else ConditionChecks.from_dict(value)
+
+
+def _status_effects(value):
+    return value if isinstance(value, StatusEffects) else StatusEffects.from_dict(value)
+
+
+# Saved fields, in the order to_dict() writes them (followed by "schema_version")
+SAVE_FIELDS = (
+    "name", "player_name", "level", "exp", "gender", "age", "character_class", "type",
+    "gold",
+    "class_skill", "stats_used", "effect", "mastered_weapon", "specialized_terrain", "personal_item",
+    "str", "dex", "int", "spi", "hp", "mp",
+    "initiative", "fumble_points",
+    "weapons", "shield", "armor", "travelers_outfit",
+    "condition_checks", "status_effects",
+    "current_terrain", "current_weather",
+    "portrait_id", "image_path", "appearance", "hometown", "reason_for_travel",
+    "notes",
+    "abilities",
+)
+
+# to_dict() form of the fields that are not saved as they are
+SAVE_FORMS = {
+    "str": lambda c: c.str.to_save_dict(with_pool=True),
+    "dex": lambda c: c.dex.to_save_dict(),
+    "int": lambda c: c.int.to_save_dict(),
+    "spi": lambda c: c.spi.to_save_dict(with_pool=True),
+    "hp": lambda c: c.hp.to_dict(),
+    "mp": lambda c: c.mp.to_dict(),
+    "weapons": lambda c: [w.to_dict() for w in c.weapons] if c.weapons else [],
+    "shield": lambda c: c.shield.to_dict() if c.shield else None,
+    "armor": lambda c: c.armor.to_dict() if c.armor else None,
+    "travelers_outfit": lambda c: [i.to_dict() for i in c.travelers_outfit] if c.travelers_outfit else [],
+    "condition_checks": lambda c: c.condition_checks.to_dict(),
+    "status_effects": lambda c: c.status_effects.to_dict(),
+}
+
+# (field, save form or None) of each saved field, as to_dict() walks them
+SAVE_LAYOUT = tuple((field, SAVE_FORMS.get(field)) for field in SAVE_FIELDS)
+
+
 class Character:
+    # Fixed attribute set: no per-instance __dict__, which matters for large libraries
+    __slots__ = (
+        "name", "player_name", "level", "exp", "gender", "age", "character_class", "type",
+        "gold",
+        "class_skill", "stats_used", "effect", "mastered_weapon", "specialized_terrain", "personal_item",
+        "_str", "_dex", "_int", "_spi", "_hp", "_mp",
+        "initiative", "fumble_points",
+        "weapons", "shield", "armor", "travelers_outfit",
+        "_condition_checks", "_status_effects",
+        "current_terrain", "current_weather",
+        "portrait_id", "image_path", "appearance", "hometown", "reason_for_travel",
+        "notes",
+        "abilities",
+        "_derived", "_observers",
+    )
+
+    # Typed records; assigning a dict converts it
+    str = _record_property("str", _stat_converter("str"), "STR (Stat)", "str")
+    dex = _record_property("dex", _stat_converter("dex"), "DEX (Stat)", "dex")
+    int = _record_property("int", _stat_converter("int"), "INT (Stat)", "int")
+    spi = _record_property("spi", _stat_converter("spi"), "SPI (Stat)", "spi")
+    hp = _record_property("hp", _pool, "Hit points (Pool)")
+    mp = _record_property("mp", _pool, "Mind points (Pool)")
+    condition_checks = _record_property("condition_checks", _condition_checks, "Condition check results")
+    status_effects = _record_property("status_effects", _status_effects, "Active status effects (bitflags)")
+
     def __init__(self):
+        # Derived values (see models/derived_stats.py), created on first use
+        self._derived = None
+
+        # Field name -> callbacks, created by the first subscribe()
+        self._observers = None
+
         # Basic character info
         self.name = ""
         self.player_name = ""
@@ -22,14 +135,14 @@ class Character:
         self.personal_item = ""
 
         # Stats
-        self.str = {"value": 6, "die_size": "d6", "max": 6, "current": 6}  # Default d6
-        self.dex = {"value": 6, "die_size": "d6"}
-        self.int = {"value": 6, "die_size": "d6"}
-        self.spi = {"value": 6, "die_size": "d6", "max": 6, "current": 6}
+        self.str = Stat("str", 6, "d6")  # Default d6
+        self.dex = Stat("dex", 6, "d6")
+        self.int = Stat("int", 6, "d6")
+        self.spi = Stat("spi", 6, "d6")
 
         # Health and Magic
-        self.hp = {"max": 12, "current": 12}  # Default HP (STR * 2)
-        self.mp = {"max": 12, "current": 12}  # Default MP (SPI * 2)
+        self.hp = Pool(12)  # Default HP (STR * 2)
+        self.mp = Pool(12)  # Default MP (SPI * 2)
 
         # Additional stats
         self.initiative = 0
@@ -42,29 +155,18 @@ class Character:
         self.travelers_outfit = []  # List of outfit/equipment items
 
         # Condition
-        self.condition_checks = {
-            "str": 0,
-            "dex": 0,
-            "int": 0,
-            "spi": 0
-        }
+        self.condition_checks = ConditionChecks()
 
         # Status effects
-        self.status_effects = {
-            "injury": False,
-            "tired": False,
-            "poison": False,
-            "muddled": False,
-            "sick": False,
-            "shock": False
-        }
+        self.status_effects = StatusEffects()
 
         # Terrain and weather
         self.current_terrain = ""
         self.current_weather = ""
 
         # Appearance and background
-        self.image_path = ""  # Path to character image
+        self.portrait_id = ""  # Portrait store id (see utils/portrait_store.py)
+        self.image_path = ""  # Path to character image (older saves, imported on load)
         self.appearance = ""
         self.hometown = ""
         self.reason_for_travel = ""
@@ -81,9 +183,98 @@ class Character:
             5: []
         }
 
+    @property
+    def derived(self):
+        """Derived values (initiative, max HP/MP, travel checks, ...) as a DerivedStats graph"""
+        if self._derived is None:
+            self._derived = DerivedStats(self)
+        return self._derived
+
+    def subscribe(self, field, callback):
+        """
+        Call callback(field, value) when field changes. Fields are the keys of
+        to_dict() ("name", "gold", "weapons", "hp", ...). Assigning a stat,
+        pool or condition record notifies by itself; other edits are announced
+        with notify().
+        """
+        if self._observers is None:
+            self._observers = {}
+        self._observers.setdefault(field, []).append(callback)
+
+    def unsubscribe(self, field, callback):
+        """Stop calling callback for field"""
+        callbacks = (self._observers or {}).get(field, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def notify(self, *fields):
+        """Tell the observers of each field that it changed"""
+        if not self._observers:
+            return
+        for field in fields:
+            callbacks = self._observers.get(field)
+            if callbacks:
+                value = getattr(self, field)
+                for callback in list(callbacks):
+                    callback(field, value)
+
+    def hand_over_observers(self, character):
+        """
+        Move field observers and derived stat subscribers to character, which
+        replaces this one in the views (new, loaded or recovered character).
+        """
+        character._observers, self._observers = self._observers, None
+        if self._derived is not None and self._derived._subscribers:
+            character.derived._subscribers, self._derived._subscribers = self._derived._subscribers, {}
+
+    def apply_derived(self, *names):
+        """
+        Store the current values of the named derived stats the character
+        keeps ("initiative", "max_hp", "max_mp"; current HP/MP are capped at
+        the new maximum) and notify the fields that changed. Returns those fields.
+        """
+        changed = []
+        for name in names:
+            value = self.derived.get(name)
+            if name == "initiative":
+                if self.initiative != value:
+                    self.initiative = value
+                    changed.append("initiative")
+                continue
+            field = "hp" if name == "max_hp" else "mp"
+            pool = getattr(self, field)
+            if pool.max != value or pool.current > value:
+                pool.max = value
+                pool.current = min(pool.current, value)
+                changed.append(field)
+        self.notify(*changed)
+        return changed
+
+    def set_stat(self, stat_name, value=None, die_size=None):
+        """
+        Change a stat's value and/or die size and notify the stat's field
+        observers. Derived values are invalidated by the Stat itself, so
+        they also stay current when a Stat is edited in place; field
+        observers are only told by set_stat() or notify(). Initiative and
+        max HP/MP follow the stat (see apply_derived).
+        """
+        # Stats only tell a derived graph about edits once it exists
+        self.derived
+        stat = getattr(self, stat_name)
+        changed = False
+        if value is not None and value != stat.value:
+            stat.value = value
+            changed = True
+        if die_size is not None and die_size != stat.die_size:
+            stat.die_size = die_size
+            changed = True
+        if changed:
+            self.notify(stat_name)
+        return changed
+
     def calculate_initiative(self):
         """Calculate character's initiative based on DEX and INT"""
-        return self.dex["value"] + self.int["value"]
+        return self.dex.value + self.int.value
 
     def get_traveling_check_bonus(self, check_type):
         """
@@ -93,75 +284,28 @@ class Character:
         3) Camp Check [DEX + INT]
         """
         if check_type == "movement":
-            return self.str["value"] + self.dex["value"]
+            return self.str.value + self.dex.value
         elif check_type == "direction":
-            return self.int["value"] + self.int["value"]
+            return self.int.value + self.int.value
         elif check_type == "camp":
-            return self.dex["value"] + self.int["value"]
+            return self.dex.value + self.int.value
         return 0
 
     def to_dict(self):
         """Convert character to dictionary for saving"""
-        return {
-            "name": self.name,
-            "player_name": self.player_name,
-            "level": self.level,
-            "exp": self.exp,
-            "gender": self.gender,
-            "age": self.age,
-            "character_class": self.character_class,
-            "type": self.type,
-            "gold": self.gold,
-            "class_skill": self.class_skill,
-            "stats_used": self.stats_used,
-            "effect": self.effect,
-            "mastered_weapon": self.mastered_weapon,
-            "specialized_terrain": self.specialized_terrain,
-            "personal_item": self.personal_item,
-            "str": self.str,
-            "dex": self.dex,
-            "int": self.int,
-            "spi": self.spi,
-            "hp": self.hp,
-            "mp": self.mp,
-            "initiative": self.initiative,
-            "fumble_points": self.fumble_points,
-            "weapons": [w.to_dict() for w in self.weapons] if self.weapons else [],
-            "shield": self.shield.to_dict() if self.shield else None,
-            "armor": self.armor.to_dict() if self.armor else None,
-            "travelers_outfit": [i.to_dict() for i in self.travelers_outfit] if self.travelers_outfit else [],
-            "condition_checks": self.condition_checks,
-            "status_effects": self.status_effects,
-            "current_terrain": self.current_terrain,
-            "current_weather": self.current_weather,
-            "image_path": self.image_path,
-            "appearance": self.appearance,
-            "hometown": self.hometown,
-            "reason_for_travel": self.reason_for_travel,
-            "notes": self.notes,
-            "abilities": self.abilities
-        }
+        data = {field: save_form(self) if save_form else getattr(self, field) for field, save_form in SAVE_LAYOUT}
+        data["schema_version"] = SCHEMA_VERSION
+        return data
+
+    def field_to_dict(self, field):
+        """One field as to_dict() has it, without converting the others"""
+        save_form = SAVE_FORMS.get(field)
+        return save_form(self) if save_form else getattr(self, field)
 
     @classmethod
     def from_dict(cls, data):
-        """Create character from dictionary (for loading)"""
-        character = cls()
-        for key, value in data.items():
-            setattr(character, key, value)
-
-        # Recreate objects for weapons, armor, etc.
-        from models.equipment import Weapon, Shield, Armor, Item
-
-        if "weapons" in data and data["weapons"]:
-            character.weapons = [Weapon.from_dict(w) for w in data["weapons"]]
-
-        if "shield" in data and data["shield"]:
-            character.shield = Shield.from_dict(data["shield"])
-
-        if "armor" in data and data["armor"]:
-            character.armor = Armor.from_dict(data["armor"])
-
-        if "travelers_outfit" in data and data["travelers_outfit"]:
-            character.travelers_outfit = [Item.from_dict(i) for i in data["travelers_outfit"]]
+        """Create character from dictionary (for loading); see models/schema.py for errors and strict loading"""
+        from models.schema import load_character
 
-        return character
\ No newline at end of file
+        character, errors = load_character(data)
+        return character
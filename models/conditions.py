@@ -1,3 +1,6 @@
+import enum
+
+
 class StatusEffect:
     """Represents a status effect in Ryuutama"""
 
@@ -46,10 +49,18 @@ class StatusEffect:
         }
     }
 
+    # Recovery checks pair a stat with SPI; [STR + SPI] is the Condition check
+    RECOVERY_PARTNER = "spi"
+
     def __init__(self, effect_type):
         self.type = effect_type
         self.info = self.EFFECTS.get(effect_type, {})
 
+    @classmethod
+    def recovery_check_stats(cls, stat_name):
+        """Stat pair of the recovery check rolled for stat_name"""
+        return (stat_name, cls.RECOVERY_PARTNER)
+
     @property
     def description(self):
         return self.info.get("description", "")
@@ -62,6 +73,11 @@ class StatusEffect:
     def check_stat(self):
         return self.info.get("check_stat", "")
 
+    @property
+    def check_stats(self):
+        """Stat pair of the check that cures this effect"""
+        return self.recovery_check_stats(self.check_stat)
+
     @property
     def recovery_value(self):
         return self.info.get("recovery_value", 0)
@@ -71,6 +87,141 @@ class StatusEffect:
         return self.info.get("effect", "")
 
 
+class StatusFlag(enum.IntFlag):
+    """Bit for each status effect"""
+    INJURY = 1
+    TIRED = 2
+    POISON = 4
+    MUDDLED = 8
+    SICK = 16
+    SHOCK = 32
+
+
+class StatusEffects:
+    """A character's active status effects, stored as StatusFlag bits.
+
+    Supports the dict interface of the old {"injury": False, ...} mapping
+    (indexing, get, keys, items, iteration) so callers need not change.
+    """
+
+    __slots__ = ("flags",)
+
+    NAMES = ("injury", "tired", "poison", "muddled", "sick", "shock")
+    FLAGS = {name: StatusFlag[name.upper()] for name in NAMES}
+
+    def __init__(self, flags=StatusFlag(0)):
+        self.flags = StatusFlag(flags)
+
+    def __getitem__(self, name):
+        return bool(self.flags & self.FLAGS[name])
+
+    def __setitem__(self, name, active):
+        if active:
+            self.flags |= self.FLAGS[name]
+        else:
+            self.flags &= ~self.FLAGS[name]
+
+    def __contains__(self, name):
+        return name in self.FLAGS
+
+    def __iter__(self):
+        return iter(self.NAMES)
+
+    def __len__(self):
+        return len(self.NAMES)
+
+    def __eq__(self, other):
+        if not isinstance(other, StatusEffects):
+            return NotImplemented
+        return self.flags == other.flags
+
+    def __repr__(self):
+        return f"StatusEffects({self.flags!r})"
+
+    def get(self, name, default=None):
+        """dict.get() equivalent"""
+        return self[name] if name in self.FLAGS else default
+
+    def keys(self):
+        return self.NAMES
+
+    def values(self):
+        return [self[name] for name in self.NAMES]
+
+    def items(self):
+        return [(name, self[name]) for name in self.NAMES]
+
+    def to_dict(self):
+        """Convert to dictionary for saving"""
+        return {name: self[name] for name in self.NAMES}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create from dictionary (for loading)"""
+        if isinstance(data, StatusEffects):
+            return cls(data.flags)
+        effects = cls()
+        for name, active in data.items():
+            if name in cls.FLAGS:
+                effects[name] = active
+        return effects
+
+
+class ConditionChecks:
+    """Condition check results per stat"""
+
+    __slots__ = ("str", "dex", "int", "spi")
+
+    STATS = ("str", "dex", "int", "spi")
+
+    def __init__(self, str=0, dex=0, int=0, spi=0):
+        self.str = str
+        self.dex = dex
+        self.int = int
+        self.spi = spi
+
+    # Dict-style access for code written against the old {"str": 0, ...} mapping
+    def __getitem__(self, stat):
+        if stat not in self.STATS:
+            raise KeyError(stat)
+        return getattr(self, stat)
+
+    def __setitem__(self, stat, value):
+        if stat not in self.STATS:
+            raise KeyError(stat)
+        setattr(self, stat, value)
+
+    def __contains__(self, stat):
+        return stat in self.STATS
+
+    def __iter__(self):
+        return iter(self.STATS)
+
+    def __eq__(self, other):
+        if not isinstance(other, ConditionChecks):
+            return NotImplemented
+        return all(self[stat] == other[stat] for stat in self.STATS)
+
+    def __repr__(self):
+        return f"ConditionChecks({self.str!r}, {self.dex!r}, {self.int!r}, {self.spi!r})"
+
+    def get(self, stat, default=None):
+        """dict.get() equivalent"""
+        return getattr(self, stat) if stat in self.STATS else default
+
+    def items(self):
+        return [(stat, getattr(self, stat)) for stat in self.STATS]
+
+    def to_dict(self):
+        """Convert to dictionary for saving"""
+        return {stat: getattr(self, stat) for stat in self.STATS}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create from dictionary (for loading)"""
+        return cls(*(data.get(stat, 0) for stat in cls.STATS))
+
+
 class TerrainEffect:
     """Represents terrain effects in Ryuutama"""
 
@@ -128,4 +279,135 @@ class WeatherEffect:
 
     @property
     def effects(self):
-        return self.info.get("effects", {})
\ No newline at end of file
+        return self.info.get("effects", {})
+
+# Travel checks and the stats they roll
+TRAVEL_CHECKS = {
+    "movement": ("str", "dex"),
+    "direction": ("int", "int"),
+    "camp": ("dex", "int"),
+}
+
+# Target number of travel checks by terrain...
+TERRAIN_TARGET_NUMBERS = {
+    "grassland": 6, "wasteland": 6,
+    "woods": 8, "highlands": 8, "rocky_terrain": 8,
+    "deep_forest": 10, "swamp": 10, "mountain": 10,
+    "desert": 12, "jungle": 12,
+    "alpine": 14,
+}
+
+# ...raised by the weather
+WEATHER_TARGET_MODIFIERS = {
+    "rain": 1, "strong_wind": 1, "fog": 1, "hot": 1, "cold": 1,
+    "hardrain": 3, "snow": 3, "deep_fog": 3, "dark": 3, "hurricane": 3, "blizzard": 3,
+}
+
+STAT_NAMES = ("str", "dex", "int", "spi")
+
+
+class TravelConditions:
+    """Combined effect of one terrain and one weather ("" for none) on travel checks"""
+
+    __slots__ = ("terrain", "weather", "stat_modifiers", "all_modifier", "target_number", "check_modifiers")
+
+    def __init__(self, terrain, weather):
+        self.terrain = terrain
+        self.weather = weather
+
+        # Modifiers of single stats, and the "all" modifier, which applies once per check
+        self.stat_modifiers = dict.fromkeys(STAT_NAMES, 0)
+        self.all_modifier = 0
+        for effects in (TerrainEffect(terrain).effects, WeatherEffect(weather).effects):
+            for stat, bonus in effects.items():
+                if stat == "all":
+                    self.all_modifier += bonus
+                else:
+                    self.stat_modifiers[stat] += bonus
+
+        # Target number of all three travel checks (None without a terrain)
+        if terrain in TERRAIN_TARGET_NUMBERS:
+            self.target_number = TERRAIN_TARGET_NUMBERS[terrain] + WEATHER_TARGET_MODIFIERS.get(weather, 0)
+        else:
+            self.target_number = None
+
+        # Modifier of each travel check; each stat of the pair counts once
+        self.check_modifiers = {
+            check: self.all_modifier + sum(self.stat_modifiers[stat] for stat in set(stats))
+            for check, stats in TRAVEL_CHECKS.items()
+        }
+
+    def __repr__(self):
+        return f"TravelConditions({self.terrain!r}, {self.weather!r})"
+
+
+# Every terrain x weather combination, computed once
+TERRAIN_TYPES = ("",) + tuple(TerrainEffect.TERRAINS)
+WEATHER_TYPES = ("",) + tuple(WeatherEffect.WEATHER)
+TRAVEL_TABLE = {
+    (terrain, weather): TravelConditions(terrain, weather)
+    for terrain in TERRAIN_TYPES
+    for weather in WEATHER_TYPES
+}
+
+
+def travel_conditions(terrain, weather):
+    """Precomputed TravelConditions of a terrain and weather ("" or None for none)"""
+    return TRAVEL_TABLE[(terrain or "", weather or "")]
+
+
+def travel_check(character, check, terrain, weather):
+    """
+    A character's travel check under the given conditions, as
+    (base, modifier, target_number); base is the check from the character's stats.
+    """
+    conditions = TRAVEL_TABLE[(terrain or "", weather or "")]
+    return (
+        character.derived.get(f"{check}_check"),
+        conditions.check_modifiers[check],
+        conditions.target_number
+    )
+
+
+def party_travel_chances(party_frame):
+    """
+    Exact chance of every character of a PartyFrame passing each travel check
+    in every terrain and weather, for route planning.
+    Returns an array indexed [character, terrain, weather, check] in the order
+    of TERRAIN_TYPES, WEATHER_TYPES and TRAVEL_CHECKS. Without a terrain
+    there is no check and the chance is 1.
+    """
+    import numpy as np
+
+    from models.party_frame import STATS
+    from models.probability import get_tables
+    from models.stats import Stat
+
+    # Success chance of each die pair by the total the dice must reach (0 .. highest)
+    tables = get_tables()
+    die_count = len(Stat.DIE_SIZES)
+    highest = 2 * max(int(die_size[1:]) for die_size in Stat.DIE_SIZES) + 1
+    at_least = np.empty((die_count, die_count, highest + 1))
+    for first, first_die in enumerate(Stat.DIE_SIZES):
+        for second, second_die in enumerate(Stat.DIE_SIZES):
+            at_least[first, second] = [
+                tables.chance_at_least(first_die, second_die, needed) for needed in range(highest + 1)
+            ]
+
+    # Total the dice must reach in each terrain/weather/check (target number - modifier)
+    needed = np.zeros((len(TERRAIN_TYPES), len(WEATHER_TYPES), len(TRAVEL_CHECKS)), dtype=np.int64)
+    for t, terrain in enumerate(TERRAIN_TYPES):
+        for w, weather in enumerate(WEATHER_TYPES):
+            conditions = TRAVEL_TABLE[(terrain, weather)]
+            for c, check in enumerate(TRAVEL_CHECKS):
+                if conditions.target_number is not None:
+                    needed[t, w, c] = conditions.target_number - conditions.check_modifiers[check]
+    needed = np.clip(needed, 0, highest)
+
+    # Die size indices of each character's two dice per check: (characters, checks)
+    first_dice = np.stack([party_frame.die_sizes[:, STATS.index(stats[0])] for stats in TRAVEL_CHECKS.values()], 1)
+    second_dice = np.stack([party_frame.die_sizes[:, STATS.index(stats[1])] for stats in TRAVEL_CHECKS.values()], 1)
+
+    chances = at_least[first_dice[:, None, None, :], second_dice[:, None, None, :], needed[None, :, :, :]]
+    chances[:, 0] = 1.0
+    return chances
@@ -0,0 +1,104 @@
+"""
+Ryuutama Character Sheet - Derived Stats
+Values computed from a character's stats, kept in a small dependency graph.
+
+Each derived value names the inputs it depends on. When an input changes
+(a stat is assigned, or its value or die size is edited in place) only
+its dependents are marked stale; they are recomputed the next time they
+are read. Views subscribe to the values
+they display and are told when one of them may have changed.
+
+Initiative and max HP/MP are also stored on the character (and saved);
+those are stored again as soon as they go stale, whether or not a view
+shows them (see Character.apply_derived).
+"""
+
+# name -> (inputs, function of the character)
+DERIVED_STATS = {
+    "initiative": (("dex", "int"), lambda c: c.dex.value + c.int.value),
+    "max_hp": (("str",), lambda c: c.str.value * 2),
+    "max_mp": (("spi",), lambda c: c.spi.value * 2),
+    "movement_check": (("str", "dex"), lambda c: c.str.value + c.dex.value),
+    "direction_check": (("int",), lambda c: c.int.value + c.int.value),
+    "camp_check": (("dex", "int"), lambda c: c.dex.value + c.int.value),
+    "total_stats": (("str", "dex", "int", "spi"), lambda c: c.str.value + c.dex.value + c.int.value + c.spi.value),
+    "carrying_capacity": (("str",), lambda c: c.str.value + 3),  # STR + 3
+}
+
+# Derived values the character stores -> the character field holding them
+STORED = {"initiative": "initiative", "max_hp": "hp", "max_mp": "mp"}
+
+# input -> names of the derived values that depend on it
+DEPENDENTS = {
+    input_name: tuple(name for name, (inputs, function) in DERIVED_STATS.items() if input_name in inputs)
+    for input_name in ("str", "dex", "int", "spi")
+}
+
+
+class DerivedStats:
+    """Lazily computed derived values of one character"""
+
+    __slots__ = ("character", "_values", "_subscribers")
+
+    def __init__(self, character):
+        self.character = character
+        self._values = {}  # name -> value, only while it is current
+        self._subscribers = {}  # name -> list of callbacks
+        for input_name in DEPENDENTS:
+            self.watch(input_name)
+
+    def watch(self, input_name):
+        """Have the character's current stat input_name invalidate its dependents when edited"""
+        getattr(self.character, input_name)._owner = (self, input_name)
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def get(self, name):
+        """Current value of a derived stat, computed if it is stale"""
+        try:
+            return self._values[name]
+        except KeyError:
+            value = DERIVED_STATS[name][1](self.character)
+            self._values[name] = value
+            return value
+
+    def invalidate(self, *inputs):
+        """
+        Mark the values depending on the given inputs stale, store the new
+        values the character keeps, and notify subscribers
+        """
+        stale = []
+        for input_name in inputs:
+            for name in DEPENDENTS.get(input_name, ()):
+                if name not in stale:
+                    stale.append(name)
+                self._values.pop(name, None)
+        self.character.apply_derived(*(name for name in stale if name in STORED))
+        self._notify(stale)
+
+    def invalidate_all(self):
+        """Mark every value stale, e.g. after the whole character was replaced"""
+        self._values.clear()
+        self._notify(list(DERIVED_STATS))
+
+    def subscribe(self, name, callback):
+        """Call callback(name, value) whenever derived stat name changes"""
+        if name not in DERIVED_STATS:
+            raise KeyError(name)
+        self._subscribers.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name, callback):
+        """Stop calling callback for derived stat name"""
+        callbacks = self._subscribers.get(name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _notify(self, names):
+        """Recompute the stale values that somebody watches and hand them out"""
+        for name in names:
+            callbacks = self._subscribers.get(name)
+            if callbacks:
+                value = self.get(name)
+                for callback in list(callbacks):
+                    callback(name, value)
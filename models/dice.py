@@ -0,0 +1,141 @@
+"""
+Ryuutama Character Sheet - Dice Engine
+Rolls checks with NumPy's random Generator.
+
+A check in Ryuutama is two dice, one for each stat of a pair such as
+[STR + SPI], plus modifiers. Both dice showing their highest face (or
+both showing 6) is a critical, which always succeeds; both showing 1 is
+a fumble, which always fails. Many checks are rolled at once as arrays,
+so success rates can be estimated from millions of rolls.
+"""
+
+import numpy as np
+
+from models.conditions import travel_conditions
+
+# Status effects that modify checks of some stats, as (stats, modifier);
+# the modifier applies once to any check that uses one of the stats
+STATUS_MODIFIERS = {
+    "injury": (("str", "dex"), -2),  # -2 to all physical checks
+    "muddled": (("int", "spi"), -2),  # -2 to all mental checks
+}
+
+# Checks are rolled in chunks of this many so memory use stays flat
+CHUNK_SIZE = 1 << 20
+
+_engine = None
+
+
+def die_faces(die_size):
+    """Number of faces of a die size ("d8" -> 8)"""
+    return int(str(die_size).lstrip("d"))
+
+
+def check_modifier(character, stats, terrain=None, weather=None):
+    """
+    Modifier to a check of the given stats from terrain, weather and the
+    character's status effects. Each stat of the pair counts once, and each
+    status effect once per check.
+    """
+    conditions = travel_conditions(terrain, weather)
+    modifier = conditions.all_modifier + sum(conditions.stat_modifiers[stat] for stat in set(stats))
+    for effect_type, is_active in character.status_effects.items():
+        if is_active and effect_type in STATUS_MODIFIERS:
+            affected, status_modifier = STATUS_MODIFIERS[effect_type]
+            if any(stat in affected for stat in stats):
+                modifier += status_modifier
+    return modifier
+
+
+class DiceEngine:
+    """Rolls dice and checks with a NumPy Generator"""
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def roll(self, faces, count=None):
+        """Roll dice with the given number of faces (an int or an array)"""
+        return self.rng.integers(1, np.asarray(faces) + 1, size=count)
+
+    def roll_check(self, first_die, second_die, modifier=0, count=1):
+        """
+        Roll count checks of two dice (die sizes like "d8" or face counts).
+        Returns (totals, critical, fumble) arrays.
+        """
+        first_faces = first_die if isinstance(first_die, int) else die_faces(first_die)
+        second_faces = second_die if isinstance(second_die, int) else die_faces(second_die)
+        first = self.roll(first_faces, count)
+        second = self.roll(second_faces, count)
+
+        critical = ((first == first_faces) & (second == second_faces)) | ((first == 6) & (second == 6))
+        fumble = (first == 1) & (second == 1)
+        return first + second + modifier, critical, fumble
+
+    def check_rates(self, first_die, second_die, target, modifier=0, trials=1_000_000):
+        """
+        Estimate the rates of a check against a target number from trials rolls.
+        Returns a dict with "success", "critical" and "fumble" rates.
+        """
+        successes = criticals = fumbles = 0
+        remaining = trials
+        while remaining > 0:
+            count = min(remaining, CHUNK_SIZE)
+            totals, critical, fumble = self.roll_check(first_die, second_die, modifier, count)
+            success = ((totals >= target) | critical) & ~fumble
+            successes += int(np.count_nonzero(success))
+            criticals += int(np.count_nonzero(critical))
+            fumbles += int(np.count_nonzero(fumble))
+            remaining -= count
+
+        return {
+            "success": successes / trials,
+            "critical": criticals / trials,
+            "fumble": fumbles / trials
+        }
+
+    def character_check_rates(self, character, first_stat, second_stat, target,
+                              terrain=None, weather=None, trials=1_000_000):
+        """Rates of a character's [first_stat + second_stat] check"""
+        modifier = check_modifier(character, (first_stat, second_stat), terrain, weather)
+        return self.check_rates(
+            getattr(character, first_stat).die_size,
+            getattr(character, second_stat).die_size,
+            target, modifier, trials
+        )
+
+    def party_check_rates(self, party_frame, first_stat, second_stat, target, modifiers=0, trials=100_000):
+        """
+        Success rates of the same check for every character of a PartyFrame.
+        modifiers is a number or one value per character. Returns an array.
+        """
+        from models.party_frame import STATS
+        from models.stats import Stat
+
+        faces = np.array([die_faces(die_size) for die_size in Stat.DIE_SIZES])
+        first_faces = faces[party_frame.die_sizes[:, STATS.index(first_stat)]]
+        second_faces = faces[party_frame.die_sizes[:, STATS.index(second_stat)]]
+        modifiers = np.broadcast_to(np.asarray(modifiers), first_faces.shape)
+
+        # Roll characters x trials at once, in chunks of trials
+        successes = np.zeros(len(first_faces), dtype=np.int64)
+        chunk = max(1, CHUNK_SIZE // max(1, len(first_faces)))
+        remaining = trials
+        while remaining > 0:
+            count = min(remaining, chunk)
+            first = self.roll(first_faces[:, None], (len(first_faces), count))
+            second = self.roll(second_faces[:, None], (len(second_faces), count))
+            critical = ((first == first_faces[:, None]) & (second == second_faces[:, None])) | \
+                ((first == 6) & (second == 6))
+            fumble = (first == 1) & (second == 1)
+            success = ((first + second + modifiers[:, None] >= target) | critical) & ~fumble
+            successes += np.count_nonzero(success, axis=1)
+            remaining -= count
+        return successes / trials
+
+
+def get_engine():
+    """Shared DiceEngine for the application"""
+    global _engine
+    if _engine is None:
+        _engine = DiceEngine()
+    return _engine
@@ -1,27 +1,114 @@
+from itertools import count
+
+# Source of equipment uids, unique within one session
+_uids = count(1)
+
+_catalog = None
+
+
+def _get_catalog():
+    """The rulebook catalog, imported on first use (models.rulebook imports this module)"""
+    global _catalog
+    if _catalog is None:
+        from models.rulebook import get_catalog
+        _catalog = get_catalog()
+    return _catalog
+
+
 class EquipmentBase:
+    __slots__ = ("name", "effect", "durability", "catalog_id", "_uid")
+
     def __init__(self, name="", effect="", durability=0):
         self.name = name
-        self.effect = effect
+        self.effect = effect  # Own effect text; rulebook equipment leaves it empty
         self.durability = durability
+        self.catalog_id = ""  # Id of the rulebook entry this came from, if any
+
+    @property
+    def uid(self):
+        """
+        Session-unique id of this piece of equipment (views key their rows by
+        it). Assigned on first use and not saved; an edited copy takes over
+        the uid of the original.
+        """
+        try:
+            return self._uid
+        except AttributeError:
+            self._uid = next(_uids)
+            return self._uid
+
+    @uid.setter
+    def uid(self, value):
+        self._uid = value
+
+    @property
+    def catalog_entry(self):
+        """Rulebook entry this equipment refers to, or None"""
+        if not self.catalog_id:
+            return None
+        return _get_catalog().get(self.catalog_id)
+
+    @property
+    def description(self):
+        """Effect text to show: the equipment's own, else its rulebook description"""
+        if self.effect:
+            return self.effect
+        entry = self.catalog_entry
+        return entry.description if entry else ""
+
+    def keep_catalog_entry(self, original):
+        """
+        Stay linked to the rulebook entry of original (the equipment this one
+        was edited from) while the name is unchanged. An effect equal to the
+        rulebook description is not stored again.
+        """
+        if original is None or not original.catalog_id or original.name != self.name:
+            return
+        self.catalog_id = original.catalog_id
+        entry = self.catalog_entry
+        if entry and self.effect == entry.description:
+            self.effect = ""
 
     def to_dict(self):
         """Convert to dictionary for saving"""
-        return {
+        data = {
             "name": self.name,
             "effect": self.effect,
             "durability": self.durability
         }
+        if self.catalog_id:
+            data["catalog_id"] = self.catalog_id
+        return data
+
+    @classmethod
+    def fields(cls):
+        """Names of all saved attributes, including those of base classes"""
+        fields = cls.__dict__.get("_fields")
+        if fields is None:
+            fields = tuple(slot for klass in reversed(cls.__mro__) for slot in klass.__dict__.get("__slots__", ())
+                           if not slot.startswith("_"))
+            cls._fields = fields
+        return fields
 
     @classmethod
     def from_dict(cls, data):
         """Create from dictionary (for loading)"""
         item = cls()
+        fields = cls.fields()
         for key, value in data.items():
-            setattr(item, key, value)
+            # Unknown keys (e.g. from newer versions) are ignored
+            if key in fields:
+                setattr(item, key, value)
         return item
 
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.fields())
+        return f"{type(self).__name__}({values})"
+
 
 class Weapon(EquipmentBase):
+    __slots__ = ("accuracy", "damage")
+
     def __init__(self, name="", effect="", durability=0, accuracy=0, damage=0):
         super().__init__(name, effect, durability)
         self.accuracy = accuracy
@@ -37,6 +124,8 @@ class Weapon(EquipmentBase):
 
 
 class Shield(EquipmentBase):
+    __slots__ = ("defense",)
+
     def __init__(self, name="", effect="", durability=0, defense=0):
         super().__init__(name, effect, durability)
         self.defense = defense
@@ -50,6 +139,8 @@ class Shield(EquipmentBase):
 
 
 class Armor(EquipmentBase):
+    __slots__ = ("defense_points", "penalty")
+
     def __init__(self, name="", effect="", durability=0, defense_points=0, penalty=0):
         super().__init__(name, effect, durability)
         self.defense_points = defense_points
@@ -65,6 +156,8 @@ class Armor(EquipmentBase):
 
 
 class Item(EquipmentBase):
+    __slots__ = ("size",)
+
     def __init__(self, name="", effect="", durability=0, size=0):
         super().__init__(name, effect, durability)
         self.size = size  # Size for inventory management
@@ -0,0 +1,124 @@
+"""
+Ryuutama Character Sheet - Party Frame
+Columnar view of many characters for GM-side tooling.
+
+Stats, die sizes, HP/MP and status flags of a whole party (or an NPC
+roster) are held in NumPy arrays, so derived values are computed for
+every character in one vectorized pass instead of one Character at a time.
+Stat values are floats, since die averages (Stat.get_average_value) are halves.
+"""
+
+import numpy as np
+
+from models.conditions import StatusEffects
+from models.stats import Stat
+
+STATS = ("str", "dex", "int", "spi")
+STR, DEX, INT, SPI = range(4)
+
+# Derived values computed by PartyFrame.compute()
+DERIVED = ("initiative", "movement", "direction", "camp", "max_hp", "max_mp")
+
+
+class PartyFrame:
+    """Stats of a list of characters as NumPy columns"""
+
+    def __init__(self, characters):
+        self.characters = list(characters)
+        count = len(self.characters)
+        self.values = np.zeros((count, 4), dtype=np.float64)  # STR, DEX, INT, SPI values
+        self.die_sizes = np.zeros((count, 4), dtype=np.int8)  # Index into Stat.DIE_SIZES
+        self.hp = np.zeros((count, 2), dtype=np.float64)  # max, current
+        self.mp = np.zeros((count, 2), dtype=np.float64)
+        self.status = np.zeros(count, dtype=np.uint8)  # StatusFlag bits
+        self.derived = {}
+        self.refresh()
+
+    def __len__(self):
+        return len(self.characters)
+
+    def refresh(self, indices=None):
+        """(Re)load the columns from the characters, e.g. after they were edited"""
+        if indices is None:
+            indices = range(len(self.characters))
+        rows = list(indices)
+        die_index = {die_size: index for index, die_size in enumerate(Stat.DIE_SIZES)}
+
+        # Gather plain lists first; one array assignment per column is far cheaper than per-row writes
+        values, die_sizes, hp, mp, status = [], [], [], [], []
+        for row in rows:
+            character = self.characters[row]
+            stats = (character.str, character.dex, character.int, character.spi)
+            values.append([stat.value for stat in stats])
+            die_sizes.append([die_index.get(stat.die_size, 1) for stat in stats])
+            hp.append((character.hp.max, character.hp.current))
+            mp.append((character.mp.max, character.mp.current))
+            status.append(int(character.status_effects.flags))
+
+        if rows:
+            self.values[rows] = values
+            self.die_sizes[rows] = die_sizes
+            self.hp[rows] = hp
+            self.mp[rows] = mp
+            self.status[rows] = status
+        self.derived = {}
+
+    def stat(self, name):
+        """Column of stat values (a view; edits go into the frame, not the characters)"""
+        return self.values[:, STATS.index(name)]
+
+    def die_size_names(self, name):
+        """Die sizes of a stat as strings"""
+        return np.asarray(Stat.DIE_SIZES)[self.die_sizes[:, STATS.index(name)]]
+
+    def has_status(self, name):
+        """Boolean mask of the characters suffering a status effect"""
+        return (self.status & int(StatusEffects.FLAGS[name])) != 0
+
+    def compute(self):
+        """
+        Compute the derived values of every character in one pass.
+        Returns (and keeps in self.derived) a dict of arrays:
+            initiative  DEX + INT
+            movement    STR + DEX (travel check)
+            direction   INT + INT (travel check)
+            camp        DEX + INT (travel check)
+            max_hp      STR x 2
+            max_mp      SPI x 2
+        """
+        values = self.values
+        dex_int = values[:, DEX] + values[:, INT]
+        self.derived = {
+            "initiative": dex_int,
+            "movement": values[:, STR] + values[:, DEX],
+            "direction": values[:, INT] * 2,
+            "camp": dex_int.copy(),
+            "max_hp": values[:, STR] * 2,
+            "max_mp": values[:, SPI] * 2,
+        }
+        return self.derived
+
+    def write_back(self, indices=None):
+        """
+        Store computed initiative and max HP/MP on the characters.
+        Travel checks are not stored on Character; read them from self.derived.
+        """
+        derived = self.derived or self.compute()
+        if indices is None:
+            indices = range(len(self.characters))
+
+        initiative = [_number(value) for value in derived["initiative"].tolist()]
+        max_hp = [_number(value) for value in derived["max_hp"].tolist()]
+        max_mp = [_number(value) for value in derived["max_mp"].tolist()]
+        for row in indices:
+            character = self.characters[row]
+            character.initiative = initiative[row]
+            character.hp.max = max_hp[row]
+            character.mp.max = max_mp[row]
+            self.hp[row, 0] = max_hp[row]
+            self.mp[row, 0] = max_mp[row]
+
+
+def _number(value):
+    """A computed value as an int when it is whole, as Character stores it"""
+    return int(value) if value.is_integer() else value
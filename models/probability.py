@@ -0,0 +1,164 @@
+"""
+Ryuutama Character Sheet - Check Probabilities
+Exact odds of checks, for hints in the UI.
+
+The distribution of every die pair in Stat.DIE_SIZES (and of every single
+die) is computed once by convolution. From it a table of success chances
+by required total is built, so the chance of any target number and
+modifier is a lookup. The tables are memoized in-process and persisted to
+a small cache file that is rebuilt when TABLE_VERSION changes.
+"""
+
+import json
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from models.conditions import StatusEffect
+from models.stats import Stat
+from utils.atomic_file import write_atomic
+from utils.config import DEFAULT_SAVE_DIRECTORY
+
+# Bump when the way tables are computed changes; older cache files are rebuilt
+TABLE_VERSION = 1
+CACHE_FILENAME = ".probability_cache.json"
+
+_tables = None
+
+
+def table_key(first_die, second_die=None):
+    """Cache key of a die pair ("d6+d8") or single die ("d6")"""
+    return f"{first_die}+{second_die}" if second_die else first_die
+
+
+def build_table(first_die, second_die=None):
+    """
+    Exact distribution of a check by convolution.
+    Returns a dict with:
+        min_total     lowest possible total
+        distribution  probability of each total from min_total up
+        critical      probability of a critical (both dice highest, or both 6)
+        fumble        probability of a fumble (both dice 1)
+        at_least      chance of success when a total of at least min_total + i
+                      is needed; criticals always succeed and fumbles always fail
+    A single die has no criticals or fumbles.
+    """
+    first_faces = int(first_die[1:])
+    first = np.full(first_faces, 1 / first_faces)
+    if not second_die:
+        distribution = first
+        critical = np.zeros_like(distribution)
+        fumble = np.zeros_like(distribution)
+        min_total = 1
+    else:
+        second_faces = int(second_die[1:])
+        distribution = np.convolve(first, np.full(second_faces, 1 / second_faces))
+        min_total = 2
+        outcome = 1 / (first_faces * second_faces)
+
+        # Probability mass of the critical and fumble outcomes, by total
+        critical = np.zeros_like(distribution)
+        critical[first_faces + second_faces - min_total] = outcome
+        if first_faces >= 6 and second_faces >= 6 and (first_faces, second_faces) != (6, 6):
+            critical[12 - min_total] += outcome
+        fumble = np.zeros_like(distribution)
+        fumble[0] = outcome
+
+    # Success when the total is high enough (and not a fumble), or on any critical
+    high_enough = np.cumsum((distribution - fumble)[::-1])[::-1]
+    criticals_below = np.concatenate(([0.0], np.cumsum(critical)[:-1]))
+    at_least = np.append(high_enough + criticals_below, critical.sum())
+
+    return {
+        "min_total": min_total,
+        "distribution": distribution.tolist(),
+        "critical": float(critical.sum()),
+        "fumble": float(fumble.sum()),
+        "at_least": at_least.tolist()
+    }
+
+
+class ProbabilityTables:
+    """Success-chance tables of all die pairs, backed by a cache file"""
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path or os.path.join(DEFAULT_SAVE_DIRECTORY, CACHE_FILENAME)
+        self.tables = self._load() or self._build()
+
+    def _load(self):
+        """Tables from the cache file, or None if it is missing or stale"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("version") != TABLE_VERSION:
+            return None
+        return cache.get("tables")
+
+    def _build(self):
+        """Compute every table and try to persist them"""
+        tables = {}
+        for first_die in Stat.DIE_SIZES:
+            tables[table_key(first_die)] = build_table(first_die)
+            for second_die in Stat.DIE_SIZES:
+                tables[table_key(first_die, second_die)] = build_table(first_die, second_die)
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            cache = {"version": TABLE_VERSION, "tables": tables}
+            write_atomic(self.cache_path, json.dumps(cache, separators=(",", ":")).encode("utf-8"))
+        except OSError as e:
+            print(f"Error writing probability cache: {e}")
+        return tables
+
+    def table(self, first_die, second_die=None):
+        """Table of a die pair (or single die)"""
+        key = table_key(first_die, second_die)
+        if key not in self.tables:
+            self.tables[key] = build_table(first_die, second_die)
+        return self.tables[key]
+
+    def success_chance(self, first_die, second_die, target, modifier=0):
+        """Chance that dice + modifier reach target (second_die may be None for one die)"""
+        return self.chance_at_least(first_die, second_die, math.ceil(target - modifier))
+
+    def chance_at_least(self, first_die, second_die, needed_total):
+        """Chance that the dice alone total at least needed_total"""
+        table = self.table(first_die, second_die)
+        at_least = table["at_least"]
+        index = min(max(needed_total - table["min_total"], 0), len(at_least) - 1)
+        return at_least[index]
+
+
+def get_tables():
+    """Shared ProbabilityTables, loaded on first use"""
+    global _tables
+    if _tables is None:
+        _tables = ProbabilityTables()
+    return _tables
+
+
+@lru_cache(maxsize=None)
+def success_chance(first_die, second_die, target, modifier=0):
+    """Chance of a [first_die + second_die] check + modifier reaching target"""
+    return get_tables().success_chance(first_die, second_die, target, modifier)
+
+
+def cure_chance(character, effect_type):
+    """
+    Chance that the recovery roll of ConditionsTab cures a status effect:
+    the two dice of its check plus modifiers must reach the recovery value.
+    """
+    from models.dice import check_modifier
+
+    effect = StatusEffect(effect_type)
+    first_stat, second_stat = effect.check_stats
+    return success_chance(
+        getattr(character, first_stat).die_size,
+        getattr(character, second_stat).die_size,
+        effect.recovery_value,
+        check_modifier(character, effect.check_stats)
+    )
@@ -0,0 +1,162 @@
+"""
+Ryuutama Character Sheet - Rulebook Catalog
+The rulebook's equipment, loaded once and indexed for queries.
+
+Every entry has a stable id such as "weapon:light_blade" or
+"item:shoes:rain_boots". Equipment bought from the rulebook keeps only
+that id (see EquipmentBase.catalog_id) and looks its description up here,
+so the text is neither copied into every save nor held once per item.
+"""
+
+import re
+
+from models.equipment import Weapon, Shield, Armor, Item
+from utils.equipment_data import WEAPONS, ARMOR, SHIELDS, ITEMS
+
+# Kinds of entries, with the equipment class each one creates
+KINDS = {
+    "weapon": Weapon,
+    "armor": Armor,
+    "shield": Shield,
+    "item": Item,
+}
+
+# (upper limit, label) of each price band; the last band has no limit
+PRICE_BANDS = (
+    (100, "Under 100g"),
+    (500, "100-499g"),
+    (1000, "500-999g"),
+    (5000, "1000-4999g"),
+    (None, "5000g and more"),
+)
+
+_catalog = None
+
+
+def slug(text):
+    """Id part of a name ("Rain boots" -> "rain_boots")"""
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+
+def price_band(price):
+    """Label of the price band a price falls in"""
+    for limit, label in PRICE_BANDS:
+        if limit is None or price < limit:
+            return label
+
+
+class CatalogEntry:
+    """One weapon, armor, shield or item of the rulebook"""
+
+    __slots__ = ("id", "kind", "category", "name", "price", "size", "equip", "description", "details")
+
+    def __init__(self, kind, category, name, info):
+        self.kind = kind
+        self.category = category
+        self.name = name
+        self.id = f"{kind}:{slug(category)}:{slug(name)}" if kind == "item" else f"{kind}:{slug(name)}"
+        self.price = info["price"]
+        self.size = info["size"]
+        self.equip = info.get("equip", "")
+        self.description = info["description"]
+        # Kind-specific values (accuracy, damage, defense, penalty, dodge, bonus, capacity)
+        self.details = {key: value for key, value in info.items()
+                        if key not in ("price", "size", "equip", "description")}
+
+    def create(self):
+        """New equipment referring to this entry"""
+        if self.kind == "weapon":
+            # Accuracy and damage are calculated in-game based on stats
+            equipment = Weapon(name=self.name, durability=self.size)
+        elif self.kind == "armor":
+            equipment = Armor(name=self.name, durability=self.size,
+                              defense_points=self.details["defense"], penalty=self.details["penalty"])
+        elif self.kind == "shield":
+            equipment = Shield(name=self.name, durability=self.size, defense=self.details["defense"])
+        else:
+            equipment = Item(name=self.name, durability=self.details.get("durability", self.size), size=self.size)
+        equipment.catalog_id = self.id
+        return equipment
+
+    def __repr__(self):
+        return f"CatalogEntry({self.id!r})"
+
+
+class RulebookCatalog:
+    """All rulebook entries by id, with indexes for the shop dialogs"""
+
+    def __init__(self):
+        self.entries = {}  # id -> CatalogEntry, in rulebook order
+        self._by_kind = {}
+        self._by_category = {}
+        self._by_price_band = {}
+        self._by_size = {}
+        self._by_equip = {}
+        self._by_name = {}  # (kind, name) -> CatalogEntry
+
+        for name, info in WEAPONS.items():
+            self._add(CatalogEntry("weapon", "Weapons", name, info))
+        for name, info in ARMOR.items():
+            self._add(CatalogEntry("armor", "Armor", name, info))
+        for name, info in SHIELDS.items():
+            self._add(CatalogEntry("shield", "Shields", name, info))
+        for category, items in ITEMS.items():
+            for name, info in items.items():
+                self._add(CatalogEntry("item", category, name, info))
+
+    def _add(self, entry):
+        """Add an entry to the catalog and its indexes"""
+        self.entries[entry.id] = entry
+        self._by_kind.setdefault(entry.kind, []).append(entry)
+        self._by_category.setdefault(entry.category, []).append(entry)
+        self._by_price_band.setdefault(price_band(entry.price), []).append(entry)
+        self._by_size.setdefault(entry.size, []).append(entry)
+        if entry.equip:
+            self._by_equip.setdefault(entry.equip, []).append(entry)
+        self._by_name.setdefault((entry.kind, entry.name), entry)
+
+    def get(self, entry_id):
+        """Entry with the given id, or None"""
+        return self.entries.get(entry_id)
+
+    def find(self, kind, name):
+        """Entry of the given kind and name, or None"""
+        return self._by_name.get((kind, name))
+
+    def categories(self, kind):
+        """Categories of the given kind, in rulebook order"""
+        return list(dict.fromkeys(entry.category for entry in self._by_kind.get(kind, ())))
+
+    def equip_slots(self):
+        """Equip slots used by the rulebook ("1 hand", "Chest", ...)"""
+        return list(self._by_equip)
+
+    def query(self, kind=None, category=None, band=None, size=None, equip=None, max_price=None):
+        """
+        Entries matching all given filters, in rulebook order.
+        band is a label of PRICE_BANDS; max_price keeps what can be afforded.
+        """
+        candidates = [index.get(key, []) for index, key in (
+            (self._by_kind, kind),
+            (self._by_category, category),
+            (self._by_price_band, band),
+            (self._by_size, size),
+            (self._by_equip, equip),
+        ) if key is not None]
+        if not candidates:
+            candidates = [list(self.entries.values())]
+
+        # Walk the smallest index and check the others by id
+        candidates.sort(key=len)
+        others = [{entry.id for entry in entries} for entries in candidates[1:]]
+        return [entry for entry in candidates[0]
+                if all(entry.id in ids for ids in others)
+                and (max_price is None or entry.price <= max_price)]
+
+
+def get_catalog():
+    """Shared RulebookCatalog, built on first use"""
+    global _catalog
+    if _catalog is None:
+        _catalog = RulebookCatalog()
+    return _catalog
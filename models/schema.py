@@ -0,0 +1,368 @@
+"""
+Ryuutama Character Sheet - Save Schema
+Validating loader for character dictionaries (Character.from_dict).
+
+The save layout is described once, field by field. For each schema
+version a loader is compiled from it: the migrations that bring that
+version up to date, followed by one converter per field. Converters
+accept well-typed values as they are, coerce near misses (numbers saved
+as strings, ability levels as JSON string keys) and report anything
+else with its field path, falling back to the default value.
+
+Loading fills the Character's slots directly instead of building a
+default Character and overwriting it.
+"""
+
+from functools import lru_cache
+
+from models.character import Character, SCHEMA_VERSION
+from models.conditions import ConditionChecks, StatusEffects
+from models.equipment import Weapon, Shield, Armor, Item
+from models.rulebook import get_catalog
+from models.stats import Stat, Pool
+
+ABILITY_LEVELS = (1, 2, 3, 4, 5)
+ABILITY_KEYS = {str(level): level for level in ABILITY_LEVELS}
+
+_MISSING = object()
+
+
+class SchemaError(ValueError):
+    """Raised by a strict load; errors is a list of (path, message)"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("; ".join(f"{path}: {message}" for path, message in errors))
+
+
+# Field converters: convert(value, path, errors) -> value
+
+def _text(value, path, errors):
+    if type(value) is str:
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    errors.append((path, f"expected text, got {type(value).__name__}"))
+    return ""
+
+
+def _whole_number(value, path, errors, default=0):
+    if type(value) is int:
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    errors.append((path, f"expected a whole number, got {value!r}"))
+    return default
+
+
+def _number(value, path, errors, default=0):
+    """Whole numbers, or halves from die averages (Stat.get_average_value)"""
+    if type(value) is int or type(value) is float:
+        return value
+    if isinstance(value, str):
+        try:
+            number = float(value.strip())
+            return int(number) if number.is_integer() else number
+        except ValueError:
+            pass
+    errors.append((path, f"expected a number, got {value!r}"))
+    return default
+
+
+def _mapping(value, path, errors):
+    """The value if it is a dictionary, else None (and an error)"""
+    if isinstance(value, dict):
+        return value
+    errors.append((path, f"expected an object, got {type(value).__name__}"))
+    return None
+
+
+def _compile_record(cls, fields, with_path, migrations=()):
+    """
+    Generate a specialized converter that builds a cls instance from a
+    dictionary: one straight-line assignment per field, with the common case
+    (value present and already of the right type) checked inline.
+    fields is a list of (key, slot, converter, default).
+    """
+    namespace = {
+        "cls": cls, "new": cls.__new__, "MISSING": _MISSING, "migrations": migrations,
+        "text": _text, "whole": _whole_number, "mapping": _mapping
+    }
+    # Error paths: "<path>.<key>" inside nested records, "<key>" at the top level
+    path = 'path + ".{key}"' if with_path else '"{key}"'
+    lines = [f"def convert({'value, path' if with_path else 'value'}, errors):"]
+    if migrations:
+        lines.append("    for migrate in migrations:")
+        lines.append("        value = migrate(value)")
+    lines.append("    if type(value) is not dict:")
+    lines.append(f"        mapping(value, {'path' if with_path else repr('')}, errors)")
+    lines.append("        return None")
+    lines.append("    get = value.get")
+    lines.append("    record = new(cls)")
+    if cls is Character:
+        lines.append("    record._derived = None")
+        lines.append("    record._observers = None")
+
+    for index, (key, slot, converter, default) in enumerate(fields):
+        key_path = path.format(key=key)
+        lines.append(f"    v = get({key!r}, MISSING)")
+        if converter == "text":
+            lines.append(f"    record.{slot} = {default!r} if v is MISSING else v if type(v) is str "
+                         f"else text(v, {key_path}, errors)")
+        elif converter == "whole":
+            lines.append(f"    record.{slot} = {default!r} if v is MISSING else v if type(v) is int "
+                         f"else whole(v, {key_path}, errors, {default!r})")
+        else:
+            namespace[f"convert_{index}"] = converter
+            namespace[f"default_{index}"] = default
+            lines.append(f"    record.{slot} = default_{index}() if v is MISSING "
+                         f"else convert_{index}(v, {key_path}, errors)")
+
+    # Unknown keys (e.g. from newer versions) are ignored
+    lines.append("    return record")
+    exec(compile("\n".join(lines), f"<schema {cls.__name__}>", "exec"), namespace)
+    return namespace["convert"]
+
+
+def _stat_converter(name):
+    def convert(value, path, errors):
+        data = _mapping(value, path, errors)
+        if data is None:
+            return Stat(name)
+        stat_value = data.get("value", 6)
+        if type(stat_value) is not int:
+            stat_value = _number(stat_value, f"{path}.value", errors, 6)
+        die_size = data.get("die_size", "d6")
+        if die_size not in Stat.DIE_SIZES:
+            errors.append((f"{path}.die_size", f"unknown die size {die_size!r}"))
+            die_size = "d6"
+        max_value = data.get("max")
+        if max_value is not None and type(max_value) is not int:
+            max_value = _number(max_value, f"{path}.max", errors, stat_value)
+        current_value = data.get("current")
+        if current_value is not None and type(current_value) is not int:
+            current_value = _number(current_value, f"{path}.current", errors, stat_value)
+        return Stat(name, stat_value, die_size, max_value, current_value)
+    return convert
+
+
+def _pool(value, path, errors):
+    data = _mapping(value, path, errors)
+    if data is None:
+        return Pool(12)
+    max_value = data.get("max", 0)
+    if type(max_value) is not int:
+        max_value = _whole_number(max_value, f"{path}.max", errors)
+    current = data.get("current")
+    if current is not None and type(current) is not int:
+        current = _whole_number(current, f"{path}.current", errors)
+    return Pool(max_value, current)
+
+
+def _condition_checks(value, path, errors):
+    data = _mapping(value, path, errors)
+    if data is None:
+        return ConditionChecks()
+    checks = []
+    for stat in ConditionChecks.STATS:
+        check = data.get(stat, 0)
+        checks.append(check if type(check) is int else _whole_number(check, f"{path}.{stat}", errors))
+    return ConditionChecks(*checks)
+
+
+def _status_effects(value, path, errors):
+    data = _mapping(value, path, errors)
+    if data is None:
+        return StatusEffects()
+    flags = 0
+    for name, active in data.items():
+        flag = StatusEffects.FLAGS.get(name)
+        if flag is None:
+            errors.append((f"{path}.{name}", "unknown status effect"))
+        elif not isinstance(active, int):
+            errors.append((f"{path}.{name}", f"expected true or false, got {active!r}"))
+        elif active:
+            flags |= flag
+    return StatusEffects(flags)
+
+
+# Numeric fields of equipment; the rest are text
+EQUIPMENT_NUMBERS = frozenset(("durability", "accuracy", "damage", "defense", "defense_points", "penalty", "size"))
+
+
+def _equipment_converter(cls):
+    """Compiled converter for one equipment class"""
+    defaults = cls()
+    fields = [
+        (field, field, "whole" if field in EQUIPMENT_NUMBERS else "text", getattr(defaults, field))
+        for field in cls.fields()
+    ]
+    return _compile_record(cls, fields, with_path=True)
+
+
+def _optional(convert):
+    def optional(value, path, errors):
+        return None if value is None else convert(value, path, errors)
+    return optional
+
+
+def _list_of(convert):
+    def convert_list(value, path, errors):
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            errors.append((path, f"expected a list, got {type(value).__name__}"))
+            return []
+        items = []
+        for index, entry in enumerate(value):
+            item = convert(entry, f"{path}[{index}]", errors)
+            if item is not None:
+                items.append(item)
+        return items
+    return convert_list
+
+
+def _abilities(value, path, errors):
+    abilities = {level: [] for level in ABILITY_LEVELS}
+    data = _mapping(value, path, errors)
+    if data is None:
+        return abilities
+    for key, text in data.items():
+        # JSON turns the level keys into strings
+        level = key if type(key) is int else ABILITY_KEYS.get(key)
+        if level is None:
+            level = _whole_number(key, f"{path}.{key}", errors, None)
+        if level not in abilities:
+            if level is not None:
+                errors.append((f"{path}.{key}", "unknown level"))
+            continue
+        if isinstance(text, (str, list)):
+            abilities[level] = text
+        else:
+            errors.append((f"{path}.{key}", f"expected text, got {type(text).__name__}"))
+    return abilities
+
+
+# Save key -> (Character slot, converter, default). The converters "text" and
+# "whole" are inlined by the compiler; their defaults are plain values. Other
+# converters are called as convert(value, path, errors) and their defaults are
+# factories.
+FIELDS = {
+    "name": ("name", "text", ""),
+    "player_name": ("player_name", "text", ""),
+    "level": ("level", "whole", 1),
+    "exp": ("exp", "whole", 0),
+    "gender": ("gender", "text", ""),
+    "age": ("age", "text", ""),
+    "character_class": ("character_class", "text", ""),
+    "type": ("type", "text", ""),
+    "gold": ("gold", "whole", 1000),
+    "class_skill": ("class_skill", "text", ""),
+    "stats_used": ("stats_used", "text", ""),
+    "effect": ("effect", "text", ""),
+    "mastered_weapon": ("mastered_weapon", "text", ""),
+    "specialized_terrain": ("specialized_terrain", "text", ""),
+    "personal_item": ("personal_item", "text", ""),
+    "str": ("_str", _stat_converter("str"), lambda: Stat("str")),
+    "dex": ("_dex", _stat_converter("dex"), lambda: Stat("dex")),
+    "int": ("_int", _stat_converter("int"), lambda: Stat("int")),
+    "spi": ("_spi", _stat_converter("spi"), lambda: Stat("spi")),
+    "hp": ("_hp", _pool, lambda: Pool(12)),
+    "mp": ("_mp", _pool, lambda: Pool(12)),
+    "initiative": ("initiative", "whole", 0),
+    "fumble_points": ("fumble_points", "whole", 0),
+    "weapons": ("weapons", _list_of(_equipment_converter(Weapon)), list),
+    "shield": ("shield", _optional(_equipment_converter(Shield)), lambda: None),
+    "armor": ("armor", _optional(_equipment_converter(Armor)), lambda: None),
+    "travelers_outfit": ("travelers_outfit", _list_of(_equipment_converter(Item)), list),
+    "condition_checks": ("_condition_checks", _condition_checks, ConditionChecks),
+    "status_effects": ("_status_effects", _status_effects, StatusEffects),
+    "current_terrain": ("current_terrain", "text", ""),
+    "current_weather": ("current_weather", "text", ""),
+    "portrait_id": ("portrait_id", "text", ""),
+    "image_path": ("image_path", "text", ""),
+    "appearance": ("appearance", "text", ""),
+    "hometown": ("hometown", "text", ""),
+    "reason_for_travel": ("reason_for_travel", "text", ""),
+    "notes": ("notes", "text", ""),
+    "abilities": ("abilities", _abilities, lambda: {level: [] for level in ABILITY_LEVELS}),
+}
+
+# Migrations: version -> function(data) returning the data of version + 1
+
+def _migrate_v1(data):
+    """Version 1 saves had no schema_version; HP/MP may be missing (derive them from STR/SPI)"""
+    data = dict(data)
+    for pool, stat in (("hp", "str"), ("mp", "spi")):
+        if pool not in data and isinstance(data.get(stat), dict):
+            value = data[stat].get("value")
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                data[pool] = {"max": int(value * 2), "current": int(value * 2)}
+    return data
+
+
+def _link_catalog(equipment, kind):
+    """Replace a copied rulebook description by a reference to the catalog entry"""
+    if not isinstance(equipment, dict) or equipment.get("catalog_id"):
+        return equipment
+    entry = get_catalog().find(kind, equipment.get("name"))
+    if entry is None or equipment.get("effect") != entry.description:
+        return equipment
+    return dict(equipment, effect="", catalog_id=entry.id)
+
+
+def _migrate_v2(data):
+    """Version 2 saves copied the rulebook description of bought equipment into its effect"""
+    data = dict(data)
+    for key, kind in (("weapons", "weapon"), ("travelers_outfit", "item")):
+        if isinstance(data.get(key), list):
+            data[key] = [_link_catalog(equipment, kind) for equipment in data[key]]
+    for key, kind in (("shield", "shield"), ("armor", "armor")):
+        if key in data:
+            data[key] = _link_catalog(data[key], kind)
+    return data
+
+
+MIGRATIONS = {
+    1: _migrate_v1,
+    2: _migrate_v2,
+}
+
+
+@lru_cache(maxsize=None)
+def compile_loader(version):
+    """Loader function(data, errors) -> Character for saves of a schema version"""
+    migrations = tuple(MIGRATIONS[v] for v in range(version, SCHEMA_VERSION) if v in MIGRATIONS)
+    fields = [(key, slot, converter, default) for key, (slot, converter, default) in FIELDS.items()]
+    return _compile_record(Character, fields, with_path=False, migrations=migrations)
+
+
+def load_character(data, strict=False):
+    """
+    Build a Character from a save dictionary. Returns (character, errors)
+    with errors a list of (field path, message); with strict=True any
+    error raises SchemaError instead.
+    """
+    if not isinstance(data, dict):
+        raise SchemaError([("", f"expected an object, got {type(data).__name__}")])
+
+    errors = []
+    version = data.get("schema_version", 1)
+    if type(version) is not int or version < 1:
+        errors.append(("schema_version", f"invalid version {version!r}"))
+        version = SCHEMA_VERSION
+    elif version > SCHEMA_VERSION:
+        # Saved by a newer version: load the fields this version knows
+        version = SCHEMA_VERSION
+
+    character = compile_loader(version)(data, errors)
+    if strict and errors:
+        raise SchemaError(errors)
+    return character, errors
@@ -1,9 +1,19 @@
 class Stat:
     """Represents a character stat in Ryuutama"""
 
+    __slots__ = ("name", "value", "die_size", "max_value", "current_value", "_owner")
+
     DIE_SIZES = ["d4", "d6", "d8", "d10", "d12", "d20"]
 
+    # Save-file keys (and dict-style access) -> attributes
+    KEYS = {"value": "value", "die_size": "die_size", "max": "max_value", "current": "current_value"}
+
+    # Attributes that derived values are computed from
+    DERIVED_INPUTS = ("value", "die_size")
+
     def __init__(self, name, value=6, die_size="d6", max_value=None, current_value=None):
+        # (DerivedStats, input name) to tell about changes, see DerivedStats.watch
+        self._owner = None
         self.name = name
         self.value = value
         self.die_size = die_size
@@ -11,6 +21,44 @@ class Stat:
         self.max_value = max_value if max_value is not None else value
         self.current_value = current_value if current_value is not None else value
 
+    # Dict-style access, so code written against the old {"value": ..., "die_size": ...}
+    # dictionaries keeps working
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self.KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, self.KEYS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setattr__(self, attribute, value):
+        object.__setattr__(self, attribute, value)
+        # However the stat is edited, the values derived from it become stale
+        if attribute in self.DERIVED_INPUTS:
+            owner = getattr(self, "_owner", None)
+            if owner is not None:
+                owner[0].invalidate(owner[1])
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def get(self, key, default=None):
+        """dict.get() equivalent"""
+        attribute = self.KEYS.get(key)
+        return getattr(self, attribute) if attribute else default
+
+    def __eq__(self, other):
+        if not isinstance(other, Stat):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__ if slot != "_owner")
+
+    def __repr__(self):
+        return f"Stat({self.name!r}, {self.value!r}, {self.die_size!r}, {self.max_value!r}, {self.current_value!r})"
+
     def increase_die_size(self):
         """Increase the die size to the next level"""
         current_index = self.DIE_SIZES.index(self.die_size)
@@ -50,13 +98,72 @@ class Stat:
             "current_value": self.current_value
         }
 
+    def to_save_dict(self, with_pool=False):
+        """Convert to the character save format ({"value", "die_size"}, plus "max"/"current" for STR and SPI)"""
+        data = {"value": self.value, "die_size": self.die_size}
+        if with_pool:
+            data["max"] = self.max_value
+            data["current"] = self.current_value
+        return data
+
     @classmethod
-    def from_dict(cls, data):
-        """Create from dictionary (for loading)"""
+    def from_dict(cls, data, name=None):
+        """Create from dictionary (for loading); accepts both Stat.to_dict() and the character save format"""
+        if isinstance(data, Stat):
+            return cls(name or data.name, data.value, data.die_size, data.max_value, data.current_value)
         return cls(
-            name=data.get("name", ""),
+            name=name if name is not None else data.get("name", ""),
             value=data.get("value", 6),
             die_size=data.get("die_size", "d6"),
-            max_value=data.get("max_value", None),
-            current_value=data.get("current_value", None)
-        )
\ No newline at end of file
+            max_value=data.get("max_value", data.get("max")),
+            current_value=data.get("current_value", data.get("current"))
+        )
+
+
+class Pool:
+    """A current/maximum pair, used for HP and MP"""
+
+    __slots__ = ("max", "current")
+
+    KEYS = ("max", "current")
+
+    def __init__(self, max_value=0, current=None):
+        self.max = max_value
+        self.current = current if current is not None else max_value
+
+    # Dict-style access for code written against the old {"max": ..., "current": ...} dictionaries
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def get(self, key, default=None):
+        """dict.get() equivalent"""
+        return getattr(self, key) if key in self.KEYS else default
+
+    def __eq__(self, other):
+        if not isinstance(other, Pool):
+            return NotImplemented
+        return self.max == other.max and self.current == other.current
+
+    def __repr__(self):
+        return f"Pool({self.max!r}, {self.current!r})"
+
+    def to_dict(self):
+        """Convert to dictionary for saving"""
+        return {"max": self.max, "current": self.current}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create from dictionary (for loading)"""
+        if isinstance(data, Pool):
+            return cls(data.max, data.current)
+        return cls(data.get("max", 0), data.get("current"))
@@ -0,0 +1,69 @@
+"""
+Ryuutama Character Sheet - Binary Save Format Tests
+Run with: python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from models.character import Character, SCHEMA_VERSION
+from models.equipment import Armor, Item, Weapon
+from utils import binary_format
+
+
+def make_character():
+    character = Character()
+    character.name = "Aoi"
+    character.character_class = "Minstrel"
+    character.notes = "Sang by the river ♪"
+    character.weapons = [Weapon("Light Blade", "Quick — and sharp", 3, 1, 2)]
+    character.armor = Armor("Cloth", "", 1, 1, 0)
+    character.travelers_outfit = [Item("Rain Boots", "", 1, 1), Item("おにぎり", "Rice ball", 1, 1)]
+    character.abilities[1] = ["Heal", "Song of Rest"]
+    character.abilities[2] = "Written by hand\non two lines"
+    return character
+
+
+def test_round_trip_keeps_schema_version():
+    character_dict = make_character().to_dict()
+    loaded = binary_format.loads(binary_format.dumps(character_dict))
+    assert loaded["schema_version"] == SCHEMA_VERSION
+    assert Character.from_dict(loaded).to_dict() == character_dict
+
+
+def test_round_trip_keeps_halves_and_ability_lists():
+    character = make_character()
+    character.dex.increase_die_size()  # d6 -> d8, value 4.5
+    character.spi.max_value = 3.5
+    character_dict = character.to_dict()
+    loaded = binary_format.loads(binary_format.dumps(character_dict))
+    assert loaded["dex"]["value"] == 4.5
+    assert loaded["spi"]["max"] == 3.5
+    assert loaded["abilities"][1] == ["Heal", "Song of Rest"]
+    assert loaded["abilities"][2] == "Written by hand\non two lines"
+    assert Character.from_dict(loaded).to_dict() == character_dict
+
+
+def test_rejects_other_format_versions():
+    data = bytearray(binary_format.dumps(make_character().to_dict()))
+    data[4] = binary_format.FORMAT_VERSION - 1
+    with pytest.raises(binary_format.BinaryFormatError):
+        binary_format.loads(bytes(data))
+
+
+def test_preview():
+    data = binary_format.dumps(make_character().to_dict())
+    assert binary_format.parse_preview(data) == {
+        "name": "Aoi", "level": 1, "character_class": "Minstrel", "type": ""
+    }
+
+
+def test_truncated_file():
+    data = binary_format.dumps(make_character().to_dict())
+    with pytest.raises(binary_format.BinaryFormatError):
+        binary_format.loads(data[:-3])
@@ -0,0 +1,24 @@
+"""
+Ryuutama Character Sheet - Character Save Form Tests
+Run with: python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.character import Character, SAVE_FIELDS, SCHEMA_VERSION
+from models.equipment import Weapon
+
+
+def test_to_dict_is_made_of_the_field_save_forms():
+    character = Character()
+    character.weapons = [Weapon("Light Blade", "", 3, 1, 2)]
+    data = character.to_dict()
+
+    assert list(data) == list(SAVE_FIELDS) + ["schema_version"]
+    assert data["schema_version"] == SCHEMA_VERSION
+    for field in SAVE_FIELDS:
+        assert data[field] == character.field_to_dict(field), field
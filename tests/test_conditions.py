@@ -0,0 +1,28 @@
+"""
+Ryuutama Character Sheet - Travel Conditions Tests
+Run with: python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.conditions import TRAVEL_CHECKS, TRAVEL_TABLE, TerrainEffect, WeatherEffect, travel_conditions
+
+
+def test_check_modifiers_count_all_once():
+    for (terrain, weather), conditions in TRAVEL_TABLE.items():
+        effects = [TerrainEffect(terrain).effects, WeatherEffect(weather).effects]
+        for check, stats in TRAVEL_CHECKS.items():
+            expected = sum(effect.get("all", 0) + sum(effect.get(stat, 0) for stat in set(stats))
+                           for effect in effects)
+            assert conditions.check_modifiers[check] == expected, (terrain, weather, check)
+
+
+def test_blizzard_check_modifiers():
+    conditions = travel_conditions("", "blizzard")
+    assert conditions.all_modifier == -1
+    assert conditions.stat_modifiers == {"str": 0, "dex": 0, "int": 0, "spi": 0}
+    assert conditions.check_modifiers == {"movement": -1, "direction": -1, "camp": -1}
@@ -0,0 +1,89 @@
+"""
+Ryuutama Character Sheet - Derived Stats Tests
+Run with: python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.character import Character
+from models.schema import load_character
+from models.stats import Stat
+
+
+def test_editing_a_stat_in_place_invalidates():
+    character = Character()
+    assert character.derived.get("max_hp") == 12
+    character.str["value"] = 8
+    assert character.derived.get("max_hp") == 16
+    character.str.value = 4
+    assert character.derived.get("max_hp") == 8
+
+
+def test_die_size_changes_invalidate():
+    character = Character()
+    assert character.derived.get("initiative") == 12
+    character.dex.increase_die_size()
+    assert character.derived.get("initiative") == 4.5 + 6
+    character.dex.decrease_die_size()
+    assert character.derived.get("initiative") == 3.5 + 6
+
+
+def test_assigned_and_loaded_stats_are_watched():
+    character = Character()
+    character.derived.get("max_mp")
+    character.spi = Stat("spi", 4, "d4")
+    assert character.derived.get("max_mp") == 8
+    character.spi["value"] = 10
+    assert character.derived.get("max_mp") == 20
+
+    loaded, errors = load_character(character.to_dict())
+    assert not errors
+    assert loaded.derived.get("max_mp") == 20
+    loaded.spi["value"] = 2
+    assert loaded.derived.get("max_mp") == 4
+
+
+def test_subscribers_are_told_about_edits():
+    character = Character()
+    seen = []
+    character.derived.subscribe("carrying_capacity", lambda name, value: seen.append(value))
+    character.str["value"] = 10
+    assert seen == [13]
+
+
+def test_set_stat_notifies_field_observers():
+    character = Character()
+    seen = []
+    character.subscribe("int", lambda field, value: seen.append(value.value))
+    assert character.set_stat("int", value=8)
+    assert seen == [8]
+    assert character.derived.get("direction_check") == 16
+
+
+def test_set_stat_stores_initiative_and_max_pools():
+    character = Character()
+    seen = []
+    character.subscribe("hp", lambda field, value: seen.append(value.max))
+    character.hp.current = 12
+    assert character.set_stat("str", value=4)
+    assert character.hp.max == 8
+    assert character.hp.current == 8
+    assert seen == [8]
+
+    character.set_stat("dex", value=8)
+    assert character.initiative == 14
+    assert character.to_dict()["initiative"] == 14
+
+
+def test_loaded_character_keeps_saved_values_until_edited():
+    character = Character()
+    character.initiative = 3
+    loaded, errors = load_character(character.to_dict())
+    assert loaded.initiative == 3
+    loaded.set_stat("spi", value=5)
+    assert loaded.initiative == 3
+    assert loaded.mp.max == 10
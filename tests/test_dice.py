@@ -0,0 +1,76 @@
+"""
+Ryuutama Character Sheet - Check Modifier Tests
+Run with: python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.character import Character
+from models.conditions import STAT_NAMES, StatusEffect, TERRAIN_TYPES, WEATHER_TYPES, TerrainEffect, WeatherEffect
+from models.dice import DiceEngine, check_modifier
+
+
+def make_character(*status_effects):
+    character = Character()
+    for effect_type in status_effects:
+        character.status_effects[effect_type] = True
+    return character
+
+
+def test_no_modifiers():
+    assert check_modifier(make_character(), ("str", "dex")) == 0
+
+
+def test_injury_applies_once_per_check():
+    character = make_character("injury")
+    assert check_modifier(character, ("str", "dex")) == -2
+    assert check_modifier(character, ("str", "spi")) == -2
+    assert check_modifier(character, ("int", "spi")) == 0
+
+
+def test_muddled_applies_once_per_check():
+    character = make_character("muddled")
+    assert check_modifier(character, ("int", "spi")) == -2
+    assert check_modifier(character, ("dex", "int")) == -2
+    assert check_modifier(character, ("str", "dex")) == 0
+
+
+def test_injury_and_muddled():
+    assert check_modifier(make_character("injury", "muddled"), ("str", "int")) == -4
+
+
+def test_travel_modifiers_match_direct_rules():
+    # "all" effects apply once per check, as when they were read from the effects directly
+    character = make_character()
+    pairs = [(first, second) for first in STAT_NAMES for second in STAT_NAMES]
+    for terrain in TERRAIN_TYPES:
+        for weather in WEATHER_TYPES:
+            effects = [TerrainEffect(terrain).effects, WeatherEffect(weather).effects]
+            for stats in pairs:
+                expected = sum(effect.get("all", 0) + sum(effect.get(stat, 0) for stat in set(stats))
+                               for effect in effects)
+                assert check_modifier(character, stats, terrain, weather) == expected, (terrain, weather, stats)
+
+
+def test_blizzard_applies_once():
+    character = make_character()
+    assert check_modifier(character, ("str", "dex"), weather="blizzard") == -1
+    assert check_modifier(character, ("int", "int"), "alpine", "blizzard") == 0
+    assert check_modifier(make_character("injury"), ("str", "dex"), weather="blizzard") == -3
+
+
+def test_roll_check_reports_criticals_and_fumbles():
+    totals, critical, fumble = DiceEngine(seed=1).roll_check("d4", "d6", modifier=1, count=10_000)
+    assert ((totals >= 3) & (totals <= 11)).all()
+    assert (critical == (totals == 11)).all()
+    assert (fumble == (totals == 3)).all()
+    assert critical.any() and fumble.any()
+
+
+def test_recovery_check_pairs_stat_with_spirit():
+    assert StatusEffect("poison").check_stats == ("str", "spi")
+    assert StatusEffect("muddled").check_stats == ("int", "spi")
@@ -0,0 +1,89 @@
+"""
+Ryuutama Character Sheet - Edit Journal Tests
+Run with: python -m pytest -q tests
+"""
+
+import json
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from controllers import edit_journal
+from controllers.edit_journal import EditJournal
+from models.character import Character
+from utils import save_header
+
+
+def read_save(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return save_header.strip_header(json.load(f))
+
+
+def write_save(save_dir, character):
+    save_path = os.path.join(save_dir, "character.json")
+    with open(save_path, 'w', encoding='utf-8') as f:
+        f.write(save_header.dumps_character(character.to_dict()))
+    return save_path
+
+
+def test_records_only_edited_fields(tmp_path):
+    character = Character()
+    save_path = write_save(tmp_path, character)
+    journal = EditJournal.for_save(tmp_path, save_path)
+    journal.start(save_path)
+
+    character.notes = "Crossed the river"
+    assert journal.record({"notes": character.field_to_dict("notes")}) == 1
+    assert journal.record({"notes": character.field_to_dict("notes")}) == 0
+    character.hp.current = 3
+    assert journal.record({"hp": character.field_to_dict("hp")}) == 1
+    journal.close()
+
+    state, restored_path, records = edit_journal.replay(journal.journal_path, read_save)
+    assert (restored_path, records) == (save_path, 2)
+    assert Character.from_dict(state).to_dict() == character.to_dict()
+
+
+def test_compaction_writes_a_fresh_save(tmp_path):
+    character = Character()
+    save_path = write_save(tmp_path, character)
+    journal = EditJournal.for_save(tmp_path, save_path)
+    journal.start(save_path)
+    character.name = "Aoi"
+    journal.record({"name": "Aoi"})
+
+    journal.compact(character.to_dict())
+    character.gold = 10
+    journal.record({"gold": 10})
+    journal.close()
+
+    # The user's save is untouched; the journal now applies to the fresh save
+    assert read_save(save_path)["name"] == ""
+    assert read_save(journal.compacted_path)["name"] == "Aoi"
+    state, restored_path, records = edit_journal.replay(journal.journal_path, read_save)
+    assert (restored_path, records) == (save_path, 1)
+    assert Character.from_dict(state).to_dict() == character.to_dict()
+
+    journal.discard()
+    assert not os.path.exists(journal.compacted_path)
+    assert not os.path.exists(journal.journal_path)
+
+
+def test_app_controller_journals_notified_fields(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    from controllers.app_controller import AppController
+
+    app_controller = AppController(None)
+    app_controller.character.gold -= 100
+    app_controller.notify_changed("buy item", "gold")
+    app_controller.mark_unsaved_changes()
+    app_controller.character.current_weather = "rain"
+    app_controller.mark_unsaved_changes("current_weather")
+    app_controller.journal.close()
+
+    state, _, records = edit_journal.replay(app_controller.journal.journal_path, read_save)
+    assert records == 2
+    assert state["gold"] == 900
+    assert state["current_weather"] == "rain"
@@ -0,0 +1,91 @@
+"""
+Ryuutama Character Sheet - Library Index Tests
+Run with: python -m pytest -q tests
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.library_index import LibraryIndex
+from utils.save_header import dumps_character
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_indexes_header_and_headerless_saves(tmp_path):
+    write(tmp_path / "aki.json", dumps_character({"name": "Aki", "level": 3, "character_class": "Minstrel"}))
+    write(tmp_path / "old.json", json.dumps({"name": "Old", "level": 1}))
+    index = LibraryIndex(str(tmp_path), db_path=str(tmp_path / "index.db"))
+
+    assert index.refresh() == 2
+    assert index.get(str(tmp_path / "aki.json"))["name"] == "Aki"
+    assert index.get(str(tmp_path / "old.json"))["name"] == "Old"
+    index.close()
+
+
+def test_rows_hold_the_content_hash(tmp_path):
+    path = tmp_path / "aki.json"
+    write(path, dumps_character({"name": "Aki"}))
+    index = LibraryIndex(str(tmp_path), db_path=str(tmp_path / "index.db"))
+    index.refresh()
+
+    assert index.get(str(path))["content_hash"] == hashlib.sha256(path.read_bytes()).hexdigest()
+    index.close()
+
+
+def test_unreadable_file_skipped_until_changed(tmp_path, capsys):
+    path = tmp_path / "broken.json"
+    write(path, "{not json")
+    index = LibraryIndex(str(tmp_path), db_path=str(tmp_path / "index.db"))
+
+    assert index.refresh() == 0
+    assert "Error indexing" in capsys.readouterr().out
+    assert index.refresh() == 0
+    assert capsys.readouterr().out == ""
+
+    write(path, dumps_character({"name": "Fixed"}))
+    assert index.refresh() == 1
+    assert index.get(str(path))["name"] == "Fixed"
+    index.close()
+
+
+def test_update_files_skips_unreadable_files_until_changed(tmp_path, capsys):
+    good = tmp_path / "aki.json"
+    broken = tmp_path / "broken.json"
+    write(good, dumps_character({"name": "Aki"}))
+    write(broken, "{not json")
+    index = LibraryIndex(str(tmp_path), db_path=str(tmp_path / "index.db"))
+    paths = [str(good), str(broken)]
+
+    assert index.update_files(paths) == 1
+    assert "Error indexing" in capsys.readouterr().out
+    assert index.update_files(paths) == 0
+    assert capsys.readouterr().out == ""
+    # The next refresh knows the broken file too
+    assert index.refresh() == 0
+    assert capsys.readouterr().out == ""
+    index.close()
+
+
+def test_preview_of_a_changed_save_is_indexed_again(tmp_path, monkeypatch):
+    from controllers.file_controller import FileController
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    file_controller = FileController()
+    path = os.path.join(file_controller.default_save_dir, "aki.json")
+    write(path, dumps_character({"name": "Aki", "level": 1}))
+    file_controller.library_index.refresh()
+
+    write(path, dumps_character({"name": "Aki", "level": 2, "notes": "Grew up"}))
+    assert file_controller.get_character_preview(path)["level"] == 2
+    assert file_controller.library_index.get(path)["level"] == 2
+    file_controller.library_index.close()
+    file_controller.save_worker.stop()
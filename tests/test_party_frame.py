@@ -0,0 +1,33 @@
+"""
+Ryuutama Character Sheet - Party Frame Tests
+Run with: python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.character import Character
+from models.party_frame import PartyFrame
+
+
+def test_half_values_are_kept():
+    character = Character()
+    character.dex.increase_die_size()  # d6 -> d8, value 4.5
+    frame = PartyFrame([character, Character()])
+
+    assert frame.stat("dex").tolist() == [4.5, 6]
+    derived = frame.compute()
+    assert derived["initiative"].tolist() == [character.dex.value + character.int.value, 12]
+
+
+def test_write_back_matches_the_character():
+    character = Character()
+    character.str.increase_die_size()  # d6 -> d8, value 4.5
+    PartyFrame([character]).write_back()
+
+    assert character.hp.max == 9
+    assert type(character.hp.max) is int
+    assert character.initiative == 12
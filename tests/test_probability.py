@@ -0,0 +1,44 @@
+"""
+Ryuutama Character Sheet - Check Probability Tests
+Run with: python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import probability
+from models.character import Character
+from models.dice import DiceEngine
+
+
+@pytest.fixture(autouse=True)
+def tables(tmp_path, monkeypatch):
+    # Keep the cache file out of the real save directory
+    monkeypatch.setattr(probability, "_tables", probability.ProbabilityTables(str(tmp_path / "cache.json")))
+    probability.success_chance.cache_clear()
+    yield
+    probability.success_chance.cache_clear()
+
+
+def make_character(die_size):
+    character = Character()
+    for stat_name in ("str", "dex", "int", "spi"):
+        getattr(character, stat_name).die_size = die_size
+    return character
+
+
+def test_poison_cure_chance_uses_the_pair_table():
+    # [STR + SPI] at d6 + d6 reaching 7: 21 of 36 outcomes
+    assert probability.cure_chance(make_character("d6"), "poison") == pytest.approx(21 / 36)
+
+
+def test_cure_chance_matches_the_dice_engine():
+    character = make_character("d8")
+    character.status_effects["injury"] = True
+    rates = DiceEngine(seed=2).character_check_rates(character, "str", "spi", 5, trials=400_000)
+    assert probability.cure_chance(character, "injury") == pytest.approx(rates["success"], abs=0.005)
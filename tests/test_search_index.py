@@ -0,0 +1,38 @@
+"""
+Ryuutama Character Sheet - Rulebook Search Tests
+Run with: python -m pytest -q tests
+"""
+
+import json
+import os
+import sys
+
+# Ensure we can import from parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import search_index
+from utils.search_index import SearchIndex
+
+
+def test_cached_index_does_not_collect_documents(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "search.json")
+    built = SearchIndex(cache_path)
+
+    def fail():
+        raise AssertionError("documents collected despite a current cache")
+    monkeypatch.setattr(search_index, "collect_documents", fail)
+    cached = SearchIndex(cache_path)
+
+    assert cached.documents == built.documents
+    assert cached.search("rain boots") == built.search("rain boots")
+
+
+def test_changed_source_rebuilds(tmp_path):
+    cache_path = tmp_path / "search.json"
+    SearchIndex(str(cache_path))
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    cache["stamp"][1][1] -= 1  # As if class_skills_data.py had been edited since
+    cache["documents"] = []
+    cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    assert SearchIndex(str(cache_path)).search("herb")
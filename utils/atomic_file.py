@@ -0,0 +1,55 @@
+"""
+Ryuutama Character Sheet - Atomic File Writes
+Write files through a temporary file and an atomic rename,
+so a crash mid-write never leaves a half-written save behind.
+"""
+
+import os
+import tempfile
+
+# Permissions used for new files (the temp file is created 0600)
+DEFAULT_FILE_MODE = 0o644
+
+
+def write_atomic(file_path, data):
+    """Write bytes to file_path via temp file + fsync + rename"""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    try:
+        mode = os.stat(file_path).st_mode & 0o777
+    except OSError:
+        mode = DEFAULT_FILE_MODE
+
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory):
+    """Make the rename durable (not supported on Windows)"""
+    if os.name != 'posix':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
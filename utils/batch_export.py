@@ -0,0 +1,204 @@
+"""
+Ryuutama Character Sheet - Batch PDF Export
+Headless export of a whole folder of character saves to PDF.
+
+Usage: python main.py export-pdf DIR [--jobs N] [--output OUT] [--force]
+
+Saves are rendered across a process pool; each worker imports ReportLab
+and builds its PDFExporter once. Workers read the saves and DIR/portraits
+directly and write nothing but the PDFs and the manifest, so the folder
+need not be the application's library. A manifest in the output folder records
+the content hash of every exported save, so unchanged characters are
+skipped on the next run.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils import binary_format
+from utils import save_header
+from utils.atomic_file import write_atomic
+from utils.library_index import SAVE_EXTENSIONS
+
+# Name of the manifest file inside the output folder
+MANIFEST_FILENAME = ".export_manifest.json"
+
+# Per-process state, set up by _init_worker()
+_exporter = None
+
+
+def _init_worker(directory):
+    """
+    Warm up a worker: import ReportLab and build the exporter once.
+    Portraits are read from the exported folder's own portrait store.
+    """
+    global _exporter
+    from utils.pdf_exporter import PDFExporter
+    from utils.portrait_store import PortraitStore
+
+    _exporter = PDFExporter(PortraitStore(directory))
+
+
+def load_save(save_path):
+    """
+    Load a JSON or binary save without touching the library: older saves
+    that point at an image file are not imported into the portrait store,
+    the PDF prints the image from where it is. Returns None on failure.
+    """
+    from models.schema import load_character
+
+    try:
+        if save_path.lower().endswith(binary_format.BINARY_EXTENSION):
+            with open(save_path, 'rb') as f:
+                character_dict = binary_format.loads(f.read())
+        else:
+            with open(save_path, 'r', encoding='utf-8') as f:
+                character_dict = save_header.strip_header(json.load(f))
+        character, errors = load_character(character_dict)
+    except Exception as e:
+        print(f"Error loading {save_path}: {e}")
+        return None
+
+    for path, message in errors:
+        print(f"Error in {save_path} at {path}: {message}")
+    return character
+
+
+def _export_one(save_path, pdf_path):
+    """Load one save and render it; returns (save_path, ok, load_seconds, render_seconds, error)"""
+    start = time.perf_counter()
+    character = load_save(save_path)
+    loaded = time.perf_counter()
+    if character is None:
+        return save_path, False, loaded - start, 0.0, "could not load save"
+
+    ok = _exporter.export_character(character, pdf_path)
+    rendered = time.perf_counter()
+    return save_path, ok, loaded - start, rendered - loaded, None if ok else "PDF export failed"
+
+
+def find_saves(directory):
+    """Character save files directly inside a directory, sorted by name"""
+    return sorted(
+        entry.path for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.endswith(SAVE_EXTENSIONS)
+    )
+
+
+def file_hash(file_path):
+    """SHA-256 of a file's content"""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def pdf_path_for(save_path, output_dir):
+    """Output PDF path for a save file"""
+    return os.path.join(output_dir, os.path.splitext(os.path.basename(save_path))[0] + ".pdf")
+
+
+def load_manifest(output_dir):
+    """Read the export manifest (save file name -> content hash)"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(output_dir, manifest):
+    """Write the export manifest"""
+    data = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+    write_atomic(os.path.join(output_dir, MANIFEST_FILENAME), data)
+
+
+def export_directory(directory, output_dir=None, jobs=None, force=False, report=print):
+    """
+    Export every save in a directory to PDF.
+    Returns (exported, skipped, failed) lists of save paths.
+    """
+    output_dir = output_dir or os.path.join(directory, "pdf")
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = max(1, jobs or os.cpu_count() or 1)
+
+    manifest = load_manifest(output_dir)
+    todo = []
+    skipped = []
+    hashes = {}
+    for save_path in find_saves(directory):
+        name = os.path.basename(save_path)
+        hashes[name] = file_hash(save_path)
+        if not force and manifest.get(name) == hashes[name] \
+                and os.path.exists(pdf_path_for(save_path, output_dir)):
+            skipped.append(save_path)
+        else:
+            todo.append(save_path)
+
+    exported = []
+    failed = []
+
+    def record(result):
+        save_path, ok, load_seconds, render_seconds, error = result
+        name = os.path.basename(save_path)
+        if ok:
+            exported.append(save_path)
+            manifest[name] = hashes[name]
+            report(f"{name:<40} load {load_seconds * 1000:7.1f} ms  render {render_seconds * 1000:7.1f} ms")
+        else:
+            failed.append(save_path)
+            manifest.pop(name, None)
+            report(f"{name:<40} FAILED: {error}")
+
+    if jobs == 1 or len(todo) <= 1:
+        if todo:
+            _init_worker(directory)
+        for save_path in todo:
+            record(_export_one(save_path, pdf_path_for(save_path, output_dir)))
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo)), initializer=_init_worker,
+                                 initargs=(directory,)) as pool:
+            futures = [pool.submit(_export_one, save_path, pdf_path_for(save_path, output_dir))
+                       for save_path in todo]
+            for future in as_completed(futures):
+                record(future.result())
+
+    # Forget saves that no longer exist
+    for name in list(manifest):
+        if name not in hashes:
+            del manifest[name]
+    save_manifest(output_dir, manifest)
+
+    return exported, skipped, failed
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(
+        prog="main.py export-pdf",
+        description="Export every character save in a folder to PDF."
+    )
+    parser.add_argument("directory", help="folder containing character saves")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--output", "-o", default=None,
+                        help="folder for the PDFs (default: DIRECTORY/pdf)")
+    parser.add_argument("--force", action="store_true",
+                        help="export all saves, even unchanged ones")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"Error: {args.directory} is not a directory", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    exported, skipped, failed = export_directory(args.directory, args.output, args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+
+    print(f"Exported {len(exported)}, skipped {len(skipped)} unchanged, "
+          f"{len(failed)} failed in {elapsed:.2f} s")
+    return 1 if failed else 0
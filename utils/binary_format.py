@@ -0,0 +1,393 @@
+"""
+Ryuutama Character Sheet - Binary Save Format
+Compact, stdlib-only alternative to the JSON save format (*.ryu files).
+
+Layout (little-endian):
+    fixed section    magic, version byte, level/exp/gold, stats (values as
+                     doubles, since die averages are halves), HP/MP,
+                     condition checks, status effect bits, equipment flags,
+                     schema version of the saved dictionary
+    string table     uint32 length per string, then the UTF-8 bytes
+    abilities        int32 per level: -1 for one text, else the number of
+                     texts in the level's list; then a text table of them
+    equipment        packed numeric records of the weapons, shield, armor
+                     and traveler's outfit, then a text table of the name,
+                     effect and rulebook catalog id of every entry
+
+A text table is a uint32 byte size, a uint32 length in characters per
+text, then the UTF-8 bytes of all texts, decoded in one go.
+
+Name, class and type come first in the string table, so a preview only
+needs the first few hundred bytes of a file. JSON remains the interchange
+format; this module converts to and from the same dictionaries as
+Character.to_dict(). The schema version is stored too, so loading a
+binary save does not run the schema migrations again.
+"""
+
+import struct
+
+BINARY_EXTENSION = ".ryu"
+
+MAGIC = b"RYUC"
+# Versions before 5 were never released and are not read
+FORMAT_VERSION = 5
+
+DIE_SIZES = ("d4", "d6", "d8", "d10", "d12", "d20")
+STATUS_EFFECTS = ("injury", "tired", "poison", "muddled", "sick", "shock")
+CONDITION_STATS = ("str", "dex", "int", "spi")
+
+# Strings stored in the string table, in order. The first three are the preview fields.
+STRING_FIELDS = (
+    "name", "character_class", "type", "player_name", "gender", "age",
+    "class_skill", "stats_used", "effect", "mastered_weapon", "specialized_terrain",
+    "personal_item", "current_terrain", "current_weather", "image_path",
+    "appearance", "hometown", "reason_for_travel", "notes", "portrait_id"
+)
+ABILITY_LEVELS = (1, 2, 3, 4, 5)
+# Ability count of a level stored as one text rather than a list
+SINGLE_TEXT = -1
+
+# Strings stored with each equipment entry
+EQUIPMENT_TEXTS = ("name", "effect", "catalog_id")
+
+HAS_SHIELD = 0x01
+HAS_ARMOR = 0x02
+
+# magic, version, level, exp, gold,
+# str/dex/int/spi (value, die index), str max/current, spi max/current,
+# hp max/current, mp max/current, initiative, fumble points,
+# condition checks (str, dex, int, spi), status effect bits, equipment flags,
+# weapon count, outfit count, schema version
+FIXED = struct.Struct("<4sBiii" + "dB" * 4 + "dddd" + "hhhh" + "hh" + "hhhh" + "BB" + "HH" + "H")
+MAGIC_AND_VERSION = struct.Struct("<4sB")
+STRING_LENGTHS = struct.Struct(f"<{len(STRING_FIELDS)}I")
+ABILITY_COUNTS = struct.Struct(f"<{len(ABILITY_LEVELS)}i")
+WEAPON = struct.Struct("<iii")  # durability, accuracy, damage
+SHIELD = struct.Struct("<ii")  # durability, defense
+ARMOR = struct.Struct("<iii")  # durability, defense points, penalty
+ITEM = struct.Struct("<ii")  # durability, size
+
+# Numeric fields of each equipment record, in the order of the structs above
+WEAPON_FIELDS = ("durability", "accuracy", "damage")
+SHIELD_FIELDS = ("durability", "defense")
+ARMOR_FIELDS = ("durability", "defense_points", "penalty")
+ITEM_FIELDS = ("durability", "size")
+
+# Bytes needed to read the preview fields (fixed section + lengths of the string table)
+PREVIEW_PREFIX_SIZE = FIXED.size + STRING_LENGTHS.size
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a file is not a valid binary character save"""
+
+
+def dumps(character_dict):
+    """Encode a character dictionary (Character.to_dict() format) to bytes"""
+    try:
+        return _dumps(character_dict)
+    except struct.error as e:
+        raise BinaryFormatError(f"Value out of range for binary format: {e}") from e
+
+
+def _dumps(character_dict):
+    stats = [character_dict.get(name, {}) for name in ("str", "dex", "int", "spi")]
+    str_stat, spi_stat = stats[0], stats[3]
+    hp = character_dict.get("hp", {})
+    mp = character_dict.get("mp", {})
+    condition_checks = character_dict.get("condition_checks", {})
+    status_effects = character_dict.get("status_effects", {})
+    weapons = character_dict.get("weapons") or []
+    shield = character_dict.get("shield")
+    armor = character_dict.get("armor")
+    outfit = character_dict.get("travelers_outfit") or []
+
+    status_bits = 0
+    for bit, effect_name in enumerate(STATUS_EFFECTS):
+        if status_effects.get(effect_name):
+            status_bits |= 1 << bit
+
+    flags = (HAS_SHIELD if shield else 0) | (HAS_ARMOR if armor else 0)
+
+    stat_values = []
+    for stat in stats:
+        stat_values.append(_float(stat.get("value", 6), "stat value"))
+        stat_values.append(_die_index(stat.get("die_size", "d6")))
+
+    fixed = FIXED.pack(
+        MAGIC, FORMAT_VERSION,
+        _int(character_dict.get("level", 1), "level"),
+        _int(character_dict.get("exp", 0), "exp"),
+        _int(character_dict.get("gold", 0), "gold"),
+        *stat_values,
+        _float(str_stat.get("max", str_stat.get("value", 6)), "str max"),
+        _float(str_stat.get("current", str_stat.get("value", 6)), "str current"),
+        _float(spi_stat.get("max", spi_stat.get("value", 6)), "spi max"),
+        _float(spi_stat.get("current", spi_stat.get("value", 6)), "spi current"),
+        _int(hp.get("max", 0), "hp max"),
+        _int(hp.get("current", 0), "hp current"),
+        _int(mp.get("max", 0), "mp max"),
+        _int(mp.get("current", 0), "mp current"),
+        _int(character_dict.get("initiative", 0), "initiative"),
+        _int(character_dict.get("fumble_points", 0), "fumble points"),
+        *(_int(condition_checks.get(stat, 0), "condition check") for stat in CONDITION_STATS),
+        status_bits, flags,
+        len(weapons), len(outfit),
+        _int(character_dict.get("schema_version", 1), "schema version")
+    )
+
+    strings = [_text(character_dict.get(field, "")) for field in STRING_FIELDS]
+    encoded = [s.encode("utf-8") for s in strings]
+
+    parts = [fixed, STRING_LENGTHS.pack(*(len(b) for b in encoded))]
+    parts.extend(encoded)
+
+    abilities = character_dict.get("abilities") or {}
+    counts = []
+    texts = []
+    for level in ABILITY_LEVELS:
+        count, level_texts = _ability_texts(abilities, level)
+        counts.append(count)
+        texts.extend(level_texts)
+    parts.append(ABILITY_COUNTS.pack(*counts))
+    _pack_text_table(texts, parts)
+
+    texts = []
+    for record, fields, label, entries in (
+            (WEAPON, WEAPON_FIELDS, "weapon", weapons),
+            (SHIELD, SHIELD_FIELDS, "shield", [shield] if shield else []),
+            (ARMOR, ARMOR_FIELDS, "armor", [armor] if armor else []),
+            (ITEM, ITEM_FIELDS, "item", outfit)):
+        for entry in entries:
+            parts.append(record.pack(*(
+                _int(entry.get(field, 0), f"{label} {field.replace('_', ' ')}") for field in fields
+            )))
+            texts.extend(_text(entry.get(key, "")) for key in EQUIPMENT_TEXTS)
+    _pack_text_table(texts, parts)
+
+    return b"".join(parts)
+
+
+def loads(data):
+    """Decode bytes produced by dumps() back to a character dictionary"""
+    try:
+        return _loads(memoryview(data))
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise BinaryFormatError(f"Corrupt binary character file: {e}") from e
+
+
+def _loads(view):
+    fields = _unpack_fixed(view)
+    (level, exp, gold,
+     str_value, str_die, dex_value, dex_die, int_value, int_die, spi_value, spi_die,
+     str_max, str_current, spi_max, spi_current,
+     hp_max, hp_current, mp_max, mp_current,
+     initiative, fumble_points,
+     check_str, check_dex, check_int, check_spi,
+     status_bits, flags, weapon_count, outfit_count, schema_version) = fields
+
+    offset = FIXED.size
+    lengths = STRING_LENGTHS.unpack_from(view, offset)
+    offset += STRING_LENGTHS.size
+
+    strings = []
+    for length in lengths:
+        end = offset + length
+        strings.append(str(view[offset:end], "utf-8"))
+        offset = end
+    character_dict = dict(zip(STRING_FIELDS, strings))
+
+    counts = ABILITY_COUNTS.unpack_from(view, offset)
+    offset += ABILITY_COUNTS.size
+    if min(counts) < SINGLE_TEXT:
+        raise BinaryFormatError("Binary character file has a negative ability count")
+    texts, offset = _unpack_text_table(view, offset, sum(1 if count == SINGLE_TEXT else count for count in counts))
+    abilities = {}
+    index = 0
+    for ability_level, count in zip(ABILITY_LEVELS, counts):
+        if count == SINGLE_TEXT:
+            abilities[ability_level] = texts[index]
+            index += 1
+        else:
+            abilities[ability_level] = texts[index:index + count]
+            index += count
+
+    character_dict.update({
+        "schema_version": schema_version,
+        "level": level,
+        "exp": exp,
+        "gold": gold,
+        "str": {"value": _number(str_value), "die_size": DIE_SIZES[str_die],
+                "max": _number(str_max), "current": _number(str_current)},
+        "dex": {"value": _number(dex_value), "die_size": DIE_SIZES[dex_die]},
+        "int": {"value": _number(int_value), "die_size": DIE_SIZES[int_die]},
+        "spi": {"value": _number(spi_value), "die_size": DIE_SIZES[spi_die],
+                "max": _number(spi_max), "current": _number(spi_current)},
+        "hp": {"max": hp_max, "current": hp_current},
+        "mp": {"max": mp_max, "current": mp_current},
+        "initiative": initiative,
+        "fumble_points": fumble_points,
+        "condition_checks": dict(zip(CONDITION_STATS, (check_str, check_dex, check_int, check_spi))),
+        "status_effects": {name: bool(status_bits & (1 << bit)) for bit, name in enumerate(STATUS_EFFECTS)},
+        "abilities": abilities,
+    })
+
+    offset = _unpack_equipment(view, offset, character_dict, weapon_count,
+                               bool(flags & HAS_SHIELD), bool(flags & HAS_ARMOR), outfit_count)
+    if offset != len(view):
+        raise BinaryFormatError("Binary character file has an unexpected length")
+    return character_dict
+
+
+def parse_preview(data):
+    """
+    Read name, level, class and type from the start of a binary save.
+    Returns None if data does not hold a complete preview.
+    """
+    try:
+        view = memoryview(data)
+        fields = _unpack_fixed(view)
+        lengths = STRING_LENGTHS.unpack_from(view, FIXED.size)
+        offset = FIXED.size + STRING_LENGTHS.size
+        preview_strings = []
+        for length in lengths[:3]:
+            end = offset + length
+            if end > len(view):
+                return None
+            preview_strings.append(str(view[offset:end], "utf-8"))
+            offset = end
+    except (struct.error, BinaryFormatError, UnicodeDecodeError):
+        return None
+
+    name, character_class, character_type = preview_strings
+    return {"name": name, "level": fields[0], "character_class": character_class, "type": character_type}
+
+
+def read_preview(file_path, max_bytes=4096):
+    """Read only the preview fields of a binary save"""
+    with open(file_path, "rb") as f:
+        data = f.read(PREVIEW_PREFIX_SIZE)
+        preview = parse_preview(data)
+        if preview is None:
+            # Long names: read a little more
+            data += f.read(max_bytes)
+            preview = parse_preview(data)
+    return preview
+
+
+def _unpack_fixed(view):
+    """Unpack and check the fixed section; returns the fields after magic and version"""
+    magic, version = MAGIC_AND_VERSION.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise BinaryFormatError("Not a Ryuutama binary character file")
+    if version != FORMAT_VERSION:
+        raise BinaryFormatError(f"Unsupported binary format version {version}")
+    return FIXED.unpack_from(view, 0)[2:]
+
+
+def _unpack_equipment(view, offset, character_dict, weapon_count, has_shield, has_armor, outfit_count):
+    """Read the equipment section into character_dict; returns the new offset"""
+    kinds = ((WEAPON, WEAPON_FIELDS, weapon_count), (SHIELD, SHIELD_FIELDS, has_shield),
+             (ARMOR, ARMOR_FIELDS, has_armor), (ITEM, ITEM_FIELDS, outfit_count))
+    records = []
+    for record, fields, count in kinds:
+        end = offset + record.size * count
+        records.append(record.iter_unpack(view[offset:end]))
+        offset = end
+
+    text_count = len(EQUIPMENT_TEXTS) * (weapon_count + has_shield + has_armor + outfit_count)
+    texts, end = _unpack_text_table(view, offset, text_count)
+
+    index = 0
+    text_count = len(EQUIPMENT_TEXTS)
+    entries = []
+    for (record, fields, count), numbers in zip(kinds, records):
+        keys = EQUIPMENT_TEXTS + fields
+        kind_entries = []
+        for values in numbers:
+            kind_entries.append(dict(zip(keys, (*texts[index:index + text_count], *values))))
+            index += text_count
+        entries.append(kind_entries)
+
+    weapons, shields, armors, outfit = entries
+    character_dict["weapons"] = weapons
+    character_dict["shield"] = shields[0] if shields else None
+    character_dict["armor"] = armors[0] if armors else None
+    character_dict["travelers_outfit"] = outfit
+    return end
+
+
+def _pack_text_table(texts, parts):
+    """Append a text table of texts to parts"""
+    encoded = "".join(texts).encode("utf-8")
+    parts.append(struct.pack(f"<I{len(texts)}I", len(encoded), *(len(text) for text in texts)))
+    parts.append(encoded)
+
+
+def _unpack_text_table(view, offset, count):
+    """Read a text table of count texts; returns (texts, new_offset)"""
+    # All texts are decoded at once and cut by their lengths in characters
+    lengths = struct.unpack_from(f"<I{count}I", view, offset)
+    offset += 4 * (count + 1)
+    end = offset + lengths[0]
+    if end > len(view):
+        raise BinaryFormatError("Binary character file is truncated")
+    text = str(view[offset:end], "utf-8")
+
+    texts = []
+    position = 0
+    for length in lengths[1:]:
+        texts.append(text[position:position + length])
+        position += length
+    if position != len(text):
+        raise BinaryFormatError("Text lengths do not match the text table")
+    return texts, end
+
+
+def _int(value, field):
+    """Convert a numeric field, with a readable error for values the format can't hold"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise BinaryFormatError(f"{field} must be a whole number to save in binary format, got {value!r}")
+
+
+def _float(value, field):
+    """Convert a stat field, which may hold halves from die averages"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise BinaryFormatError(f"{field} must be a number to save in binary format, got {value!r}")
+    return float(value)
+
+
+def _number(value):
+    """Stored stat field back to an int when it is whole"""
+    return int(value) if value.is_integer() else value
+
+
+def _die_index(die_size):
+    """Index of a die size in DIE_SIZES"""
+    try:
+        return DIE_SIZES.index(die_size)
+    except ValueError:
+        raise BinaryFormatError(f"Unknown die size {die_size!r}")
+
+
+def _text(value):
+    """Strings are stored as-is; None becomes empty"""
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _ability_texts(abilities, level):
+    """
+    (count, texts) of a level's abilities: a list keeps its entries, a single
+    text gets SINGLE_TEXT. Abilities are keyed by int in memory but by str
+    after a JSON round trip.
+    """
+    value = abilities.get(level, abilities.get(str(level), []))
+    if not isinstance(value, list):
+        return SINGLE_TEXT, [_text(value)]
+    for text in value:
+        if not isinstance(text, str):
+            raise BinaryFormatError(f"abilities of level {level} must be text, got {text!r}")
+    return len(value), value
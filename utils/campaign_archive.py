@@ -0,0 +1,238 @@
+"""
+Ryuutama Character Sheet - Campaign Archive
+Export and import a whole character library as a single zip file.
+
+Archive layout:
+    characters/<save file>          JSON or binary saves, stored as-is
+    portraits/<id>/ui.png           portrait renditions, once per portrait
+    portraits/<id>/print.png
+    campaign.json                   manifest, written last
+
+Entries are streamed one at a time in both directions, so memory use does
+not grow with the size of the campaign.
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+
+from models.schema import load_character
+from utils import binary_format, save_header
+from utils.atomic_file import write_atomic
+from utils.library_index import SAVE_EXTENSIONS
+from utils.portrait_store import PORTRAIT_DIRNAME, UI_FILENAME, PRINT_FILENAME
+
+ARCHIVE_FORMAT = 1
+MANIFEST_NAME = "campaign.json"
+CHARACTERS_DIR = "characters"
+
+# Saves larger than this are rejected on import
+MAX_SAVE_SIZE = 16 * 1024 * 1024
+# Portrait renditions larger than this are rejected on import
+MAX_PORTRAIT_SIZE = 8 * 1024 * 1024
+
+# Library index rows are committed in batches during import
+INDEX_BATCH = 100
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PORTRAIT_ENTRY = re.compile(
+    rf"^{PORTRAIT_DIRNAME}/([0-9a-f]{{64}})/({re.escape(UI_FILENAME)}|{re.escape(PRINT_FILENAME)})$"
+)
+
+
+class CampaignArchiveError(Exception):
+    """Raised when an archive cannot be read as a campaign archive"""
+
+
+def export_campaign(file_controller, archive_path, progress=None):
+    """
+    Write every save in the library (and the portraits they use) to a zip archive.
+    progress(done, total, name) is called after each character.
+    Returns (character_count, portrait_count).
+    """
+    save_dir = file_controller.default_save_dir
+    portrait_store = file_controller.portrait_store
+    save_names = sorted(
+        entry.name for entry in os.scandir(save_dir)
+        if entry.is_file() and entry.name.endswith(SAVE_EXTENSIONS)
+    )
+
+    written_portraits = set()
+    with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, name in enumerate(save_names, start=1):
+            save_path = os.path.join(save_dir, name)
+            if file_controller.is_binary_save(name):
+                # Already compact; don't spend time deflating it
+                archive.write(save_path, f"{CHARACTERS_DIR}/{name}", compress_type=zipfile.ZIP_STORED)
+            else:
+                archive.write(save_path, f"{CHARACTERS_DIR}/{name}")
+
+            portrait_id = _portrait_id(file_controller, save_path)
+            if portrait_id and portrait_id not in written_portraits and portrait_store.has(portrait_id):
+                # PNGs are already compressed
+                for rendition in (portrait_store.ui_path(portrait_id), portrait_store.print_path(portrait_id)):
+                    archive.write(
+                        rendition,
+                        f"{PORTRAIT_DIRNAME}/{portrait_id}/{os.path.basename(rendition)}",
+                        compress_type=zipfile.ZIP_STORED
+                    )
+                written_portraits.add(portrait_id)
+
+            if progress:
+                progress(index, len(save_names), name)
+
+        manifest = {
+            "format": ARCHIVE_FORMAT,
+            "characters": len(save_names),
+            "portraits": len(written_portraits)
+        }
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+
+    return len(save_names), len(written_portraits)
+
+
+def import_campaign(file_controller, archive_path, progress=None):
+    """
+    Extract a campaign archive into the library, validating and indexing
+    each character as it is extracted. Saves whose name is already taken
+    by a different character are imported under a new name; identical
+    saves and portraits that are already present are skipped.
+    progress(done, total, name) is called after each entry.
+    Returns (imported, skipped, errors) where errors is a list of (entry, message).
+    """
+    library_index = file_controller.library_index
+    imported = 0
+    skipped = 0
+    errors = []
+    pending_index = []
+
+    try:
+        archive = zipfile.ZipFile(archive_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        raise CampaignArchiveError(f"Not a campaign archive: {e}") from e
+
+    with archive:
+        _check_manifest(archive)
+        entries = [info for info in archive.infolist() if not info.is_dir() and info.filename != MANIFEST_NAME]
+
+        for index, info in enumerate(entries, start=1):
+            try:
+                if info.filename.startswith(CHARACTERS_DIR + "/"):
+                    save_path = _import_save(file_controller, archive, info)
+                    if save_path is None:
+                        skipped += 1
+                    else:
+                        imported += 1
+                        pending_index.append(save_path)
+                elif PORTRAIT_ENTRY.match(info.filename):
+                    if _import_portrait(file_controller.portrait_store, archive, info):
+                        imported += 1
+                    else:
+                        skipped += 1
+                else:
+                    raise ValueError("unexpected entry")
+            except (OSError, ValueError, TypeError, AttributeError, zipfile.BadZipFile) as e:
+                errors.append((info.filename, str(e)))
+
+            if len(pending_index) >= INDEX_BATCH:
+                library_index.update_files(pending_index)
+                pending_index = []
+
+            if progress:
+                progress(index, len(entries), info.filename)
+
+    if pending_index:
+        library_index.update_files(pending_index)
+
+    return imported, skipped, errors
+
+
+def _check_manifest(archive):
+    """Make sure the archive was written by a compatible version"""
+    try:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+    except KeyError as e:
+        raise CampaignArchiveError("Not a campaign archive: campaign.json is missing") from e
+    except ValueError as e:
+        raise CampaignArchiveError(f"Invalid campaign.json: {e}") from e
+
+    if not isinstance(manifest, dict) or manifest.get("format") != ARCHIVE_FORMAT:
+        raise CampaignArchiveError("Unsupported campaign archive version")
+
+
+def _portrait_id(file_controller, save_path):
+    """Portrait id referenced by a save, or "" """
+    try:
+        character_dict = file_controller.read_character_dict(save_path)
+    except (OSError, ValueError) as e:
+        print(f"Error reading character file {save_path}: {e}")
+        return ""
+    return character_dict.get("portrait_id") or ""
+
+
+def _import_save(file_controller, archive, info):
+    """Validate and extract one save; returns its new path, or None if it was already present"""
+    name = info.filename[len(CHARACTERS_DIR) + 1:]
+    if "/" in name or "\\" in name or name.startswith(".") or not name.endswith(SAVE_EXTENSIONS):
+        raise ValueError("invalid save file name")
+    if info.file_size > MAX_SAVE_SIZE:
+        raise ValueError("save file is too large")
+
+    data = archive.read(info)
+    _validate_save(name, data)
+
+    destination = os.path.join(file_controller.default_save_dir, name)
+    stem, extension = os.path.splitext(name)
+    copy_number = 1
+    while os.path.exists(destination):
+        with open(destination, 'rb') as f:
+            if f.read() == data:
+                return None
+        copy_number += 1
+        destination = os.path.join(file_controller.default_save_dir, f"{stem} ({copy_number}){extension}")
+
+    write_atomic(destination, data)
+    return destination
+
+
+def _validate_save(name, data):
+    """Check that a save decodes to a character; raises ValueError otherwise"""
+    if name.endswith(binary_format.BINARY_EXTENSION):
+        character_dict = binary_format.loads(data)
+    else:
+        character_dict = json.loads(data.decode("utf-8"))
+    if not isinstance(character_dict, dict):
+        raise ValueError("not a character save")
+    save_header.strip_header(character_dict)
+    load_character(character_dict, strict=True)
+
+
+def _import_portrait(portrait_store, archive, info):
+    """Extract one portrait rendition unless the store already has it; returns True if extracted"""
+    portrait_id, filename = PORTRAIT_ENTRY.match(info.filename).groups()
+    destination = os.path.join(portrait_store.portrait_dir(portrait_id), filename)
+    if os.path.exists(destination):
+        return False
+    if info.file_size > MAX_PORTRAIT_SIZE:
+        raise ValueError("portrait is too large")
+
+    os.makedirs(portrait_store.portrait_dir(portrait_id), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix=".tmp",
+                                     dir=portrait_store.portrait_dir(portrait_id))
+    try:
+        with os.fdopen(fd, 'wb') as target, archive.open(info) as source:
+            if source.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+                raise ValueError("portrait is not a PNG image")
+            target.write(PNG_SIGNATURE)
+            shutil.copyfileobj(source, target)
+        os.replace(temp_path, destination)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return True
@@ -0,0 +1,163 @@
+"""
+Ryuutama Character Sheet - Equipment Data
+This module contains the rulebook's weapons, armor, shields and items
+"""
+
+# Weapons data (name, price, size, equip, accuracy, damage, description)
+WEAPONS = {
+    "Light Blade": {
+        "price": 400, "size": 1, "equip": "1 hand",
+        "accuracy": "DEX + INT +1", "damage": "INT -1",
+        "description": "A blade that can be held in the hand. It can be useful outside of combat in the preparation of food, harvesting herbs, and various other situations."
+    },
+    "Blade": {
+        "price": 700, "size": 3, "equip": "1 hand",
+        "accuracy": "DEX + STR", "damage": "STR",
+        "description": "A weapon with a long, flat blade. Beloved around the world, a single-edged blade is called a \"saber\" while double-edged blade is called a \"sword\"."
+    },
+    "Polearm": {
+        "price": 350, "size": 3, "equip": "2 hands",
+        "accuracy": "DEX + STR", "damage": "STR +1",
+        "description": "A weapon consisting of a long pole with a sharp point fastened at the end. As it can be used to stab with the tip or bash with the handle, it has a wide breadth of usefulness. Its price also makes it easy to obtain."
+    },
+    "Axe": {
+        "price": 500, "size": 3, "equip": "2 hands",
+        "accuracy": "STR + STR -1", "damage": "STR",
+        "description": "A tool used to cut down trees. Due to its weight, it is powered with brute strength, and not effective with small swings."
+    },
+    "Bow": {
+        "price": 750, "size": 3, "equip": "2 hands",
+        "accuracy": "INT + DEX -2", "damage": "DEX",
+        "description": "A projectile tool used by hunters and the like. Since it can attack from afar, it is popular with nobles and soldiers. *Players don't need to keep track of arrows"
+    }
+}
+
+# Armor data (name, price, size, equip, defense, penalty, description)
+ARMOR = {
+    "Clothes": {
+        "price": 50, "size": 3, "equip": "Chest",
+        "defense": 0, "penalty": 0,
+        "description": "Normal clothes. Thick, tough clothing is preferred by travelers. Generally they are made from wool and thread."
+    },
+    "Light Armor": {
+        "price": 900, "size": 3, "equip": "Chest",
+        "defense": 1, "penalty": 0,
+        "description": "Armor constructed from the hide of animals, with metal plates covering vital points. Only the chest is protected, but because of its light weight it is easily worn."
+    },
+    "Medium Armor": {
+        "price": 2000, "size": 5, "equip": "Chest",
+        "defense": 2, "penalty": -1,
+        "description": "Armor constructed from metal plates. The arms and legs are protected in addition to the chest area, but the weight increases proportionally."
+    },
+    "Heavy Armor": {
+        "price": 10000, "size": 5, "equip": "Chest",
+        "defense": 3, "penalty": -3,
+        "description": "Heavy armor constructed from metal plates that completely covers the entire body. The body's movement is restricted, so movement is hampered with the armor equipped."
+    }
+}
+
+# Shield data (name, price, size, equip, defense, penalty, dodge, description)
+SHIELDS = {
+    "Light shield": {
+        "price": 400, "size": 3, "equip": "1 hand",
+        "defense": 1, "penalty": 0, "dodge": 7,
+        "description": "A shield that can be held in one hand. Made from wood and grass, its light weight keeps it from being a nuisance in battle."
+    },
+    "Heavy shield": {
+        "price": 1200, "size": 3, "equip": "1 hand",
+        "defense": 2, "penalty": -1, "dodge": 9,
+        "description": "A shield large enough to cast half of the body in shadow. Most of them are made from metal; its heavy weight makes it hard to carry."
+    }
+}
+
+# Items data (grouped by category)
+ITEMS = {
+    "Shoes": {
+        "Rain boots": {"price": 300, "size": 1, "bonus": "Rain/Hard Rain/Storm",
+                       "description": "These boots have been finished with a coating that makes them resistant to water. They do a good job of keeping your feet dry."},
+        "Walking shoes": {"price": 350, "size": 1, "bonus": "On a road",
+                          "description": "These shoes are made from soft leather that make it easy to walk on paved surfaces. They are very lightweight and do not impede the movement of your feet."},
+        "Climbing shoes": {"price": 450, "size": 1, "bonus": "Wasteland/Rocky Terrain/Mountain/Alpine",
+                           "description": "These shoes have thick soles that allow walking across rocky terrain without hurting your feet. The soles also help to keep your feet from slipping."},
+        "Snow boots": {"price": 500, "size": 1, "bonus": "Snow/Blizzard",
+                       "description": "These shoes are specially finished to protect toes from frostbite."},
+        "Mud boots": {"price": 500, "size": 1, "bonus": "Swamp",
+                      "description": "These boots have wide soles that keep your feet from sinking into mud. They allow you to glide across the surface of the mud."},
+        "Jungle boots": {"price": 600, "size": 1, "bonus": "Woods/Deep Forest/Jungle",
+                         "description": "These boots are made to help you traverse overgrown jungles. They offer complete protection for your feet and are extremely sturdy."}
+    },
+    "Capes": {
+        "Windbreaker": {"price": 120, "size": 3, "bonus": "Strong wind",
+                        "description": "A cape with a hood that covers the entire body. Weights are stitched into the cape to keep it from flapping around in the wind."},
+        "Warm cape": {"price": 160, "size": 3, "bonus": "Cold",
+                      "description": "A cape made from the pelt of a thickly-furred animal. It can also be used as bedding or a blanket."},
+        "Raincoat": {"price": 400, "size": 3, "bonus": "Rain/Hard rain/Snow",
+                     "description": "A leather cape that has been finished with a water-resistant coating. It requires constant upkeep."},
+        "Camo cape": {"price": 400, "size": 3, "bonus": "Hide check +1 for chosen Terrain",
+                      "description": "Choose a terrain when purchasing this item. This cape allows you to conceal your entire body by blending into the surrounding topography."},
+        "Fire cape": {"price": 700, "size": 3, "bonus": "-1 fire damage",
+                      "description": "A cape made from the fur of a fire-resistant monster. It is weak to water: If it gets wet, it will be ruined."},
+        "Sun cape": {"price": 400, "size": 3, "bonus": "Hot",
+                     "description": "A cape made from a light, very breathable material that keeps heat from reaching inside."}
+    },
+    "Staffs": {
+        "Walking stick": {"price": 50, "size": 3, "bonus": "Level 3 or lower Terrain",
+                          "description": "A staff that is used by frail travelers. It is also useful when you have heavy bags. Its bonus only applies to weaker characters with STR of 4."},
+        "Hiking staff": {"price": 100, "size": 3, "bonus": "Rocky terrain/Mountain",
+                         "description": "A staff that helps you keep your footing when climbing in high places. You can adjust the length."},
+        "Snow staff": {"price": 280, "size": 3, "bonus": "Snow",
+                       "description": "A staff used to dig through snow. The tip is reinforced with metal to help break through ice."}
+    },
+    "Hats": {
+        "Cap": {"price": 120, "size": 1, "bonus": "-",
+                "description": "A normal hat. Hats and caps are believed to offer protection from evil. There are a variety of colors and shapes."},
+        "Sun hat": {"price": 180, "size": 1, "bonus": "Hot",
+                    "description": "A hat with a large brim to block sunlight. It is made from linen and thread for extra breathability."},
+        "Woolen hat": {"price": 200, "size": 1, "bonus": "Cold",
+                       "description": "A hat made from the pelt of a thickly-furred animal. It has ear covers to protect from frostbite."},
+        "Sand hood": {"price": 340, "size": 1, "bonus": "Desert",
+                      "description": "A hood that keeps wind and sandstorms from obscuring your vision. The material is thick and heavy but does not let direct sunlight through."}
+    },
+    "Accessories": {
+        "Goggles": {"price": 4000, "size": 1, "bonus": "All Rain, Wind and Snow and related conditions",
+                    "description": "A tool used to protect your eyes during rain, wind, snow, or other extreme weather. Since numerous techniques are required to create a single pair, the cost can be prohibitive."},
+        "Accessory": {"price": 100, "size": 1, "bonus": "-",
+                      "description": "Rings, earrings, bracelets, or any other decorative accessory. These can be created from metal, clam shells, seeds, or any other element that shows off the special colors of the land where it was created."}
+    },
+    "Containers": {
+        "Waterskin": {"price": 30, "size": 1, "capacity": "-",
+                      "description": "A pouch of leather that can hold a day's ration of water"},
+        "Magic jar": {"price": 2000, "size": 1, "capacity": "-",
+                      "description": "A magical jar that keeps cold liquids cold or hot liquids hot: +1 Travel. Check while in hot/cold weather"},
+        "Travel bag": {"price": 10, "size": 1, "capacity": "3",
+                       "description": "A bag held in 1 hand"},
+        "Belt pouch": {"price": 30, "size": 1, "capacity": "2",
+                       "description": "Only one can be equipped. Good when you want to be able to grab something quickly"},
+        "Herb bottle": {"price": 100, "size": 3, "capacity": "-",
+                        "description": "Magically keeps up to ten herbs fresh; once opened for the first time, the bottle is good for seven days before it no longer works."}
+    },
+    "Big Containers": {
+        "Barrel": {"price": 10, "size": 5, "capacity": "10",
+                   "description": "Holds 15 days worth of water, or holds 10 size worth of other items."},
+        "Backpack": {"price": 20, "size": 3, "capacity": "5",
+                     "description": "A rucksack used by many travelers"},
+        "Large Backpack": {"price": 40, "size": 5, "capacity": "10",
+                           "description": "Large rucksack that holds many items"},
+        "Wooden chest": {"price": 10, "size": 5, "capacity": "15",
+                         "description": "If carried by a human, they take a -1 penalty to Travel Checks"}
+    },
+    "Rations": {
+        "Food": {"price": 5, "size": 1,
+                 "description": "A single day's ration of food. Goes bad in 24 hours."},
+        "Alcohol": {"price": 10, "size": 1,
+                    "description": "If drunk when a character's Condition is 3 or less, gain [Muddled: 4]"},
+        "Disgusting Rations": {"price": 5, "size": 1,
+                               "description": "Disgusting but edible. If eaten when character's Condition is 3 or less, lose half current MP"},
+        "Rations": {"price": 10, "size": 1,
+                    "description": "Portable food that can be taken on a trip"},
+        "Delicious Rations": {"price": 70, "size": 1,
+                              "description": "When eaten, next day's Condition check gains a +1 bonus."},
+        "Animal Feed": {"price": 5, "size": 1,
+                        "description": "Needed when taking animals to the barren desert or alpine environments"}
+    }
+}
@@ -0,0 +1,313 @@
+"""
+Ryuutama Character Sheet - Library Index
+Persistent SQLite index of the character saves in the save directory
+
+Indexing a save parses only its preview header (JSON saves written before
+headers existed are parsed in full) and hashes its bytes. Files that
+cannot be read are remembered with their mtime and size and skipped
+until they change.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+
+from utils.save_header import parse_header
+from utils import binary_format
+
+# Name of the index database inside the save directory
+INDEX_FILENAME = ".library_index.sqlite3"
+
+# File extensions that are treated as character saves
+SAVE_EXTENSIONS = (".json", binary_format.BINARY_EXTENSION)
+
+
+class LibraryIndex:
+    """Persistent index of character save files (name, level, class, type, mtime, size, hash)"""
+
+    SCHEMA_VERSION = 3
+
+    def __init__(self, save_dir, db_path=None):
+        self.save_dir = save_dir
+        self.db_path = db_path or os.path.join(save_dir, INDEX_FILENAME)
+        self._connection = None
+
+    @property
+    def connection(self):
+        """Open the database on first use and make sure the schema is current"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path)
+            self._connection.row_factory = sqlite3.Row
+            self._ensure_schema()
+        return self._connection
+
+    def _ensure_schema(self):
+        """Create the tables, rebuilding them if the schema version changed"""
+        connection = self._connection
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS characters")
+            connection.execute("DROP TABLE IF EXISTS unreadable")
+
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS characters (
+                file_path TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                level INTEGER NOT NULL,
+                character_class TEXT NOT NULL,
+                type TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL
+            )
+        """)
+        # Save files that could not be read, skipped until their mtime or size changes
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS unreadable (
+                file_path TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_characters_mtime ON characters (mtime)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_characters_class ON characters (character_class)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_characters_level ON characters (level)")
+        connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        connection.commit()
+
+    def close(self):
+        """Close the database connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def refresh(self):
+        """
+        Bring the index up to date with the save directory.
+        Only files whose mtime or size changed since the last refresh are re-read.
+        Returns the number of files that were (re)indexed.
+        """
+        connection = self.connection
+        known = {
+            row["file_path"]: (row["mtime"], row["size"])
+            for row in connection.execute("SELECT file_path, mtime, size FROM characters")
+        }
+        unreadable = {
+            row["file_path"]: (row["mtime"], row["size"])
+            for row in connection.execute("SELECT file_path, mtime, size FROM unreadable")
+        }
+
+        updated_rows = []
+        unreadable_rows = []
+        seen = set()
+        try:
+            entries = list(os.scandir(self.save_dir))
+        except OSError as e:
+            print(f"Error scanning character library: {e}")
+            return 0
+
+        for entry in entries:
+            if not entry.name.endswith(SAVE_EXTENSIONS) or not entry.is_file():
+                continue
+
+            file_path = entry.path
+            seen.add(file_path)
+            stat_result = entry.stat()
+            stamp = (stat_result.st_mtime, stat_result.st_size)
+            if known.get(file_path) == stamp or unreadable.get(file_path) == stamp:
+                continue
+
+            row = self._read_row(file_path, stat_result)
+            if row is not None:
+                updated_rows.append(row)
+            else:
+                unreadable_rows.append((file_path,) + stamp)
+
+        removed = [(file_path,) for file_path in known if file_path not in seen]
+        # Files that were read now, or are gone, leave the unreadable list
+        recovered = [(row[0],) for row in updated_rows if row[0] in unreadable]
+        recovered += [(file_path,) for file_path in unreadable if file_path not in seen]
+
+        with connection:
+            if removed:
+                connection.executemany("DELETE FROM characters WHERE file_path = ?", removed)
+            if recovered:
+                connection.executemany("DELETE FROM unreadable WHERE file_path = ?", recovered)
+            if updated_rows:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO characters VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    updated_rows
+                )
+            if unreadable_rows:
+                connection.executemany("DELETE FROM characters WHERE file_path = ?",
+                                       [(row[0],) for row in unreadable_rows])
+                connection.executemany("INSERT OR REPLACE INTO unreadable VALUES (?, ?, ?)", unreadable_rows)
+
+        return len(updated_rows)
+
+    def update_file(self, file_path):
+        """Index (or re-index) a single save file, e.g. right after it was written"""
+        file_path = self._normalize_path(file_path)
+        if file_path is None:
+            return False
+
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            self.remove_file(file_path)
+            return False
+
+        row = self._read_row(file_path, stat_result)
+        with self.connection:
+            if row is None:
+                self.connection.execute("DELETE FROM characters WHERE file_path = ?", (file_path,))
+                self.connection.execute("INSERT OR REPLACE INTO unreadable VALUES (?, ?, ?)",
+                                        (file_path, stat_result.st_mtime, stat_result.st_size))
+                return False
+            self.connection.execute("DELETE FROM unreadable WHERE file_path = ?", (file_path,))
+            self.connection.execute("INSERT OR REPLACE INTO characters VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+        return True
+
+    def update_files(self, file_paths):
+        """
+        Index several save files in one transaction (e.g. during an import).
+        Files indexed, or found unreadable, at their current mtime and size
+        are not read again. Returns the number of files that were (re)indexed.
+        """
+        connection = self.connection
+        rows = []
+        unreadable_rows = []
+        for file_path in file_paths:
+            file_path = self._normalize_path(file_path)
+            if file_path is None:
+                continue
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                continue
+            stamp = (stat_result.st_mtime, stat_result.st_size)
+            if self._stamp("characters", file_path) == stamp or self._stamp("unreadable", file_path) == stamp:
+                continue
+            row = self._read_row(file_path, stat_result)
+            if row is not None:
+                rows.append(row)
+            else:
+                unreadable_rows.append((file_path,) + stamp)
+
+        with connection:
+            if rows:
+                connection.executemany("DELETE FROM unreadable WHERE file_path = ?", [(row[0],) for row in rows])
+                connection.executemany("INSERT OR REPLACE INTO characters VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if unreadable_rows:
+                connection.executemany("DELETE FROM characters WHERE file_path = ?",
+                                       [(row[0],) for row in unreadable_rows])
+                connection.executemany("INSERT OR REPLACE INTO unreadable VALUES (?, ?, ?)", unreadable_rows)
+        return len(rows)
+
+    def _stamp(self, table, file_path):
+        """(mtime, size) recorded for a file in the characters or unreadable table, or None"""
+        row = self.connection.execute(
+            f"SELECT mtime, size FROM {table} WHERE file_path = ?", (file_path,)
+        ).fetchone()
+        return (row["mtime"], row["size"]) if row is not None else None
+
+    def remove_file(self, file_path):
+        """Drop a save file from the index"""
+        file_path = self._normalize_path(file_path)
+        if file_path is None:
+            return
+        with self.connection:
+            self.connection.execute("DELETE FROM characters WHERE file_path = ?", (file_path,))
+            self.connection.execute("DELETE FROM unreadable WHERE file_path = ?", (file_path,))
+
+    def _normalize_path(self, file_path):
+        """Map a path to the key used by refresh(), or None if it is outside the save directory"""
+        if os.path.dirname(os.path.abspath(file_path)) != os.path.abspath(self.save_dir):
+            return None
+        return os.path.join(self.save_dir, os.path.basename(file_path))
+
+    def _read_row(self, file_path, stat_result):
+        """Read a save file and build its index row, with the hash of its contents"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            # The header is enough for the preview fields; JSON saves from before headers need a full parse
+            if file_path.endswith(binary_format.BINARY_EXTENSION):
+                character_dict = binary_format.parse_preview(data)
+            else:
+                character_dict = parse_header(data)
+                if character_dict is None:
+                    character_dict = json.loads(data.decode('utf-8'))
+            if not isinstance(character_dict, dict):
+                raise ValueError("not a character save")
+        except (OSError, ValueError) as e:
+            print(f"Error indexing character file {file_path}: {e}")
+            return None
+
+        return (
+            file_path,
+            str(character_dict.get("name", "") or ""),
+            _as_int(character_dict.get("level", 1), 1),
+            str(character_dict.get("character_class", "") or ""),
+            str(character_dict.get("type", "") or ""),
+            stat_result.st_mtime,
+            stat_result.st_size,
+            hashlib.sha256(data).hexdigest()
+        )
+
+    def recent(self, max_count=5):
+        """Most recently modified saves, newest first"""
+        return self._query("SELECT * FROM characters ORDER BY mtime DESC LIMIT ?", (max_count,))
+
+    def by_class(self, character_class):
+        """Saves of a given class, highest level first"""
+        return self._query(
+            "SELECT * FROM characters WHERE character_class = ? ORDER BY level DESC, name",
+            (character_class,)
+        )
+
+    def by_level(self, min_level, max_level=None):
+        """Saves whose level is in [min_level, max_level]"""
+        if max_level is None:
+            max_level = min_level
+        return self._query(
+            "SELECT * FROM characters WHERE level BETWEEN ? AND ? ORDER BY level, name",
+            (min_level, max_level)
+        )
+
+    def get(self, file_path):
+        """Index entry for a single file, or None if it is not indexed"""
+        file_path = self._normalize_path(file_path)
+        if file_path is None:
+            return None
+        rows = self._query("SELECT * FROM characters WHERE file_path = ?", (file_path,))
+        return rows[0] if rows else None
+
+    def _query(self, sql, params):
+        """Run a query and convert the rows into preview dictionaries"""
+        return [self._row_to_preview(row) for row in self.connection.execute(sql, params)]
+
+    @staticmethod
+    def _row_to_preview(row):
+        """Convert an index row to the preview format used by FileController"""
+        return {
+            "name": row["name"] or "Unnamed",
+            "level": row["level"],
+            "class": row["character_class"],
+            "type": row["type"],
+            "file_path": row["file_path"],
+            "mtime": row["mtime"],
+            "size": row["size"],
+            "content_hash": row["content_hash"],
+            "last_modified": datetime.datetime.fromtimestamp(row["mtime"]).strftime("%Y-%m-%d %H:%M")
+        }
+
+
+def _as_int(value, default):
+    """Convert a stored value to int, falling back to a default"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
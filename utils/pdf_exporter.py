@@ -5,72 +5,144 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.units import inch
 import os
 
+from models.conditions import StatusEffect
+
+
+def _build_styles():
+    """Build the stylesheet shared by all exports"""
+    styles = getSampleStyleSheet()
+    # Create a character sheet style
+    styles.add(ParagraphStyle(
+        name='CharacterTitle',
+        fontName='Helvetica-Bold',
+        fontSize=16,
+        alignment=1,  # Center alignment
+        spaceAfter=12
+    ))
+    styles.add(ParagraphStyle(
+        name='SectionTitle',
+        fontName='Helvetica-Bold',
+        fontSize=12,
+        spaceBefore=8,
+        spaceAfter=4
+    ))
+    styles.add(ParagraphStyle(
+        name='SmallText',
+        fontName='Helvetica',
+        fontSize=8
+    ))
+    return styles
+
+
+# Built once per process and reused by every PDFExporter
+STYLES = _build_styles()
+
+# Table styles
+LABEL_COLUMNS_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+    ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+HEADER_ROW_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),  # Plain number cells, same size as SmallText
+])
+FIRST_COLUMN_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+IMAGE_ROW_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (0, 0), 'TOP'),
+    ('VALIGN', (1, 0), (1, 0), 'TOP'),
+])
+
+# Column widths
+BASIC_INFO_WIDTHS = [1.0 * inch, 1.2 * inch, 1.0 * inch, 1.1 * inch]
+CLASS_DETAILS_WIDTHS = [1.2 * inch, 1.8 * inch, 1.2 * inch, 1.8 * inch]
+STATS_WIDTHS = [1 * inch, 1.5 * inch, 1 * inch, 1.5 * inch]
+WEAPONS_WIDTHS = [1.2 * inch, 0.8 * inch, 0.8 * inch, 0.8 * inch, 2.4 * inch]
+SHIELD_ARMOR_WIDTHS = [0.8 * inch, 1.2 * inch, 1 * inch, 1 * inch, 2 * inch]
+OUTFIT_WIDTHS = [1.5 * inch, 0.8 * inch, 0.8 * inch, 2.9 * inch]
+STATUS_WIDTHS = [1 * inch, 0.8 * inch, 0.8 * inch, 1.2 * inch, 2.2 * inch]
+BACKGROUND_WIDTHS = [1.5 * inch, 4.5 * inch]
+
+# Label and other static table cells. A flowable keeps the layout of the place
+# it was last wrapped in, so each cell position gets its own Paragraph; those
+# are then reused by every export in the process (exports must not run
+# concurrently). Top-level flowables are not cached: the page layout marks
+# them while placing them.
+_static_cells = {}
+
+
+def _static(text, style_name, position):
+    """Cached Paragraph for static text at a given (table, row, column) position"""
+    key = (position, text, style_name)
+    cell = _static_cells.get(key)
+    if cell is None:
+        cell = _static_cells[key] = Paragraph(text, STYLES[style_name])
+    return cell
+
+
+def _header_row(table, labels):
+    """Cached header row of a table with small bold labels"""
+    return [_static(f"<b>{label}</b>", 'SmallText', (table, 0, column))
+            for column, label in enumerate(labels)]
+
 
 class PDFExporter:
     """Utility for exporting character data to PDF format"""
 
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        # Create a character sheet style
-        self.styles.add(ParagraphStyle(
-            name='CharacterTitle',
-            fontName='Helvetica-Bold',
-            fontSize=16,
-            alignment=1,  # Center alignment
-            spaceAfter=12
-        ))
-        self.styles.add(ParagraphStyle(
-            name='SectionTitle',
-            fontName='Helvetica-Bold',
-            fontSize=12,
-            spaceBefore=8,
-            spaceAfter=4
-        ))
-        self.styles.add(ParagraphStyle(
-            name='SmallText',
-            fontName='Helvetica',
-            fontSize=8
-        ))
+    def __init__(self, portrait_store=None):
+        self.portrait_store = portrait_store
+        self.styles = STYLES
+
+    def _text(self, text, style_name='Normal'):
+        """Character-dependent cell"""
+        return Paragraph(text, self.styles[style_name])
+
+    def _label_rows(self, table, rows, style_name='Normal'):
+        """
+        Build rows of (label, value) pairs: labels are cached per position,
+        values are rebuilt for every export
+        """
+        data = []
+        for row_index, row in enumerate(rows):
+            cells = []
+            for pair_index, (label, value) in enumerate(row):
+                cells.append(_static(f"<b>{label}</b>", style_name, (table, row_index, pair_index * 2)))
+                cells.append(self._text(value, style_name))
+            data.append(cells)
+        return data
 
     def _create_basic_info_table(self, character):
         """Create a table with basic character information"""
         # Basic information section
-        basic_info = [
-            [
-                Paragraph("<b>Character Name:</b>", self.styles['Normal']),
-                Paragraph(character.name, self.styles['Normal']),
-                Paragraph("<b>Player Name:</b>", self.styles['Normal']),
-                Paragraph(character.player_name, self.styles['Normal'])
-            ],
-            [
-                Paragraph("<b>Level:</b>", self.styles['Normal']),
-                Paragraph(str(character.level), self.styles['Normal']),
-                Paragraph("<b>Experience:</b>", self.styles['Normal']),
-                Paragraph(str(character.exp), self.styles['Normal'])
-            ],
-            [
-                Paragraph("<b>Class:</b>", self.styles['Normal']),
-                Paragraph(character.character_class, self.styles['Normal']),
-                Paragraph("<b>Type:</b>", self.styles['Normal']),
-                Paragraph(character.type, self.styles['Normal'])
-            ],
-            [
-                Paragraph("<b>Gender:</b>", self.styles['Normal']),
-                Paragraph(character.gender, self.styles['Normal']),
-                Paragraph("<b>Age:</b>", self.styles['Normal']),
-                Paragraph(str(character.age), self.styles['Normal'])
-            ]
-        ]
-
-        info_table = Table(basic_info, colWidths=[1.0 * inch, 1.2 * inch, 1.0 * inch, 1.1 * inch])
-        info_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        basic_info = self._label_rows('basic_info', [
+            [("Character Name:", character.name), ("Player Name:", character.player_name)],
+            [("Level:", str(character.level)), ("Experience:", str(character.exp))],
+            [("Class:", character.character_class), ("Type:", character.type)],
+            [("Gender:", character.gender), ("Age:", str(character.age))],
+        ])
+
+        info_table = Table(basic_info, colWidths=BASIC_INFO_WIDTHS)
+        info_table.setStyle(LABEL_COLUMNS_STYLE)
         return info_table
 
+    def _portrait_path(self, character):
+        """Path of the image to print: the store's 300 dpi rendition, else the original file"""
+        portrait_id = getattr(character, 'portrait_id', "")
+        if self.portrait_store is not None and self.portrait_store.has(portrait_id):
+            return self.portrait_store.print_path(portrait_id)
+
+        image_path = getattr(character, 'image_path', "")
+        if image_path and os.path.exists(image_path):
+            return image_path
+        return None
+
     def export_character(self, character, file_path):
         """Export character to PDF file"""
         try:
@@ -91,18 +163,16 @@ class PDFExporter:
             elements.append(Spacer(1, 0.1 * inch))
 
             # Create a table for character image and basic info side by side
-            if hasattr(character, 'image_path') and character.image_path and os.path.exists(character.image_path):
+            image_path = self._portrait_path(character)
+            if image_path:
                 try:
                     # Add character image if available
-                    img = Image(character.image_path, width=1.5 * inch, height=1.5 * inch)
+                    img = Image(image_path, width=1.5 * inch, height=1.5 * inch)
 
                     # Create a table with image and basic info
                     data = [[img, self._create_basic_info_table(character)]]
                     image_table = Table(data, colWidths=[1.7 * inch, 4.3 * inch])
-                    image_table.setStyle(TableStyle([
-                        ('VALIGN', (0, 0), (0, 0), 'TOP'),
-                        ('VALIGN', (1, 0), (1, 0), 'TOP'),
-                    ]))
+                    image_table.setStyle(IMAGE_ROW_STYLE)
                     elements.append(image_table)
                 except:
                     # If image loading fails, just add basic info
@@ -114,105 +184,57 @@ class PDFExporter:
             elements.append(Spacer(1, 0.2 * inch))
 
             # Class details
-            elements.append(Paragraph("Class Details", self.styles['SectionTitle']))
-
-            class_details = [
-                [
-                    Paragraph("<b>Class Skills:</b>", self.styles['Normal']),
-                    Paragraph(character.class_skill, self.styles['Normal']),
-                    Paragraph("<b>Stats Used:</b>", self.styles['Normal']),
-                    Paragraph(character.stats_used, self.styles['Normal'])
-                ],
-                [
-                    Paragraph("<b>Effect:</b>", self.styles['Normal']),
-                    Paragraph(character.effect, self.styles['Normal']),
-                    Paragraph("<b>Mastered Weapon:</b>", self.styles['Normal']),
-                    Paragraph(character.mastered_weapon, self.styles['Normal'])
-                ],
-                [
-                    Paragraph("<b>Specialized Terrain:</b>", self.styles['Normal']),
-                    Paragraph(character.specialized_terrain, self.styles['Normal']),
-                    Paragraph("<b>Personal Item:</b>", self.styles['Normal']),
-                    Paragraph(character.personal_item, self.styles['Normal'])
-                ]
-            ]
-
-            class_table = Table(class_details, colWidths=[1.2 * inch, 1.8 * inch, 1.2 * inch, 1.8 * inch])
-            class_table.setStyle(TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
+            elements.append(self._text("Class Details", 'SectionTitle'))
+
+            class_details = self._label_rows('class_details', [
+                [("Class Skills:", character.class_skill), ("Stats Used:", character.stats_used)],
+                [("Effect:", character.effect), ("Mastered Weapon:", character.mastered_weapon)],
+                [("Specialized Terrain:", character.specialized_terrain),
+                 ("Personal Item:", character.personal_item)],
+            ])
+
+            class_table = Table(class_details, colWidths=CLASS_DETAILS_WIDTHS)
+            class_table.setStyle(LABEL_COLUMNS_STYLE)
             elements.append(class_table)
             elements.append(Spacer(1, 0.2 * inch))
 
             # Stats section
-            elements.append(Paragraph("Character Stats", self.styles['SectionTitle']))
+            elements.append(self._text("Character Stats", 'SectionTitle'))
 
             # Create a table for the character stats
-            stats_data = [
-                [
-                    Paragraph("<b>STR</b>", self.styles['Normal']),
-                    Paragraph(f"{character.str['value']} ({character.str['die_size']})", self.styles['Normal']),
-                    Paragraph("<b>DEX</b>", self.styles['Normal']),
-                    Paragraph(f"{character.dex['value']} ({character.dex['die_size']})", self.styles['Normal']),
-                ],
-                [
-                    Paragraph("<b>INT</b>", self.styles['Normal']),
-                    Paragraph(f"{character.int['value']} ({character.int['die_size']})", self.styles['Normal']),
-                    Paragraph("<b>SPI</b>", self.styles['Normal']),
-                    Paragraph(f"{character.spi['value']} ({character.spi['die_size']})", self.styles['Normal']),
-                ],
-                [
-                    Paragraph("<b>Initiative</b>", self.styles['Normal']),
-                    Paragraph(str(character.initiative), self.styles['Normal']),
-                    Paragraph("<b>Fumble Points</b>", self.styles['Normal']),
-                    Paragraph(str(character.fumble_points), self.styles['Normal']),
-                ],
-            ]
-
-            stats_table = Table(stats_data, colWidths=[1 * inch, 1.5 * inch, 1 * inch, 1.5 * inch])
-            stats_table.setStyle(TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
+            stats_data = self._label_rows('stats', [
+                [("STR", f"{character.str['value']} ({character.str['die_size']})"),
+                 ("DEX", f"{character.dex['value']} ({character.dex['die_size']})")],
+                [("INT", f"{character.int['value']} ({character.int['die_size']})"),
+                 ("SPI", f"{character.spi['value']} ({character.spi['die_size']})")],
+                [("Initiative", str(character.initiative)), ("Fumble Points", str(character.fumble_points))],
+            ])
+
+            stats_table = Table(stats_data, colWidths=STATS_WIDTHS)
+            stats_table.setStyle(LABEL_COLUMNS_STYLE)
             elements.append(stats_table)
             elements.append(Spacer(1, 0.2 * inch))
 
             # Equipment section
-            elements.append(Paragraph("Equipment", self.styles['SectionTitle']))
+            elements.append(self._text("Equipment", 'SectionTitle'))
 
             # Weapons table
             if character.weapons:
-                elements.append(Paragraph("Weapons", self.styles['Normal']))
-                weapons_header = [
-                    Paragraph("<b>Name</b>", self.styles['SmallText']),
-                    Paragraph("<b>Accuracy</b>", self.styles['SmallText']),
-                    Paragraph("<b>Damage</b>", self.styles['SmallText']),
-                    Paragraph("<b>Durability</b>", self.styles['SmallText']),
-                    Paragraph("<b>Effect</b>", self.styles['SmallText'])
-                ]
-                weapons_data = [weapons_header]
+                elements.append(self._text("Weapons"))
+                weapons_data = [_header_row('weapons', ("Name", "Accuracy", "Damage", "Durability", "Effect"))]
 
+                # Numbers never wrap, so they are plain strings rather than Paragraphs
                 for weapon in character.weapons:
                     weapons_data.append([
-                        Paragraph(weapon.name, self.styles['SmallText']),
-                        Paragraph(str(weapon.accuracy), self.styles['SmallText']),
-                        Paragraph(str(weapon.damage), self.styles['SmallText']),
-                        Paragraph(str(weapon.durability), self.styles['SmallText']),
-                        Paragraph(weapon.effect, self.styles['SmallText'])
+                        self._text(weapon.name, 'SmallText'),
+                        str(weapon.accuracy),
+                        str(weapon.damage),
+                        str(weapon.durability),
+                        self._text(weapon.description, 'SmallText')
                     ])
 
-                weapons_table = Table(weapons_data,
-                                      colWidths=[1.2 * inch, 0.8 * inch, 0.8 * inch, 0.8 * inch, 2.4 * inch])
-                weapons_table.setStyle(TableStyle([
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
+                weapons_table = Table(weapons_data, colWidths=WEAPONS_WIDTHS)
+                weapons_table.setStyle(HEADER_ROW_STYLE)
                 elements.append(weapons_table)
                 elements.append(Spacer(1, 0.1 * inch))
 
@@ -221,134 +243,96 @@ class PDFExporter:
 
             if character.shield:
                 shield_armor_data.append([
-                    Paragraph("<b>Shield</b>", self.styles['SmallText']),
-                    Paragraph(character.shield.name, self.styles['SmallText']),
-                    Paragraph(f"Defense: {character.shield.defense}", self.styles['SmallText']),
-                    Paragraph(f"Durability: {character.shield.durability}", self.styles['SmallText']),
-                    Paragraph(character.shield.effect, self.styles['SmallText'])
+                    _static("<b>Shield</b>", 'SmallText', ('shield_armor', len(shield_armor_data), 0)),
+                    self._text(character.shield.name, 'SmallText'),
+                    self._text(f"Defense: {character.shield.defense}", 'SmallText'),
+                    self._text(f"Durability: {character.shield.durability}", 'SmallText'),
+                    self._text(character.shield.description, 'SmallText')
                 ])
 
             if character.armor:
                 shield_armor_data.append([
-                    Paragraph("<b>Armor</b>", self.styles['SmallText']),
-                    Paragraph(character.armor.name, self.styles['SmallText']),
-                    Paragraph(f"Defense: {character.armor.defense_points}", self.styles['SmallText']),
-                    Paragraph(f"Penalty: {character.armor.penalty}", self.styles['SmallText']),
-                    Paragraph(character.armor.effect, self.styles['SmallText'])
+                    _static("<b>Armor</b>", 'SmallText', ('shield_armor', len(shield_armor_data), 0)),
+                    self._text(character.armor.name, 'SmallText'),
+                    self._text(f"Defense: {character.armor.defense_points}", 'SmallText'),
+                    self._text(f"Penalty: {character.armor.penalty}", 'SmallText'),
+                    self._text(character.armor.description, 'SmallText')
                 ])
 
             if shield_armor_data:
-                shield_armor_table = Table(shield_armor_data,
-                                           colWidths=[0.8 * inch, 1.2 * inch, 1 * inch, 1 * inch, 2 * inch])
-                shield_armor_table.setStyle(TableStyle([
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
+                shield_armor_table = Table(shield_armor_data, colWidths=SHIELD_ARMOR_WIDTHS)
+                shield_armor_table.setStyle(FIRST_COLUMN_STYLE)
                 elements.append(shield_armor_table)
                 elements.append(Spacer(1, 0.1 * inch))
 
             # Traveler's Outfit
             if character.travelers_outfit:
-                elements.append(Paragraph("Traveler's Outfit", self.styles['Normal']))
-                outfit_header = [
-                    Paragraph("<b>Name</b>", self.styles['SmallText']),
-                    Paragraph("<b>Size</b>", self.styles['SmallText']),
-                    Paragraph("<b>Durability</b>", self.styles['SmallText']),
-                    Paragraph("<b>Effect</b>", self.styles['SmallText'])
-                ]
-                outfit_data = [outfit_header]
+                elements.append(self._text("Traveler's Outfit"))
+                outfit_data = [_header_row('outfit', ("Name", "Size", "Durability", "Effect"))]
 
                 for item in character.travelers_outfit:
                     outfit_data.append([
-                        Paragraph(item.name, self.styles['SmallText']),
-                        Paragraph(str(item.size), self.styles['SmallText']),
-                        Paragraph(str(item.durability), self.styles['SmallText']),
-                        Paragraph(item.effect, self.styles['SmallText'])
+                        self._text(item.name, 'SmallText'),
+                        str(item.size),
+                        str(item.durability),
+                        self._text(item.description, 'SmallText')
                     ])
 
-                outfit_table = Table(outfit_data, colWidths=[1.5 * inch, 0.8 * inch, 0.8 * inch, 2.9 * inch])
-                outfit_table.setStyle(TableStyle([
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
+                outfit_table = Table(outfit_data, colWidths=OUTFIT_WIDTHS)
+                outfit_table.setStyle(HEADER_ROW_STYLE)
                 elements.append(outfit_table)
                 elements.append(Spacer(1, 0.2 * inch))
 
             # Status Effects
-            elements.append(Paragraph("Status Effects", self.styles['SectionTitle']))
+            elements.append(self._text("Status Effects", 'SectionTitle'))
 
-            status_data = [
-                [
-                    Paragraph("<b>Effect</b>", self.styles['SmallText']),
-                    Paragraph("<b>Active</b>", self.styles['SmallText']),
-                    Paragraph("<b>Type</b>", self.styles['SmallText']),
-                    Paragraph("<b>Recovery Stat</b>", self.styles['SmallText']),
-                    Paragraph("<b>Effect</b>", self.styles['SmallText'])
-                ]
-            ]
+            status_data = [_header_row('status', ("Effect", "Active", "Type", "Recovery Stat", "Effect"))]
 
-            from models.conditions import StatusEffect
-
-            for effect_name, is_active in character.status_effects.items():
+            for row, (effect_name, is_active) in enumerate(character.status_effects.items(), start=1):
+                # Everything except the Active column only depends on the effect and its row
                 effect = StatusEffect(effect_name)
+                position = ('status', row)
                 status_data.append([
-                    Paragraph(effect_name.capitalize(), self.styles['SmallText']),
-                    Paragraph("Yes" if is_active else "No", self.styles['SmallText']),
-                    Paragraph(effect.effect_type.capitalize(), self.styles['SmallText']),
-                    Paragraph(effect.check_stat.upper(), self.styles['SmallText']),
-                    Paragraph(effect.effect, self.styles['SmallText'])
+                    _static(effect_name.capitalize(), 'SmallText', position + (0,)),
+                    _static("Yes" if is_active else "No", 'SmallText', position + (1,)),
+                    _static(effect.effect_type.capitalize(), 'SmallText', position + (2,)),
+                    _static(effect.check_stat.upper(), 'SmallText', position + (3,)),
+                    _static(effect.effect, 'SmallText', position + (4,))
                 ])
 
-            status_table = Table(status_data, colWidths=[1 * inch, 0.8 * inch, 0.8 * inch, 1.2 * inch, 2.2 * inch])
-            status_table.setStyle(TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
+            status_table = Table(status_data, colWidths=STATUS_WIDTHS)
+            status_table.setStyle(HEADER_ROW_STYLE)
             elements.append(status_table)
             elements.append(Spacer(1, 0.2 * inch))
 
             # Background and Notes
-            elements.append(Paragraph("Background & Notes", self.styles['SectionTitle']))
-
-            background_data = [
-                [
-                    Paragraph("<b>Hometown:</b>", self.styles['Normal']),
-                    Paragraph(character.hometown, self.styles['Normal'])
-                ],
-                [
-                    Paragraph("<b>Reason for Travel:</b>", self.styles['Normal']),
-                    Paragraph(character.reason_for_travel, self.styles['Normal'])
-                ],
-                [
-                    Paragraph("<b>Appearance:</b>", self.styles['Normal']),
-                    Paragraph(character.appearance, self.styles['Normal'])
-                ],
-                [
-                    Paragraph("<b>Notes:</b>", self.styles['Normal']),
-                    Paragraph(character.notes, self.styles['Normal'])
-                ]
-            ]
-
-            background_table = Table(background_data, colWidths=[1.5 * inch, 4.5 * inch])
-            background_table.setStyle(TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
+            elements.append(self._text("Background & Notes", 'SectionTitle'))
+
+            background_data = self._label_rows('background', [
+                [("Hometown:", character.hometown)],
+                [("Reason for Travel:", character.reason_for_travel)],
+                [("Appearance:", character.appearance)],
+            ])
+
+            background_table = Table(background_data, colWidths=BACKGROUND_WIDTHS)
+            background_table.setStyle(FIRST_COLUMN_STYLE)
             elements.append(background_table)
 
+            # Notes go below the table so long notes can continue on the next page
+            if character.notes:
+                elements.append(Spacer(1, 0.1 * inch))
+                elements.append(self._text("<b>Notes:</b>"))
+                elements.append(self._text(character.notes))
+
             # Add abilities/spells if available
             if any(character.abilities.values()):
                 elements.append(Spacer(1, 0.2 * inch))
-                elements.append(Paragraph("Abilities & Spells", self.styles['SectionTitle']))
+                elements.append(self._text("Abilities & Spells", 'SectionTitle'))
 
                 for level, abilities in character.abilities.items():
                     if abilities:
-                        elements.append(Paragraph(f"Level {level}", self.styles['Normal']))
-                        elements.append(Paragraph(abilities, self.styles['Normal']))
+                        elements.append(self._text(f"Level {level}"))
+                        elements.append(self._text(abilities))
                         elements.append(Spacer(1, 0.1 * inch))
 
             # Build the PDF
@@ -357,4 +341,4 @@ class PDFExporter:
 
         except Exception as e:
             print(f"Error exporting PDF: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,131 @@
+"""
+Ryuutama Character Sheet - Portrait Store
+Content-addressed store for character portraits.
+
+Each imported image is decoded once and saved as two pre-scaled PNG
+renditions under <save dir>/portraits/<sha256>/:
+    ui.png     fits 96x96, shown on the Character tab
+    print.png  fits 450x450, i.e. 1.5 inch at 300 dpi on the PDF sheet
+Characters keep only the portrait id (the hash), so the same picture used
+by several characters is stored once and never decoded again.
+"""
+
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+
+# Directory inside the save directory that holds the portraits
+PORTRAIT_DIRNAME = "portraits"
+
+# Rendition sizes (longest side, in pixels)
+UI_SIZE = 96
+PRINT_SIZE = 450  # 1.5 inch at 300 dpi
+
+UI_FILENAME = "ui.png"
+PRINT_FILENAME = "print.png"
+
+
+class PortraitStore:
+    """Pre-scaled portrait renditions keyed by the hash of the original image"""
+
+    def __init__(self, save_dir):
+        self.root = os.path.join(save_dir, PORTRAIT_DIRNAME)
+        self._ui_data = {}  # portrait id -> base64 PNG of the UI rendition, once read
+
+    def import_image(self, source_path):
+        """
+        Add an image to the store and return its portrait id.
+        Importing the same picture again only hashes the file.
+        """
+        with open(source_path, 'rb') as f:
+            data = f.read()
+        portrait_id = hashlib.sha256(data).hexdigest()
+
+        if not self.has(portrait_id):
+            self._write_renditions(portrait_id, source_path)
+        return portrait_id
+
+    def has(self, portrait_id):
+        """Check whether both renditions of a portrait exist"""
+        return bool(portrait_id) and os.path.exists(self.ui_path(portrait_id)) \
+            and os.path.exists(self.print_path(portrait_id))
+
+    def portrait_dir(self, portrait_id):
+        """Directory holding the renditions of a portrait"""
+        return os.path.join(self.root, portrait_id)
+
+    def ui_path(self, portrait_id):
+        """Path of the 96px rendition"""
+        return os.path.join(self.portrait_dir(portrait_id), UI_FILENAME)
+
+    def print_path(self, portrait_id):
+        """Path of the 300 dpi rendition"""
+        return os.path.join(self.portrait_dir(portrait_id), PRINT_FILENAME)
+
+    def ui_data(self, portrait_id):
+        """The UI rendition as base64 PNG (what tk.PhotoImage(data=...) takes), or None"""
+        data = self._ui_data.get(portrait_id)
+        if data is None and self.has(portrait_id):
+            with open(self.ui_path(portrait_id), 'rb') as f:
+                data = base64.b64encode(f.read()).decode('ascii')
+            self._ui_data[portrait_id] = data
+        return data
+
+    def preload_ui_data(self, portrait_id, data):
+        """Use a UI rendition read earlier (e.g. from the session cache) instead of the file"""
+        if portrait_id and data:
+            self._ui_data[portrait_id] = data
+
+    def resolve(self, character):
+        """
+        Make sure a character references the store.
+        Characters from older saves only have an image_path; that image is
+        imported and the path replaced by the portrait id.
+        Returns the portrait id, or "" if the character has no usable portrait.
+        """
+        portrait_id = getattr(character, 'portrait_id', "")
+        if self.has(portrait_id):
+            return portrait_id
+
+        image_path = getattr(character, 'image_path', "")
+        if not image_path or not os.path.exists(image_path):
+            return ""
+
+        try:
+            character.portrait_id = self.import_image(image_path)
+        except Exception as e:
+            print(f"Error importing portrait: {e}")
+            return ""
+        character.image_path = ""
+        return character.portrait_id
+
+    def _write_renditions(self, portrait_id, source_path):
+        """Decode the original once and write both renditions"""
+        from PIL import Image
+
+        os.makedirs(self.root, exist_ok=True)
+        # Build the renditions in a temp directory and move it into place,
+        # so a half-written portrait is never visible
+        temp_dir = tempfile.mkdtemp(prefix=f".{portrait_id[:12]}.", dir=self.root)
+        try:
+            with Image.open(source_path) as image:
+                image.draft('RGB', (PRINT_SIZE, PRINT_SIZE))  # Cheap JPEG downscale while decoding
+                image = image.convert('RGBA')
+
+            image.thumbnail((PRINT_SIZE, PRINT_SIZE), Image.LANCZOS)
+            image.save(os.path.join(temp_dir, PRINT_FILENAME), optimize=True)
+
+            # The UI rendition is scaled from the print one, not the original
+            image.thumbnail((UI_SIZE, UI_SIZE), Image.LANCZOS)
+            image.save(os.path.join(temp_dir, UI_FILENAME), optimize=True)
+
+            try:
+                os.replace(temp_dir, self.portrait_dir(portrait_id))
+            except OSError:
+                # Another save got there first; its renditions are identical
+                if not self.has(portrait_id):
+                    raise
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
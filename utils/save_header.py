@@ -0,0 +1,83 @@
+"""
+Ryuutama Character Sheet - Save File Header
+Small preview header written on the first line of every JSON save,
+so previews can be read without parsing the whole document.
+"""
+
+import json
+
+# Key of the header object inside the save document
+HEADER_KEY = "_header"
+HEADER_VERSION = 1
+
+# Every header line starts with this exact prefix
+HEADER_PREFIX = b'{"' + HEADER_KEY.encode("ascii") + b'": '
+
+# How much of a file is read to find the header
+HEADER_READ_SIZE = 512
+MAX_HEADER_BYTES = 4096
+
+
+def build_header(character_dict):
+    """Build the preview header for a character dictionary"""
+    return {
+        "version": HEADER_VERSION,
+        "name": character_dict.get("name", ""),
+        "level": character_dict.get("level", 1),
+        "character_class": character_dict.get("character_class", ""),
+        "type": character_dict.get("type", "")
+    }
+
+
+def dumps_character(character_dict):
+    """
+    Serialize a character dictionary to JSON text with the preview header
+    as the first member, alone on the first line. The result is plain JSON.
+    """
+    header = json.dumps(build_header(character_dict), ensure_ascii=False)
+    body = json.dumps(character_dict, ensure_ascii=False, indent=2)
+    # body is "{\n  ...\n}", so splice the header in as the first member
+    return '{"' + HEADER_KEY + '": ' + header + ",\n" + body[2:]
+
+
+def parse_header(data):
+    """Parse the header from the first bytes of a save file, or return None"""
+    if not data.startswith(HEADER_PREFIX):
+        return None
+
+    end = data.find(b"\n")
+    if end == -1:
+        return None
+
+    line = data[len(HEADER_PREFIX):end].rstrip(b"\r")
+    if not line.endswith(b","):
+        return None
+
+    try:
+        header = json.loads(line[:-1].decode("utf-8"))
+    except ValueError:
+        return None
+
+    if not isinstance(header, dict) or header.get("version") != HEADER_VERSION:
+        return None
+    return header
+
+
+def read_header(file_path):
+    """Read only the header of a save file; returns None for files without one"""
+    with open(file_path, "rb", buffering=0) as f:
+        data = f.read(HEADER_READ_SIZE)
+        # Long names can push the header past the first read
+        while b"\n" not in data and len(data) < MAX_HEADER_BYTES:
+            chunk = f.read(HEADER_READ_SIZE)
+            if not chunk:
+                break
+            data += chunk
+
+    return parse_header(data)
+
+
+def strip_header(character_dict):
+    """Remove the header member from a loaded save document"""
+    character_dict.pop(HEADER_KEY, None)
+    return character_dict
@@ -0,0 +1,210 @@
+"""
+Ryuutama Character Sheet - Rulebook Search
+Full-text search over class skills, rulebook equipment, status effects,
+terrain and weather.
+
+The texts are tokenized once into an inverted index (word -> documents
+with a weight; words in a title count more). The words are kept sorted,
+so every word starting with a typed prefix is found by bisection: "herb"
+also finds "herbs". The documents and the index are saved to a small
+cache file, keyed on INDEX_VERSION and the modification time and size of
+the modules the texts come from. A start with a current cache neither
+imports those modules nor collects the documents.
+"""
+
+import json
+import os
+import re
+from bisect import bisect_left
+
+from utils.atomic_file import write_atomic
+from utils.config import DEFAULT_SAVE_DIRECTORY
+
+# Bump when tokenizing, weighting or the document layout changes; older cache files are rebuilt
+INDEX_VERSION = 2
+CACHE_FILENAME = ".search_index.json"
+
+# Modules holding the indexed texts, relative to the application directory
+SOURCE_FILES = (
+    os.path.join("utils", "class_skills_data.py"),
+    os.path.join("utils", "equipment_data.py"),
+    os.path.join("models", "rulebook.py"),
+    os.path.join("models", "conditions.py"),
+)
+APP_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TITLE_WEIGHT = 3.0  # A word in the title counts this much more than one in the text
+PREFIX_FACTOR = 0.5  # Words that only start with the typed text count half
+
+WORD = re.compile(r"[a-z0-9]+")
+
+_index = None
+
+
+def tokenize(text):
+    """Lower-case words of a text"""
+    return WORD.findall(text.lower())
+
+
+def source_stamp():
+    """INDEX_VERSION and [file, mtime in ns, size] of each source module; a cache with another stamp is stale"""
+    stamp = [INDEX_VERSION]
+    for source_file in SOURCE_FILES:
+        try:
+            stat = os.stat(os.path.join(APP_DIRECTORY, source_file))
+            stamp.append([source_file, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            stamp.append([source_file, None, None])
+    return stamp
+
+
+def collect_documents():
+    """
+    Searchable texts of the rulebook, as dicts with:
+        kind      what it is ("Class Skill", "Weapon", "Status Effect", ...)
+        title     its name
+        location  where it belongs (class, item category, ...)
+        text      the text shown with a result
+        body      all the text that is searched besides the title
+    """
+    from models.conditions import StatusEffect, TerrainEffect, WeatherEffect
+    from models.rulebook import get_catalog
+    from utils.class_skills_data import CLASS_SKILLS
+
+    documents = []
+
+    for class_name, class_info in CLASS_SKILLS.items():
+        for skill_name in class_info["skills"]:
+            skill = class_info["descriptions"].get(skill_name, {})
+            documents.append({
+                "kind": "Class Skill",
+                "title": skill_name,
+                "location": class_name,
+                "text": skill.get("effect", ""),
+                "body": " ".join([class_name] + [str(value) for value in skill.values()])
+            })
+
+    for entry in get_catalog().entries.values():
+        documents.append({
+            "kind": entry.kind.capitalize(),
+            "title": entry.name,
+            "location": entry.category,
+            "text": entry.description,
+            "body": " ".join([entry.category, entry.equip, entry.description] +
+                             [str(value) for value in entry.details.values()])
+        })
+
+    for effect_type in StatusEffect.EFFECTS:
+        effect = StatusEffect(effect_type)
+        documents.append({
+            "kind": "Status Effect",
+            "title": effect_type.capitalize(),
+            "location": effect.effect_type.capitalize(),
+            "text": effect.effect,
+            "body": f"{effect.description} {effect.effect}"
+        })
+
+    for kind, types in (("Terrain", TerrainEffect.TERRAINS), ("Weather", WeatherEffect.WEATHER)):
+        for type_name, info in types.items():
+            documents.append({
+                "kind": kind,
+                "title": type_name.replace("_", " ").title(),
+                "location": "Travel",
+                "text": info["description"],
+                "body": info["description"]
+            })
+
+    return documents
+
+
+def build_postings(documents):
+    """Inverted index of documents: word -> [[document index, weight], ...]"""
+    postings = {}
+    for index, document in enumerate(documents):
+        weights = {}
+        for word in tokenize(document["title"]):
+            weights[word] = weights.get(word, 0.0) + TITLE_WEIGHT
+        for word in tokenize(document["body"]):
+            weights[word] = weights.get(word, 0.0) + 1.0
+        for word, weight in weights.items():
+            postings.setdefault(word, []).append([index, weight])
+    return postings
+
+
+class SearchIndex:
+    """Inverted index of the rulebook texts, backed by a cache file"""
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path or os.path.join(DEFAULT_SAVE_DIRECTORY, CACHE_FILENAME)
+        self.stamp = source_stamp()
+        self.documents, self.postings = self._load() or self._build()
+        self.words = sorted(self.postings)
+
+    def _load(self):
+        """(documents, postings) from the cache file, or None if it is missing or stale"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("stamp") != self.stamp:
+            return None
+        documents, postings = cache.get("documents"), cache.get("postings")
+        if not isinstance(documents, list) or not isinstance(postings, dict):
+            return None
+        return documents, postings
+
+    def _build(self):
+        """Collect and index every document and try to persist them"""
+        documents = collect_documents()
+        postings = build_postings(documents)
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            cache = {"stamp": self.stamp, "documents": documents, "postings": postings}
+            write_atomic(self.cache_path, json.dumps(cache, separators=(",", ":")).encode("utf-8"))
+        except OSError as e:
+            print(f"Error writing search index cache: {e}")
+        return documents, postings
+
+    def _word_scores(self, prefix):
+        """document index -> best weight of the words starting with prefix"""
+        scores = {}
+        position = bisect_left(self.words, prefix)
+        while position < len(self.words) and self.words[position].startswith(prefix):
+            word = self.words[position]
+            factor = 1.0 if word == prefix else PREFIX_FACTOR
+            for index, weight in self.postings[word]:
+                score = weight * factor
+                if score > scores.get(index, 0.0):
+                    scores[index] = score
+            position += 1
+        return scores
+
+    def search(self, query, limit=50):
+        """
+        Documents containing every word of query (as a word or the start of
+        one), best matches first. Returns a list of (score, document).
+        """
+        scores = None
+        for prefix in dict.fromkeys(tokenize(query)):
+            word_scores = self._word_scores(prefix)
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {index: score + word_scores[index] for index, score in scores.items()
+                          if index in word_scores}
+            if not scores:
+                return []
+        if not scores:
+            return []
+
+        ranked = sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))[:limit]
+        return [(score, self.documents[index]) for index, score in ranked]
+
+
+def get_index():
+    """Shared SearchIndex, loaded on first use"""
+    global _index
+    if _index is None:
+        _index = SearchIndex()
+    return _index
@@ -0,0 +1,128 @@
+"""
+Ryuutama Character Sheet - Startup Profile
+Import times and startup phase timings for `main.py --profile-startup`.
+
+While installed, a finder at the front of sys.meta_path times every
+module imported for the first time and files it under the module that
+imported it, like `python -X importtime` but without restarting the
+interpreter, so it works in the packaged build as well. The code that
+starts the application marks the end of each phase (theme, tabs, ...).
+"""
+
+import _thread
+import sys
+import time
+
+# Imports that took less than this (with their own imports) are left out of the tree
+MIN_IMPORT_MS = 1.0
+
+
+class _ImportNode:
+    """One timed import and the imports it triggered"""
+
+    __slots__ = ("name", "seconds", "children")
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.children = []
+
+
+class _TimedLoader:
+    """Wraps a module loader so executing the module is timed"""
+
+    def __init__(self, profile, name, loader):
+        self._profile = profile
+        self._name = name
+        self._loader = loader
+
+    def __getattr__(self, attribute):
+        return getattr(self._loader, attribute)
+
+    def exec_module(self, module):
+        profile = self._profile
+        if _thread.get_ident() != profile.thread:
+            # Imports of worker threads would interleave with the tree
+            return self._loader.exec_module(module)
+
+        node = _ImportNode(self._name)
+        profile.stack[-1].children.append(node)
+        profile.stack.append(node)
+        start = time.perf_counter()
+        try:
+            return self._loader.exec_module(module)
+        finally:
+            node.seconds = time.perf_counter() - start
+            profile.stack.pop()
+
+
+class _TimingFinder:
+    """Meta path finder that asks the other finders and times what they load"""
+
+    def __init__(self, profile):
+        self.profile = profile
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(self.profile, fullname, spec.loader)
+        return spec
+
+
+class StartupProfile:
+    """Import tree and phase timings of one application start"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []  # (phase, seconds) in order
+        self._last_mark = self.start
+        self.imports = _ImportNode("")  # Root of the import tree
+        self.stack = [self.imports]
+        self.thread = _thread.get_ident()
+        self._finder = _TimingFinder(self)
+
+    def install(self):
+        """Start timing imports"""
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def mark(self, phase):
+        """Record that phase ended now; it took the time since the previous mark"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last_mark))
+        self._last_mark = now
+
+    def report(self):
+        """Lines with the phase timings and the import tree"""
+        lines = ["Startup phases:"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:<14} {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'total':<14} {(self._last_mark - self.start) * 1000:8.1f} ms")
+
+        lines.append("")
+        lines.append(f"Imports (total ms, self ms; under {MIN_IMPORT_MS:.1f} ms not shown):")
+        for node in self.imports.children:
+            self._report_import(node, 0, lines)
+        return lines
+
+    def _report_import(self, node, depth, lines):
+        if node.seconds * 1000 < MIN_IMPORT_MS:
+            return
+        own = node.seconds - sum(child.seconds for child in node.children)
+        lines.append(f"  {node.seconds * 1000:7.1f} {own * 1000:7.1f}  {'  ' * depth}{node.name}")
+        for child in node.children:
+            self._report_import(child, depth + 1, lines)
@@ -6,8 +6,7 @@ import os
 # Ensure we can import from parent directory
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Import class skills data
-from utils.class_skills_data import CLASS_SKILLS
+from controllers.view_updates import update_var, update_text
 
 
 class CharacterTab(ttk.Frame):
@@ -17,12 +16,48 @@ class CharacterTab(ttk.Frame):
         super().__init__(parent)
         self.app_controller = app_controller
 
-        # Register with controller
-        self.app_controller.register_ui_element("character_tab", self)
-
         # Setup UI
         self._setup_ui()
 
+        # Character attributes shown in one variable
+        self._field_vars = {
+            "name": self.name_var,
+            "player_name": self.player_name_var,
+            "level": self.level_var,
+            "exp": self.exp_var,
+            "gender": self.gender_var,
+            "age": self.age_var,
+            "character_class": self.class_var,
+            "type": self.type_var,
+            "stats_used": self.stats_used_var,
+            "effect": self.effect_var,
+            "mastered_weapon": self.mastered_weapon_var,
+            "specialized_terrain": self.specialized_terrain_var,
+            "personal_item": self.personal_item_var,
+            "appearance": self.appearance_var,
+            "hometown": self.hometown_var,
+            "reason_for_travel": self.reason_for_travel_var,
+        }
+
+        # Character attribute -> function reading it from the widgets
+        self._field_readers = {field: var.get for field, var in self._field_vars.items()}
+        self._field_readers.update({
+            "class_skill": lambda: self.class_skill_text.get("1.0", tk.END).strip(),
+            "portrait_id": self.portrait_id_var.get,
+            "notes": lambda: self.notes_text.get("1.0", tk.END).strip(),
+        })
+
+        # Character attribute -> view showing it (see AppController.register_ui_element)
+        self.field_views = {field: self._show_field for field in self._field_vars}
+        self.field_views.update({
+            "class_skill": self._show_class_skill,
+            "portrait_id": self._show_portrait_field,
+            "notes": self._show_notes,
+        })
+
+        # Register with controller (after the widgets exist, so the fields can be shown)
+        self.app_controller.register_ui_element("character_tab", self)
+
     def _setup_ui(self):
         """Setup the UI elements"""
         self.columnconfigure(0, weight=1)
@@ -48,38 +83,38 @@ class CharacterTab(ttk.Frame):
         self.name_var = tk.StringVar()
         self.name_entry = ttk.Entry(basic_frame, textvariable=self.name_var)
         self.name_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        self.name_entry.bind("<KeyRelease>", self._on_field_change)
+        self.name_entry.bind("<KeyRelease>", lambda e: self._on_field_change("name"))
 
         ttk.Label(basic_frame, text="Player Name:").grid(row=0, column=2, padx=5, pady=5, sticky="e")
         self.player_name_var = tk.StringVar()
         self.player_name_entry = ttk.Entry(basic_frame, textvariable=self.player_name_var)
         self.player_name_entry.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
-        self.player_name_entry.bind("<KeyRelease>", self._on_field_change)
+        self.player_name_entry.bind("<KeyRelease>", lambda e: self._on_field_change("player_name"))
 
         # Row 1: Level, EXP, Gender, Age
         ttk.Label(basic_frame, text="Level:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
         self.level_var = tk.IntVar(value=1)
         self.level_spinbox = ttk.Spinbox(basic_frame, from_=1, to=20, textvariable=self.level_var, width=5)
         self.level_spinbox.grid(row=1, column=1, padx=5, pady=5, sticky="w")
-        self.level_spinbox.bind("<KeyRelease>", self._on_field_change)
+        self.level_spinbox.bind("<KeyRelease>", lambda e: self._on_field_change("level"))
 
         ttk.Label(basic_frame, text="Experience:").grid(row=1, column=2, padx=5, pady=5, sticky="e")
         self.exp_var = tk.IntVar()
         self.exp_spinbox = ttk.Spinbox(basic_frame, from_=0, to=9999, textvariable=self.exp_var, width=5)
         self.exp_spinbox.grid(row=1, column=3, padx=5, pady=5, sticky="w")
-        self.exp_spinbox.bind("<KeyRelease>", self._on_field_change)
+        self.exp_spinbox.bind("<KeyRelease>", lambda e: self._on_field_change("exp"))
 
         ttk.Label(basic_frame, text="Gender:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
         self.gender_var = tk.StringVar()
         self.gender_entry = ttk.Entry(basic_frame, textvariable=self.gender_var, width=15)
         self.gender_entry.grid(row=2, column=1, padx=5, pady=5, sticky="w")
-        self.gender_entry.bind("<KeyRelease>", self._on_field_change)
+        self.gender_entry.bind("<KeyRelease>", lambda e: self._on_field_change("gender"))
 
         ttk.Label(basic_frame, text="Age:").grid(row=2, column=2, padx=5, pady=5, sticky="e")
         self.age_var = tk.StringVar()
         self.age_entry = ttk.Entry(basic_frame, textvariable=self.age_var, width=15)
         self.age_entry.grid(row=2, column=3, padx=5, pady=5, sticky="w")
-        self.age_entry.bind("<KeyRelease>", self._on_field_change)
+        self.age_entry.bind("<KeyRelease>", lambda e: self._on_field_change("age"))
 
         # Row 3: Class, Type
         ttk.Label(basic_frame, text="Class:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
@@ -89,7 +124,7 @@ class CharacterTab(ttk.Frame):
         self.class_combobox['values'] = ("Minstrel", "Merchant", "Hunter", "Healer", "Farmer", "Artisan", "Noble")
         self.class_combobox.grid(row=3, column=1, padx=5, pady=5, sticky="w")
         self.class_combobox.bind("<<ComboboxSelected>>", self._on_class_change)
-        self.class_combobox.bind("<KeyRelease>", self._on_field_change)
+        self.class_combobox.bind("<KeyRelease>", lambda e: self._on_field_change("character_class"))
 
         ttk.Label(basic_frame, text="Type:").grid(row=3, column=2, padx=5, pady=5, sticky="e")
         # Predefined Ryuutama types
@@ -98,7 +133,7 @@ class CharacterTab(ttk.Frame):
         self.type_combobox['values'] = ("Attack", "Technical", "Magic")
         self.type_combobox.grid(row=3, column=3, padx=5, pady=5, sticky="w")
         self.type_combobox.bind("<<ComboboxSelected>>", self._on_type_change)
-        self.type_combobox.bind("<KeyRelease>", self._on_field_change)
+        self.type_combobox.bind("<KeyRelease>", lambda e: self._on_field_change("type"))
 
         # Setup column weights for basic_frame
         for i in range(4):
@@ -126,21 +161,21 @@ class CharacterTab(ttk.Frame):
         self.stats_used_var = tk.StringVar()
         self.stats_used_entry = ttk.Entry(class_frame, textvariable=self.stats_used_var)
         self.stats_used_entry.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
-        self.stats_used_entry.bind("<KeyRelease>", self._on_field_change)
+        self.stats_used_entry.bind("<KeyRelease>", lambda e: self._on_field_change("stats_used"))
 
         # Row 1: Effect
         ttk.Label(class_frame, text="Effect:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
         self.effect_var = tk.StringVar()
         self.effect_entry = ttk.Entry(class_frame, textvariable=self.effect_var)
         self.effect_entry.grid(row=1, column=1, columnspan=3, padx=5, pady=5, sticky="ew")
-        self.effect_entry.bind("<KeyRelease>", self._on_field_change)
+        self.effect_entry.bind("<KeyRelease>", lambda e: self._on_field_change("effect"))
 
         # Row 2: Mastered Weapon, Specialized Terrain
         ttk.Label(class_frame, text="Mastered Weapon:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
         self.mastered_weapon_var = tk.StringVar()
         self.mastered_weapon_entry = ttk.Entry(class_frame, textvariable=self.mastered_weapon_var)
         self.mastered_weapon_entry.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
-        self.mastered_weapon_entry.bind("<KeyRelease>", self._on_field_change)
+        self.mastered_weapon_entry.bind("<KeyRelease>", lambda e: self._on_field_change("mastered_weapon"))
 
         ttk.Label(class_frame, text="Specialized Terrain:").grid(row=2, column=2, padx=5, pady=5, sticky="e")
         self.specialized_terrain_var = tk.StringVar()
@@ -149,15 +184,15 @@ class CharacterTab(ttk.Frame):
                          "Deep Forest", "Swamp", "Mountain", "Desert", "Jungle", "Alpine"]
         self.specialized_terrain_combobox['values'] = terrain_types
         self.specialized_terrain_combobox.grid(row=2, column=3, padx=5, pady=5, sticky="ew")
-        self.specialized_terrain_combobox.bind("<<ComboboxSelected>>", self._on_field_change)
-        self.specialized_terrain_combobox.bind("<KeyRelease>", self._on_field_change)
+        for sequence in ("<<ComboboxSelected>>", "<KeyRelease>"):
+            self.specialized_terrain_combobox.bind(sequence, lambda e: self._on_field_change("specialized_terrain"))
 
         # Row 3: Personal Item
         ttk.Label(class_frame, text="Personal Item:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
         self.personal_item_var = tk.StringVar()
         self.personal_item_entry = ttk.Entry(class_frame, textvariable=self.personal_item_var)
         self.personal_item_entry.grid(row=3, column=1, columnspan=3, padx=5, pady=5, sticky="ew")
-        self.personal_item_entry.bind("<KeyRelease>", self._on_field_change)
+        self.personal_item_entry.bind("<KeyRelease>", lambda e: self._on_field_change("personal_item"))
 
         # Setup column weights for class_frame
         for i in range(4):
@@ -171,8 +206,10 @@ class CharacterTab(ttk.Frame):
         image_frame = ttk.Frame(appearance_frame)
         image_frame.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
-        # Image path storage
-        self.image_path_var = tk.StringVar()
+        # Portrait store id of the current image
+        self.portrait_id_var = tk.StringVar()
+        # PhotoImages of the 96px renditions, by portrait id
+        self._portrait_photos = {}
 
         # Create a frame to display the image
         self.image_display_frame = ttk.LabelFrame(image_frame, text="Preview", width=100, height=100)
@@ -198,20 +235,20 @@ class CharacterTab(ttk.Frame):
         self.appearance_var = tk.StringVar()
         self.appearance_entry = ttk.Entry(appearance_frame, textvariable=self.appearance_var)
         self.appearance_entry.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
-        self.appearance_entry.bind("<KeyRelease>", self._on_field_change)
+        self.appearance_entry.bind("<KeyRelease>", lambda e: self._on_field_change("appearance"))
 
         # Row 1: Hometown, Reason for Travel
         ttk.Label(appearance_frame, text="Hometown:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
         self.hometown_var = tk.StringVar()
         self.hometown_entry = ttk.Entry(appearance_frame, textvariable=self.hometown_var)
         self.hometown_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
-        self.hometown_entry.bind("<KeyRelease>", self._on_field_change)
+        self.hometown_entry.bind("<KeyRelease>", lambda e: self._on_field_change("hometown"))
 
         ttk.Label(appearance_frame, text="Reason for Travel:").grid(row=1, column=2, padx=5, pady=5, sticky="e")
         self.reason_for_travel_var = tk.StringVar()
         self.reason_for_travel_entry = ttk.Entry(appearance_frame, textvariable=self.reason_for_travel_var)
         self.reason_for_travel_entry.grid(row=1, column=3, padx=5, pady=5, sticky="ew")
-        self.reason_for_travel_entry.bind("<KeyRelease>", self._on_field_change)
+        self.reason_for_travel_entry.bind("<KeyRelease>", lambda e: self._on_field_change("reason_for_travel"))
 
         # Setup column weights for appearance_frame
         for i in range(4):
@@ -220,33 +257,29 @@ class CharacterTab(ttk.Frame):
         # Notes section
         self.notes_text = tk.Text(notes_frame, wrap=tk.WORD, height=10)
         self.notes_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.notes_text.bind("<KeyRelease>", self._on_field_change)
+        self.notes_text.bind("<KeyRelease>", lambda e: self._on_field_change("notes"))
 
         # Add scrollbar to notes
         notes_scrollbar = ttk.Scrollbar(self.notes_text, command=self.notes_text.yview)
         self.notes_text.configure(yscrollcommand=notes_scrollbar.set)
         notes_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-    def _on_field_change(self, event=None):
-        """Handle field changes"""
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
+    def _on_field_change(self, field):
+        """Handle an edit of one field; it is copied into the character with the next sync"""
+        read = self._field_readers[field]
+        self.app_controller.ui_sync.mark(field, lambda character: setattr(character, field, read()))
 
     def _on_skill_text_change(self, event=None):
         """Handle changes to the skills text widget"""
-        # Update the skills variable for model consistency
-        skills_text = self.class_skill_text.get("1.0", tk.END).strip()
-        self.class_skill_var.set(skills_text)
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
+        self._on_field_change("class_skill")
 
     def _on_class_change(self, event=None):
         """Handle class selection change"""
-        # Get the selected class
-        character_class = self.class_var.get()
+        from utils.class_skills_data import CLASS_SKILLS
 
-        # Update character model first
-        self._update_character_from_ui()
+        # Get the selected class and store it (other fields sync on their own)
+        character_class = self.class_var.get()
+        self.app_controller.character.character_class = character_class
 
         # Set class skills if class is in the data
         if character_class in CLASS_SKILLS:
@@ -256,8 +289,9 @@ class CharacterTab(ttk.Frame):
             self.class_skill_text.delete("1.0", tk.END)
             self.class_skill_text.insert("1.0", ", ".join(skills))
 
-            # Update the variable
+            # Update the variable and the character
             self.class_skill_var.set(", ".join(skills))
+            self._on_field_change("class_skill")
 
             # Show a confirmation message
             messagebox.showinfo(
@@ -267,15 +301,13 @@ class CharacterTab(ttk.Frame):
             )
 
         # Mark changes
-        self.app_controller.mark_unsaved_changes()
+        self.app_controller.mark_unsaved_changes("character_class")
 
     def _on_type_change(self, event=None):
         """Handle character type changes and add appropriate abilities"""
-        # Get the selected type
+        # Get the selected type and store it (other fields sync on their own)
         character_type = self.type_var.get()
-
-        # Update character model first
-        self._update_character_from_ui()
+        self.app_controller.character.type = character_type
 
         # Prepare type-specific abilities
         type_abilities = {
@@ -295,10 +327,8 @@ class CharacterTab(ttk.Frame):
                 # Set the new abilities for level 1
                 self.app_controller.character.abilities[1] = ability_text
 
-                # Get the stats tab to refresh its UI
-                stats_tab = self.app_controller.ui_elements.get("stats_tab")
-                if stats_tab:
-                    stats_tab.update_from_character(self.app_controller.character)
+                # Show them on the stats tab
+                self.app_controller.notify_changed("type change", "abilities")
 
                 # Show a confirmation message
                 messagebox.showinfo(
@@ -307,10 +337,12 @@ class CharacterTab(ttk.Frame):
                 )
 
         # Mark changes
-        self.app_controller.mark_unsaved_changes()
+        self.app_controller.mark_unsaved_changes("type")
 
     def _show_skill_details(self, event=None):
         """Show details for skills when the skill entry is clicked"""
+        from utils.class_skills_data import CLASS_SKILLS
+
         # Get the current skills text
         skills_text = self.class_skill_text.get("1.0", tk.END).strip()
         if not skills_text:
@@ -401,8 +433,6 @@ class CharacterTab(ttk.Frame):
     def _browse_image(self, event=None):
         """Open a file dialog to select an image"""
         from tkinter import filedialog
-        import os
-        from PIL import Image, ImageTk
 
         # Open file dialog
         file_path = filedialog.askopenfilename(
@@ -416,139 +446,76 @@ class CharacterTab(ttk.Frame):
         # If a file was selected
         if file_path:
             try:
-                # Open the image
-                image = Image.open(file_path)
-
-                # Resize to fit the display area (100x100)
-                image.thumbnail((96, 96))
-
-                # Convert to PhotoImage
-                photo = ImageTk.PhotoImage(image)
+                # Add the image to the portrait store (decoded and scaled once)
+                portrait_id = self.app_controller.file_controller.portrait_store.import_image(file_path)
+                self._show_portrait(portrait_id)
 
-                # Update the label
-                self.image_label.configure(image=photo, text="")
-
-                # Keep a reference to prevent garbage collection
-                self.current_image = photo
-
-                # Store the image path
-                self.image_path_var.set(file_path)
+                # Store the portrait id
+                self.portrait_id_var.set(portrait_id)
 
                 # Update character model
-                self._update_character_from_ui()
-                self.app_controller.mark_unsaved_changes()
+                self.app_controller.character.portrait_id = portrait_id
+                self.app_controller.character.image_path = ""
+                self.app_controller.mark_unsaved_changes("portrait_id", "image_path")
 
             except Exception as e:
                 from tkinter import messagebox
                 messagebox.showerror("Image Error", f"Failed to load image: {e}")
 
+    def _show_portrait(self, portrait_id):
+        """Display the 96px rendition of a stored portrait, or "No Image" """
+        photo = self._portrait_photos.get(portrait_id)
+        if photo is None:
+            data = self.app_controller.file_controller.portrait_store.ui_data(portrait_id)
+            if data is None:
+                self.image_label.configure(image="", text="No Image")
+                self.current_image = None
+                return False
+            # The rendition is a small PNG, which Tk reads without PIL
+            photo = tk.PhotoImage(data=data)
+            self._portrait_photos[portrait_id] = photo
+
+        # Update the label
+        self.image_label.configure(image=photo, text="")
+
+        # Keep a reference to prevent garbage collection
+        self.current_image = photo
+        return True
+
     def _clear_image(self, event=None):
         """Clear the character image"""
         # Reset the image label
         self.image_label.configure(image="", text="No Image")
         self.current_image = None
 
-        # Clear the image path
-        self.image_path_var.set("")
+        # Clear the portrait
+        self.portrait_id_var.set("")
 
         # Update character model
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
-
-    def _update_character_from_ui(self):
-        """Update character model from UI values"""
-        character = self.app_controller.character
-
-        # Basic information
-        character.name = self.name_var.get()
-        character.player_name = self.player_name_var.get()
-        character.level = self.level_var.get()
-        character.exp = self.exp_var.get()
-        character.gender = self.gender_var.get()
-        character.age = self.age_var.get()
-        character.character_class = self.class_var.get()
-        character.type = self.type_var.get()
-
-        # Class details
-        character.class_skill = self.class_skill_text.get("1.0", tk.END).strip()
-        character.stats_used = self.stats_used_var.get()
-        character.effect = self.effect_var.get()
-        character.mastered_weapon = self.mastered_weapon_var.get()
-        character.specialized_terrain = self.specialized_terrain_var.get()
-        character.personal_item = self.personal_item_var.get()
-
-        # Appearance & Background
-        character.image_path = self.image_path_var.get()  # Store image path instead of color
-        character.appearance = self.appearance_var.get()
-        character.hometown = self.hometown_var.get()
-        character.reason_for_travel = self.reason_for_travel_var.get()
-
-        # Notes
-        character.notes = self.notes_text.get("1.0", tk.END).strip()
-
-    def update_from_character(self, character):
-        """Update UI from character model"""
-        # Basic information
-        self.name_var.set(character.name)
-        self.player_name_var.set(character.player_name)
-        self.level_var.set(character.level)
-        self.exp_var.set(character.exp)
-        self.gender_var.set(character.gender)
-        self.age_var.set(character.age)
-        self.class_var.set(character.character_class)
-        self.type_var.set(character.type)
-
-        # Class details
-        self.class_skill_text.delete("1.0", tk.END)
-        if character.class_skill:
-            self.class_skill_text.insert("1.0", character.class_skill)
-        self.class_skill_var.set(character.class_skill)
-
-        self.stats_used_var.set(character.stats_used)
-        self.effect_var.set(character.effect)
-        self.mastered_weapon_var.set(character.mastered_weapon)
-        self.specialized_terrain_var.set(character.specialized_terrain)
-        self.personal_item_var.set(character.personal_item)
-
-        # Appearance & Background
-        # Load image if path exists
-        if hasattr(character, 'image_path') and character.image_path:
-            try:
-                from PIL import Image, ImageTk
-                import os
-
-                if os.path.exists(character.image_path):
-                    # Set image path variable
-                    self.image_path_var.set(character.image_path)
-
-                    # Load and display the image
-                    image = Image.open(character.image_path)
-                    image.thumbnail((96, 96))
-                    photo = ImageTk.PhotoImage(image)
-
-                    # Update the label
-                    self.image_label.configure(image=photo, text="")
-
-                    # Keep a reference to prevent garbage collection
-                    self.current_image = photo
-                else:
-                    # Clear image if file doesn't exist
-                    self.image_label.configure(image="", text="No Image")
-                    self.current_image = None
-            except Exception:
-                # Clear image if loading fails
-                self.image_label.configure(image="", text="No Image")
-                self.current_image = None
-        else:
-            # Clear image if no path
+        self.app_controller.character.portrait_id = ""
+        self.app_controller.character.image_path = ""
+        self.app_controller.mark_unsaved_changes("portrait_id", "image_path")
+
+    def _show_field(self, field, value):
+        """Show a character attribute kept in one variable"""
+        return update_var(self._field_vars[field], value)
+
+    def _show_class_skill(self, field, class_skill):
+        """Show the class skills"""
+        return update_text(self.class_skill_text, class_skill) + update_var(self.class_skill_var, class_skill)
+
+    def _show_notes(self, field, notes):
+        """Show the notes"""
+        return update_text(self.notes_text, notes)
+
+    def _show_portrait_field(self, field, portrait_id):
+        """Show the stored portrait (older saves are imported by FileController.load_character)"""
+        if not update_var(self.portrait_id_var, portrait_id):
+            return 0
+        try:
+            self._show_portrait(portrait_id)
+        except Exception:
+            # Clear image if loading fails
             self.image_label.configure(image="", text="No Image")
             self.current_image = None
-
-        self.appearance_var.set(character.appearance)
-        self.hometown_var.set(character.hometown)
-        self.reason_for_travel_var.set(character.reason_for_travel)
-
-        # Notes
-        self.notes_text.delete("1.0", tk.END)
-        if character.notes:
-            self.notes_text.insert("1.0", character.notes)
\ No newline at end of file
+        return 2
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 from models.conditions import StatusEffect
+from controllers.view_updates import update_var
 
 
 class ConditionsTab(ttk.Frame):
@@ -10,12 +11,23 @@ class ConditionsTab(ttk.Frame):
         super().__init__(parent)
         self.app_controller = app_controller
 
-        # Register with controller
-        self.app_controller.register_ui_element("conditions_tab", self)
-
         # Setup UI
         self._setup_ui()
 
+        # Character attribute -> view showing it (see AppController.register_ui_element);
+        # cure chances depend on the stats, which are edited on the stats tab
+        self.field_views = {
+            "status_effects": self._show_status_effects,
+            "condition_checks": self._show_condition_checks,
+            "str": self._show_cure_chances,
+            "dex": self._show_cure_chances,
+            "int": self._show_cure_chances,
+            "spi": self._show_cure_chances,
+        }
+
+        # Register with controller (after the widgets exist, so the fields can be shown)
+        self.app_controller.register_ui_element("conditions_tab", self)
+
     def _setup_ui(self):
         """Setup the UI elements"""
         self.columnconfigure(0, weight=1)
@@ -34,7 +46,7 @@ class ConditionsTab(ttk.Frame):
         # Add description
         ttk.Label(
             status_effects_frame,
-            text="If the next day's Condition Check is higher than the status effect number, it is cured.",
+            text="If the next day's Condition Check is equal to or higher than the status effect number, it is cured.",
             wraplength=600
         ).pack(padx=5, pady=5, anchor="w")
 
@@ -51,12 +63,15 @@ class ConditionsTab(ttk.Frame):
                                                                                     sticky="w")
         ttk.Label(effects_frame, text="Recovery Value", font=("Helvetica", 10, "bold")).grid(row=0, column=3, padx=5,
                                                                                              pady=5, sticky="w")
-        ttk.Label(effects_frame, text="Active", font=("Helvetica", 10, "bold")).grid(row=0, column=4, padx=5, pady=5,
+        ttk.Label(effects_frame, text="Chance to Cure", font=("Helvetica", 10, "bold")).grid(row=0, column=4, padx=5,
+                                                                                             pady=5, sticky="w")
+        ttk.Label(effects_frame, text="Active", font=("Helvetica", 10, "bold")).grid(row=0, column=5, padx=5, pady=5,
                                                                                      sticky="w")
 
         # Create a row for each status effect
         effect_types = ["injury", "tired", "poison", "muddled", "sick", "shock"]
         self.status_vars = {}
+        self.cure_chance_vars = {}
 
         for i, effect_type in enumerate(effect_types):
             effect = StatusEffect(effect_type)
@@ -69,13 +84,18 @@ class ConditionsTab(ttk.Frame):
             ttk.Label(effects_frame, text=effect.effect_type.capitalize()).grid(row=row, column=1, padx=5, pady=5,
                                                                                 sticky="w")
 
-            # Check stat
-            ttk.Label(effects_frame, text=effect.check_stat.upper()).grid(row=row, column=2, padx=5, pady=5, sticky="w")
+            # Check stats
+            ttk.Label(effects_frame, text=" + ".join(effect.check_stats).upper()).grid(row=row, column=2, padx=5, pady=5, sticky="w")
 
             # Recovery value
             ttk.Label(effects_frame, text=str(effect.recovery_value)).grid(row=row, column=3, padx=5, pady=5,
                                                                            sticky="w")
 
+            # Chance that the recovery roll cures it
+            cure_chance_var = tk.StringVar(value="")
+            self.cure_chance_vars[effect_type] = cure_chance_var
+            ttk.Label(effects_frame, textvariable=cure_chance_var).grid(row=row, column=4, padx=5, pady=5, sticky="w")
+
             # Active checkbox
             status_var = tk.BooleanVar(value=False)
             self.status_vars[effect_type] = status_var
@@ -84,21 +104,22 @@ class ConditionsTab(ttk.Frame):
                 variable=status_var,
                 command=lambda et=effect_type: self._on_status_change(et)
             )
-            status_cb.grid(row=row, column=4, padx=5, pady=5, sticky="w")
+            status_cb.grid(row=row, column=5, padx=5, pady=5, sticky="w")
 
             # Effect description
-            ttk.Label(effects_frame, text=f"Effect: {effect.effect}", wraplength=450).grid(row=row, column=5, padx=5,
+            ttk.Label(effects_frame, text=f"Effect: {effect.effect}", wraplength=450).grid(row=row, column=6, padx=5,
                                                                                            pady=5, sticky="w")
 
         # Set column weights
-        effects_frame.columnconfigure(5, weight=1)
+        effects_frame.columnconfigure(6, weight=1)
 
         # Healing & Recovery Section
         # Add description
         ttk.Label(
             healing_frame,
-            text="To attempt recovery from a status effect, make a Condition Check using the appropriate stat. "
-                 "If the result is higher than the recovery value, the status effect is cured.",
+            text="To attempt recovery from a status effect, make a Condition Check: roll the die of the "
+                 "appropriate stat and your SPI die. If the result is equal to or higher than the recovery value, "
+                 "the status effect is cured. A critical always cures it and a fumble never does.",
             wraplength=600
         ).pack(padx=5, pady=5, anchor="w")
 
@@ -146,10 +167,14 @@ class ConditionsTab(ttk.Frame):
         for i in range(4):
             recovery_frame.columnconfigure(i, weight=1)
 
+        # Result of the last roll
+        self.roll_result_var = tk.StringVar(value="")
+        ttk.Label(healing_frame, textvariable=self.roll_result_var).pack(padx=5, anchor="w")
+
         # Add roll explanation
         ttk.Label(
             healing_frame,
-            text="Note: The 'Roll' buttons simulate a die roll based on your character's stats for recovery checks. "
+            text="Note: The 'Roll' buttons roll the two dice of the check (the stat and SPI) for recovery checks. "
                  "In a real game, you would roll actual dice.",
             wraplength=600,
             font=("Helvetica", 8)
@@ -158,7 +183,6 @@ class ConditionsTab(ttk.Frame):
         # Notes Section
         self.notes_text = tk.Text(notes_frame, wrap=tk.WORD, height=6)
         self.notes_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.notes_text.bind("<KeyRelease>", self._on_notes_change)
 
         # Add scrollbar to notes
         notes_scrollbar = ttk.Scrollbar(self.notes_text, command=self.notes_text.yview)
@@ -172,45 +196,53 @@ class ConditionsTab(ttk.Frame):
         """Handle status effect checkbox change"""
         # Update character's status effects
         self.app_controller.character.status_effects[effect_type] = self.status_vars[effect_type].get()
-        self.app_controller.mark_unsaved_changes()
-
-    def _on_notes_change(self, event=None):
-        """Handle notes text change"""
-        # In a real app, this would update some character field
+        self.app_controller.notify_changed("status change", "status_effects")
         self.app_controller.mark_unsaved_changes()
 
     def _simulate_roll(self, stat_name):
-        """Simulate a die roll for a condition check"""
-        import random
+        """Roll the recovery check of a stat ([STAT + SPI]) with the dice engine"""
+        from models.dice import check_modifier, get_engine
 
-        # Get character's stat value and die size
         character = self.app_controller.character
-        stat_info = getattr(character, stat_name)
-
-        # Parse die size (e.g., "d6" -> 6)
-        die_size = int(stat_info["die_size"][1:])
-
-        # Roll the die
-        roll = random.randint(1, die_size)
-
-        # Add stat value
-        total = roll + stat_info["value"]
-
-        # Update the check variable
-        check_var = getattr(self, f"{stat_name}_check_var")
-        check_var.set(total)
+        first_stat, second_stat = StatusEffect.recovery_check_stats(stat_name)
+        totals, critical, fumble = get_engine().roll_check(
+            getattr(character, first_stat).die_size,
+            getattr(character, second_stat).die_size,
+            check_modifier(character, (first_stat, second_stat))
+        )
+        total, critical, fumble = int(totals[0]), bool(critical[0]), bool(fumble[0])
 
         # Save the check value to character
         character.condition_checks[stat_name] = total
 
+        # Show the roll, with criticals and fumbles
+        result = f"[{first_stat.upper()} + {second_stat.upper()}] rolled {total}"
+        if critical:
+            result += " - critical!"
+        elif fumble:
+            result += " - fumble!"
+        self.roll_result_var.set(result)
+
         # Update status effects based on check result
-        self._check_status_recovery(stat_name, total)
+        cured = self._check_status_recovery(stat_name, total, critical, fumble)
+
+        # Show the check (here and on the stats tab) and the cured effects
+        self.app_controller.notify_changed("condition roll", "condition_checks", "status_effects")
+        from tkinter import messagebox
+        for effect_type in cured:
+            messagebox.showinfo(
+                "Status Recovery",
+                f"The {effect_type.capitalize()} status effect has been cured!"
+            )
 
         # Mark changes
         self.app_controller.mark_unsaved_changes()
 
-    def _check_status_recovery(self, stat_name, check_value):
-        """Check if any status effects are cured by this check"""
+    def _check_status_recovery(self, stat_name, check_value, critical=False, fumble=False):
+        """Cure the status effects this check recovers from; returns their types"""
+        cured = []
+        if fumble:
+            return cured
         # Get all status effects that use this stat for recovery
         for effect_type, is_active in self.app_controller.character.status_effects.items():
             if not is_active:
@@ -218,28 +250,30 @@ class ConditionsTab(ttk.Frame):
 
             effect = StatusEffect(effect_type)
             if effect.check_stat == stat_name:
-                # Check if the roll is higher than the recovery value
-                if check_value > effect.recovery_value:
+                # A critical, or a total of at least the recovery value, cures it
+                if critical or check_value >= effect.recovery_value:
                     # Cure the status effect
-                    self.status_vars[effect_type].set(False)
                     self.app_controller.character.status_effects[effect_type] = False
+                    cured.append(effect_type)
+        return cured
 
-                    # Show a message
-                    from tkinter import messagebox
-                    messagebox.showinfo(
-                        "Status Recovery",
-                        f"The {effect_type.capitalize()} status effect has been cured!"
-                    )
-
-    def update_from_character(self, character):
-        """Update UI from character model"""
-        # Update status effect checkboxes
-        for effect_type, is_active in character.status_effects.items():
+    def _show_status_effects(self, field, status_effects):
+        """Show the status effect checkboxes, and the cure chances they modify"""
+        written = 0
+        for effect_type, is_active in status_effects.items():
             if effect_type in self.status_vars:
-                self.status_vars[effect_type].set(is_active)
+                written += update_var(self.status_vars[effect_type], is_active)
+        return written + self._show_cure_chances(field, status_effects)
+
+    def _show_condition_checks(self, field, condition_checks):
+        """Show the condition check values"""
+        return sum(update_var(getattr(self, f"{stat_name}_check_var"), condition_checks[stat_name])
+                   for stat_name in ("str", "dex", "int", "spi"))
 
-        # Update condition check values
-        self.str_check_var.set(character.condition_checks["str"])
-        self.dex_check_var.set(character.condition_checks["dex"])
-        self.int_check_var.set(character.condition_checks["int"])
-        self.spi_check_var.set(character.condition_checks["spi"])
\ No newline at end of file
+    def _show_cure_chances(self, field, stat):
+        """Show the chance that a recovery roll cures each status effect"""
+        from models.probability import cure_chance
+
+        character = self.app_controller.character
+        return sum(update_var(cure_chance_var, f"{cure_chance(character, effect_type):.0%}")
+                   for effect_type, cure_chance_var in self.cure_chance_vars.items())
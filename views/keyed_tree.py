@@ -0,0 +1,172 @@
+"""
+Ryuutama Character Sheet - Keyed Treeview
+Keeps a ttk.Treeview in step with a list of rows identified by stable keys.
+
+Refreshing compares the new rows with the ones on screen by key: only
+new rows are inserted, changed rows updated, moved rows moved and
+missing rows deleted, so buying one item writes one row instead of
+rebuilding the list. A running total of one numeric column is kept
+along the way.
+
+Long lists (caravans, merchants) are virtualized: the Treeview only holds
+the rows in view and the scrollbar is driven by the position in the full
+list. Rows scrolled out of view lose their selection.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+# Lists with more rows than this only materialize the rows in view
+VIRTUAL_THRESHOLD = 200
+
+# Row height used when the theme does not define one
+DEFAULT_ROW_HEIGHT = 20
+
+# Rows scrolled per mouse wheel step in a virtualized list
+WHEEL_ROWS = 3
+
+
+class KeyedTreeview:
+    """Rows of one Treeview, keyed by an id that stays the same across edits"""
+
+    def __init__(self, tree, scrollbar, total_column=None, virtual_threshold=VIRTUAL_THRESHOLD):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.total_column = total_column  # Index of the column summed into total, if any
+        self.virtual_threshold = virtual_threshold
+
+        self.keys = []  # Keys of all rows, in order
+        self.values = {}  # key -> values of every row
+        self.total = 0  # Sum of total_column over all rows
+
+        self.shown = []  # Keys of the rows in the Treeview, in order
+        self._shown_values = {}  # key -> values as last written to the Treeview
+        self.virtual = False
+        self.offset = 0  # Index of the first shown row while virtualized
+        self._row_height = None
+
+        tree.bind("<Configure>", self._on_resize, add="+")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(sequence, self._on_wheel, add="+")
+
+    def update(self, rows):
+        """Show rows, an iterable of (key, values); returns the number of Treeview rows written"""
+        keys = []
+        values = {}
+        total = self.total
+        column = self.total_column
+        for key, row_values in rows:
+            key = str(key)
+            row_values = tuple(row_values)
+            if column is not None:
+                old_values = self.values.pop(key, None)
+                if old_values != row_values:
+                    total += row_values[column] - (old_values[column] if old_values is not None else 0)
+            keys.append(key)
+            values[key] = row_values
+
+        if column is not None:
+            # Rows left over were removed
+            total -= sum(old_values[column] for old_values in self.values.values())
+
+        self.keys, self.values, self.total = keys, values, total
+        return self._render()
+
+    def _render(self):
+        """Bring the Treeview in line with the rows in view"""
+        virtual = len(self.keys) > self.virtual_threshold
+        if virtual != self.virtual:
+            self._set_virtual(virtual)
+        if not virtual:
+            return self._sync(self.keys)
+
+        visible = self._visible_rows()
+        self.offset = max(0, min(self.offset, len(self.keys) - visible))
+        written = self._sync(self.keys[self.offset:self.offset + visible])
+        self.scrollbar.set(self.offset / len(self.keys), (self.offset + visible) / len(self.keys))
+        return written
+
+    def _sync(self, wanted):
+        """Delete, insert, update and move Treeview rows until they are wanted (a list of keys)"""
+        tree = self.tree
+        written = 0
+        wanted_keys = set(wanted)
+
+        stale = [key for key in self.shown if key not in wanted_keys]
+        if stale:
+            tree.delete(*stale)
+            for key in stale:
+                del self._shown_values[key]
+            written += len(stale)
+
+        shown = [key for key in self.shown if key in wanted_keys]
+        for index, key in enumerate(wanted):
+            values = self.values[key]
+            shown_values = self._shown_values.get(key)
+            if shown_values is None:
+                tree.insert("", index, iid=key, values=values)
+                shown.insert(index, key)
+                written += 1
+            else:
+                if shown_values != values:
+                    tree.item(key, values=values)
+                    written += 1
+                if shown[index] != key:
+                    tree.move(key, "", index)
+                    shown.remove(key)
+                    shown.insert(index, key)
+                    written += 1
+            self._shown_values[key] = values
+
+        self.shown = shown
+        return written
+
+    def _set_virtual(self, virtual):
+        """Switch the scrollbar between the Treeview and the position in the full list"""
+        self.virtual = virtual
+        self.offset = 0
+        if virtual:
+            self.tree.configure(yscrollcommand="")
+            self.scrollbar.configure(command=self._on_scroll)
+        else:
+            self.tree.configure(yscrollcommand=self.scrollbar.set)
+            self.scrollbar.configure(command=self.tree.yview)
+
+    def _visible_rows(self):
+        """Rows that fit in the Treeview (its height option until it is laid out)"""
+        if self._row_height is None:
+            try:
+                self._row_height = int(ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+            except (tk.TclError, ValueError):
+                self._row_height = DEFAULT_ROW_HEIGHT
+        height = self.tree.winfo_height()
+        if height > 2 * self._row_height:
+            # One row's worth of height goes to the headings
+            return max(1, height // self._row_height - 1)
+        return int(self.tree.cget("height"))
+
+    def _scroll_to(self, offset):
+        self.offset = offset
+        self._render()
+
+    def _on_scroll(self, action, amount, unit=None):
+        """Scrollbar command while virtualized"""
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self.keys)))
+        elif action == "scroll":
+            step = self._visible_rows() if unit == "pages" else 1
+            self._scroll_to(self.offset + int(amount) * step)
+
+    def _on_wheel(self, event):
+        """Mouse wheel while virtualized; otherwise the Treeview scrolls itself"""
+        if not self.virtual:
+            return None
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self.offset - WHEEL_ROWS)
+        else:
+            self._scroll_to(self.offset + WHEEL_ROWS)
+        return "break"
+
+    def _on_resize(self, event=None):
+        if self.virtual:
+            self._render()
@@ -1,42 +1,68 @@
+import importlib
 import tkinter as tk
 from tkinter import ttk
-import sv_ttk
 import sys
 import os
 
 # Ensure we can import from parent directory
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from views.character_tab import CharacterTab
-from views.stats_tab import StatsTab
-from views.equipment_tab import EquipmentTab
-from views.travel_tab import TravelTab
-from views.conditions_tab import ConditionsTab
 from controllers.app_controller import AppController
 
 
+# SV-TTK themes offered in the Theme menu
+THEMES = ("light", "dark")
+
+
 class MainWindow:
     """Main application window with tabbed interface"""
 
-    def __init__(self, root):
+    # (title, attribute, module, class) of each tab; a tab's module is imported
+    # and the tab built when it is first shown
+    TABS = (
+        ("Character", "character_tab", "views.character_tab", "CharacterTab"),
+        ("Stats", "stats_tab", "views.stats_tab", "StatsTab"),
+        ("Equipment", "equipment_tab", "views.equipment_tab", "EquipmentTab"),
+        ("Travel", "travel_tab", "views.travel_tab", "TravelTab"),
+        ("Conditions", "conditions_tab", "views.conditions_tab", "ConditionsTab"),
+    )
+
+    def __init__(self, root, startup_profile=None):
         self.root = root
         self.root.title("Ryuutama Character Sheet")
         self.root.minsize(800, 600)
         self.root.geometry("900x700")
 
-        # Apply SV-TTK theme
-        sv_ttk.set_theme("light")
+        # Phase timings for main.py --profile-startup
+        self.startup_profile = startup_profile
 
         # Create app controller
         self.app_controller = AppController(self.root)
+        self._mark("controller")
+
+        # Reopen the character, theme and tab of the last session
+        session = self.app_controller.restore_session() or {}
+        self._mark("session")
+
+        # Apply SV-TTK theme
+        self.theme = None
+        self._set_theme(session.get("theme") if session.get("theme") in THEMES else "light")
+        self._mark("theme")
+
+        self.search_dialog = None
 
         # Setup UI
         self._setup_menu()
-        self._setup_tabs()
+        self._mark("menu")
+        self._setup_tabs(session.get("tab"))
+        self._mark("tabs")
 
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Restore edits journaled by a session that crashed
+        self.root.after_idle(self.app_controller.recover_from_journal)
+
     def _setup_menu(self):
         """Create application menu"""
         menubar = tk.Menu(self.root)
@@ -54,14 +80,23 @@ class MainWindow:
         file_menu.add_separator()
         file_menu.add_command(label="Export to PDF...", command=self.app_controller.export_to_pdf)
         file_menu.add_separator()
+        file_menu.add_command(label="Export Campaign...", command=self.app_controller.export_campaign)
+        file_menu.add_command(label="Import Campaign...", command=self.app_controller.import_campaign)
+        file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self._on_close)
 
         menubar.add_cascade(label="File", menu=file_menu)
 
+        # Rulebook menu
+        rulebook_menu = tk.Menu(menubar, tearoff=0)
+        rulebook_menu.add_command(label="Search...", command=self._open_search, accelerator="Ctrl+F")
+
+        menubar.add_cascade(label="Rulebook", menu=rulebook_menu)
+
         # Theme menu
         theme_menu = tk.Menu(menubar, tearoff=0)
-        theme_menu.add_command(label="Light Theme", command=lambda: sv_ttk.set_theme("light"))
-        theme_menu.add_command(label="Dark Theme", command=lambda: sv_ttk.set_theme("dark"))
+        theme_menu.add_command(label="Light Theme", command=lambda: self._set_theme("light"))
+        theme_menu.add_command(label="Dark Theme", command=lambda: self._set_theme("dark"))
 
         menubar.add_cascade(label="Theme", menu=theme_menu)
 
@@ -78,26 +113,62 @@ class MainWindow:
         self.root.bind("<Control-o>", lambda e: self.app_controller.load_character())
         self.root.bind("<Control-s>", lambda e: self.app_controller.save_character(False))
         self.root.bind("<Control-Shift-S>", lambda e: self.app_controller.save_character(True))
+        self.root.bind("<Control-f>", lambda e: self._open_search())
 
-    def _setup_tabs(self):
-        """Create tabbed interface"""
+    def _setup_tabs(self, selected_tab=None):
+        """Create tabbed interface, showing the tab named selected_tab (an attribute in TABS)"""
         # Create notebook widget
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Create tabs
-        self.character_tab = CharacterTab(self.notebook, self.app_controller)
-        self.stats_tab = StatsTab(self.notebook, self.app_controller)
-        self.equipment_tab = EquipmentTab(self.notebook, self.app_controller)
-        self.travel_tab = TravelTab(self.notebook, self.app_controller)
-        self.conditions_tab = ConditionsTab(self.notebook, self.app_controller)
-
-        # Add tabs to notebook
-        self.notebook.add(self.character_tab, text="Character")
-        self.notebook.add(self.stats_tab, text="Stats")
-        self.notebook.add(self.equipment_tab, text="Equipment")
-        self.notebook.add(self.travel_tab, text="Travel")
-        self.notebook.add(self.conditions_tab, text="Conditions")
+        # Add an empty page per tab; the tab is built into it when first selected.
+        # Tabs register with the controller when built and then show the current
+        # character, so unbuilt tabs need no updates (see AppController._update_ui).
+        self._tab_factories = {}  # page name -> (attribute, module, class) of tabs not built yet
+        for title, attribute, module_name, class_name in self.TABS:
+            page = ttk.Frame(self.notebook)
+            self.notebook.add(page, text=title)
+            self._tab_factories[str(page)] = (attribute, module_name, class_name)
+            setattr(self, attribute, None)
+            if attribute == selected_tab:
+                self.notebook.select(page)
+
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._build_tab(self.notebook.select()))
+        self._build_tab(self.notebook.select())
+
+    def _build_tab(self, page_name):
+        """Build the tab of a notebook page if that has not happened yet"""
+        if page_name not in self._tab_factories:
+            return
+        attribute, module_name, class_name = self._tab_factories.pop(page_name)
+        factory = getattr(importlib.import_module(module_name), class_name)
+        tab = factory(self.notebook.nametowidget(page_name), self.app_controller)
+        tab.pack(fill=tk.BOTH, expand=True)
+        setattr(self, attribute, tab)
+
+    def _selected_tab(self):
+        """Attribute name (in TABS) of the tab being shown"""
+        return self.TABS[self.notebook.index(self.notebook.select())][1]
+
+    def _set_theme(self, theme):
+        """Switch between the light and dark SV-TTK theme"""
+        import sv_ttk
+        sv_ttk.set_theme(theme)
+        self.theme = theme
+
+    def _mark(self, phase):
+        """End a startup phase when profiling the startup"""
+        if self.startup_profile is not None:
+            self.startup_profile.mark(phase)
+
+    def _open_search(self):
+        """Open the rulebook search window, or bring it forward if it is open"""
+        if self.search_dialog is not None and self.search_dialog.winfo_exists():
+            self.search_dialog.show()
+        else:
+            # Imported here: the search index pulls in the whole rulebook
+            from views.search_dialog import SearchDialog
+            self.search_dialog = SearchDialog(self.root)
 
     def _show_about(self):
         """Show about dialog"""
@@ -151,10 +222,18 @@ class MainWindow:
 
     def _on_close(self):
         """Handle window close event"""
+        # Record edits still being typed, and let any background save finish,
+        # before deciding whether changes are unsaved
+        self.app_controller.ui_sync.flush()
+        self.app_controller.finish_pending_saves()
         if self.app_controller.unsaved_changes:
             if not self._confirm_exit():
                 return
+            # The user chose to drop the changes, so there is nothing to recover
+            self.app_controller.discard_journal()
 
+        self.app_controller.save_session(self.theme, self._selected_tab())
+        self.app_controller.file_controller.save_worker.stop()
         self.root.destroy()
 
     def _confirm_exit(self):
@@ -0,0 +1,39 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class ProgressDialog:
+    """Small modal window with a progress bar for long-running file operations"""
+
+    def __init__(self, parent, title):
+        self.parent = parent
+        self.window = tk.Toplevel(parent)
+        self.window.title(title)
+        self.window.geometry("400x110")
+        self.window.resizable(False, False)
+        self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", lambda: None)  # Can't be closed mid-operation
+
+        frame = ttk.Frame(self.window, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.status_var = tk.StringVar(value="Starting...")
+        ttk.Label(frame, textvariable=self.status_var, width=55).pack(anchor="w", pady=(0, 10))
+
+        self.progress = ttk.Progressbar(frame, mode="determinate", length=370)
+        self.progress.pack(fill=tk.X)
+
+        self.window.grab_set()
+        self.window.update()
+
+    def update(self, done, total, text=""):
+        """Show progress; call from the operation's progress callback"""
+        self.progress.configure(maximum=max(total, 1), value=done)
+        self.status_var.set(f"{done} / {total}  {text}")
+        # Redraw without processing user input
+        self.window.update_idletasks()
+
+    def close(self):
+        """Close the dialog"""
+        self.window.grab_release()
+        self.window.destroy()
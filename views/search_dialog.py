@@ -0,0 +1,100 @@
+import tkinter as tk
+from tkinter import ttk
+
+from utils.search_index import get_index
+
+
+class SearchDialog(tk.Toplevel):
+    """Window for searching class skills, equipment, status effects, terrain and weather"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("Search Rulebook")
+        self.minsize(600, 400)
+        self.transient(parent)  # Set to be on top of the main window
+
+        self.index = get_index()
+        self.results = []  # (score, document) of the current query
+
+        # Setup UI
+        self._setup_ui()
+
+        # Center on parent
+        self.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.show()
+
+    def _setup_ui(self):
+        """Setup the dialog UI"""
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Search field, searched on every keystroke
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
+        self.query_var = tk.StringVar()
+        self.query_entry = ttk.Entry(search_frame, textvariable=self.query_var, width=40)
+        self.query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.query_var.trace_add("write", lambda *args: self._on_query_change())
+
+        # Results
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        columns = ("title", "kind", "location")
+        self.results_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=12)
+        self.results_tree.heading("title", text="Name")
+        self.results_tree.heading("kind", text="Type")
+        self.results_tree.heading("location", text="Where")
+        self.results_tree.column("title", width=200)
+        self.results_tree.column("kind", width=120)
+        self.results_tree.column("location", width=150)
+
+        results_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.results_tree.yview)
+        self.results_tree.configure(yscrollcommand=results_scrollbar.set)
+        self.results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.results_tree.bind("<<TreeviewSelect>>", self._on_result_select)
+
+        # Text of the selected result
+        text_frame = ttk.LabelFrame(main_frame, text="Details")
+        text_frame.pack(fill=tk.X, pady=10)
+        self.text_var = tk.StringVar(value="Type a word to search the rulebook")
+        ttk.Label(text_frame, textvariable=self.text_var, wraplength=570).pack(fill=tk.X, padx=5, pady=5)
+
+        ttk.Button(main_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+
+    def show(self):
+        """Bring the window forward with the search field selected"""
+        self.deiconify()
+        self.lift()
+        self.query_entry.focus_set()
+        self.query_entry.select_range(0, tk.END)
+
+    def _on_query_change(self):
+        """Search again and show the results"""
+        self.results = self.index.search(self.query_var.get())
+        self.results_tree.delete(*self.results_tree.get_children())
+        for position, (score, document) in enumerate(self.results):
+            self.results_tree.insert("", tk.END, iid=str(position), values=(
+                document["title"],
+                document["kind"],
+                document["location"]
+            ))
+
+        if self.results:
+            self.results_tree.selection_set("0")
+        elif self.query_var.get().strip():
+            self.text_var.set("No matches")
+        else:
+            self.text_var.set("Type a word to search the rulebook")
+
+    def _on_result_select(self, event):
+        """Show the text of the selected result"""
+        selected = self.results_tree.selection()
+        if selected:
+            score, document = self.results[int(selected[0])]
+            self.text_var.set(document["text"] or document["body"])
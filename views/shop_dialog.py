@@ -0,0 +1,345 @@
+"""
+Ryuutama Character Sheet - Shop Dialog
+One window for buying weapons, armor, shields and items from the rulebook.
+
+The window is built once, with a row for every rulebook entry, and is
+withdrawn instead of destroyed when it is closed. Choosing a category,
+typing in the search field (which searches every category) or sorting
+sets the rows attached to the list in a single Treeview call, detaching
+the others, and rows the character cannot afford are greyed out by
+changing their tag, so no row is inserted again after the window is built.
+"""
+
+import re
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+# Category filters besides the categories of the rulebook entries
+ALL = "All"
+ALL_ITEMS = "All Items"
+
+WORD = re.compile(r"[a-z0-9]+")
+
+# Columns the list can be sorted by, with the sort key of an entry
+SORT_KEYS = {
+    "name": lambda entry: entry.name.lower(),
+    "price": lambda entry: (entry.price, entry.name.lower()),
+    "size": lambda entry: (entry.size, entry.name.lower()),
+}
+
+HEADINGS = {"name": "Name", "category": "Category", "price": "Price", "size": "Size", "equip": "Equip",
+            "stats": "Stats"}
+
+UNAFFORDABLE_COLOR = "gray55"
+
+
+def entry_stats(entry):
+    """Short summary of what an entry does in play"""
+    details = entry.details
+    if entry.kind == "weapon":
+        return f"Accuracy {details['accuracy']}, Damage {details['damage']}"
+    if entry.kind == "armor":
+        return f"Defense {details['defense']}, Penalty {details['penalty']}"
+    if entry.kind == "shield":
+        return f"Defense {details['defense']}, Penalty {details['penalty']}, Dodge {details['dodge']}"
+    # Some items have a bonus and others a capacity, depending on the category
+    return str(details.get('bonus', details.get('capacity', '-')))
+
+
+class ShopRows:
+    """
+    Rows of every catalog entry in one Treeview, filtered, sorted and
+    greyed out in place. Each method returns the number of Treeview
+    calls it made.
+    """
+
+    def __init__(self, tree, catalog):
+        self.tree = tree
+        self.entries = catalog.entries  # id -> CatalogEntry, in rulebook order
+
+        # Category filter -> ids, in rulebook order
+        self.categories = {ALL: list(self.entries), ALL_ITEMS: []}
+        for entry_id, entry in self.entries.items():
+            self.categories.setdefault(entry.category, []).append(entry_id)
+            if entry.kind == "item":
+                self.categories[ALL_ITEMS].append(entry_id)
+
+        # Search words of each entry
+        self._words = {
+            entry_id: frozenset(WORD.findall(" ".join(
+                [entry.name, entry.category, entry.equip, entry.description]
+                + [str(value) for value in entry.details.values()]).lower()))
+            for entry_id, entry in self.entries.items()
+        }
+
+        self._orders = {}  # column -> ids sorted by that column, computed once
+        self.sort_column = None  # None keeps the rulebook order
+        self.descending = False
+
+        self.category = ALL
+        self.query = ""
+        self._query_matches = None  # ids matching query, or None for no query
+
+        self._affordable = {}  # id -> whether the row is shown as affordable
+
+        tree.tag_configure("unaffordable", foreground=UNAFFORDABLE_COLOR)
+        for entry_id, entry in self.entries.items():
+            tree.insert("", tk.END, iid=entry_id, values=(
+                entry.name,
+                entry.category,
+                f"{entry.price}g",
+                entry.size,
+                entry.equip,
+                entry_stats(entry)
+            ))
+            self._affordable[entry_id] = True
+        self.shown = list(self.entries)  # ids of the attached rows, in order
+
+    def filter(self, category=None, query=None):
+        """Show the rows of a category whose words start with every word of the query"""
+        if category is not None:
+            self.category = category if category in self.categories else ALL
+        if query is not None and query != self.query:
+            words = WORD.findall(query.lower())
+            if not words:
+                self._query_matches = None
+            else:
+                # Typing on narrows the previous matches, so only those are checked again
+                narrower = self._query_matches is not None and query.startswith(self.query)
+                candidates = self._query_matches if narrower else self.entries
+                self._query_matches = {
+                    entry_id for entry_id in candidates
+                    if all(any(word.startswith(prefix) for word in self._words[entry_id]) for prefix in words)
+                }
+            self.query = query
+        return self._render()
+
+    def sort_by(self, column):
+        """Sort by a column of SORT_KEYS; sorting by the same column again reverses the order"""
+        if column == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        return self._render()
+
+    def set_gold(self, gold):
+        """Grey out the rows that cost more than gold"""
+        calls = 0
+        for entry_id, entry in self.entries.items():
+            affordable = entry.price <= gold
+            if self._affordable[entry_id] != affordable:
+                self.tree.item(entry_id, tags=() if affordable else ("unaffordable",))
+                self._affordable[entry_id] = affordable
+                calls += 1
+        return calls
+
+    def _order(self):
+        """All ids in the current sort order"""
+        if self.sort_column is None:
+            order = list(self.entries)
+        else:
+            order = self._orders.get(self.sort_column)
+            if order is None:
+                key = SORT_KEYS[self.sort_column]
+                order = sorted(self.entries, key=lambda entry_id: key(self.entries[entry_id]))
+                self._orders[self.sort_column] = order
+        return order[::-1] if self.descending else order
+
+    def _render(self):
+        """Attach the filtered rows in sort order; returns the number of Treeview calls (0 or 1)"""
+        visible = set(self.categories[self.category])
+        if self._query_matches is not None:
+            visible &= self._query_matches
+        wanted = [entry_id for entry_id in self._order() if entry_id in visible]
+        if wanted == self.shown:
+            return 0
+
+        # One call reorders the rows; rows left out are detached, not deleted
+        self.tree.set_children("", *wanted)
+        self.shown = wanted
+        return 1
+
+
+class ShopDialog(tk.Toplevel):
+    """Rulebook shop, built once and shown again for every purchase"""
+
+    def __init__(self, parent, catalog):
+        super().__init__(parent)
+        self.withdraw()  # Shown by choose()
+        self.title("Rulebook Shop")
+        self.minsize(800, 550)
+        self.transient(parent)  # Set to be on top of the main window
+
+        self.catalog = catalog
+        self.available_gold = 0
+        self.result = None
+        self._closed = tk.BooleanVar(self, value=True)
+
+        # Setup UI
+        self._setup_ui()
+
+        # Center on parent the first time; afterwards it opens where it was left
+        self.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self.bind("<Escape>", lambda e: self._close())
+
+    def _setup_ui(self):
+        """Setup the dialog UI"""
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Available gold display
+        gold_frame = ttk.Frame(main_frame)
+        gold_frame.pack(fill=tk.X, pady=5)
+        self.gold_text_var = tk.StringVar()
+        ttk.Label(gold_frame, textvariable=self.gold_text_var, font=("Helvetica", 10, "bold")).pack(side=tk.LEFT)
+
+        # Category and search field, both filtering the list in place
+        filter_frame = ttk.Frame(main_frame)
+        filter_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Label(filter_frame, text="Category:").pack(side=tk.LEFT, padx=5)
+        self.category_var = tk.StringVar(value=ALL)
+        categories = [ALL] + [category for kind in ("weapon", "armor", "shield")
+                              for category in self.catalog.categories(kind)]
+        categories += [ALL_ITEMS] + self.catalog.categories("item")
+        self.category_combobox = ttk.Combobox(filter_frame, textvariable=self.category_var, values=categories,
+                                              width=20, state="readonly")
+        self.category_combobox.pack(side=tk.LEFT, padx=5)
+        self.category_combobox.bind("<<ComboboxSelected>>", lambda e: self._on_filter_change())
+
+        ttk.Label(filter_frame, text="Search:").pack(side=tk.LEFT, padx=(15, 5))
+        self.query_var = tk.StringVar()
+        self.query_entry = ttk.Entry(filter_frame, textvariable=self.query_var, width=30)
+        self.query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.query_var.trace_add("write", lambda *args: self._on_query_change())
+
+        # Every rulebook entry, with a scrollbar
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        columns = tuple(HEADINGS)
+        self.shop_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=12)
+        for column, text in HEADINGS.items():
+            if column in SORT_KEYS:
+                self.shop_tree.heading(column, text=text, command=lambda column=column: self._on_sort(column))
+            else:
+                self.shop_tree.heading(column, text=text)
+
+        # Define column widths
+        self.shop_tree.column("name", width=140)
+        self.shop_tree.column("category", width=100)
+        self.shop_tree.column("price", width=70)
+        self.shop_tree.column("size", width=50)
+        self.shop_tree.column("equip", width=80)
+        self.shop_tree.column("stats", width=260)
+
+        shop_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.shop_tree.yview)
+        self.shop_tree.configure(yscrollcommand=shop_scrollbar.set)
+        self.shop_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        shop_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.rows = ShopRows(self.shop_tree, self.catalog)
+
+        # Bind selection event
+        self.shop_tree.bind("<<TreeviewSelect>>", self._on_entry_select)
+
+        # Description frame
+        desc_frame = ttk.LabelFrame(main_frame, text="Description")
+        desc_frame.pack(fill=tk.X, pady=10)
+
+        self.description_var = tk.StringVar()
+        desc_label = ttk.Label(desc_frame, textvariable=self.description_var, wraplength=780)
+        desc_label.pack(fill=tk.X, padx=5, pady=5)
+
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=10)
+
+        ttk.Button(button_frame, text="Buy", command=lambda: self._on_select("buy")).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Give", command=lambda: self._on_select("give")).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close", command=self._close).pack(side=tk.RIGHT, padx=5)
+
+    def choose(self, category, available_gold):
+        """
+        Show the shop on a category and wait until an entry is bought or given
+        or the window is closed. Returns (equipment, transaction type, entry) or None.
+        """
+        self.result = None
+        self.available_gold = available_gold
+        self.gold_text_var.set(f"Available Gold: {available_gold}g")
+        self.rows.set_gold(available_gold)
+
+        # Start from the whole category; the sort order is kept
+        self.category_var.set(category)
+        self.query_var.set("")
+        self._on_filter_change()
+        self.shop_tree.selection_remove(self.shop_tree.selection())
+        self.description_var.set("Select an entry to see its description")
+
+        self.deiconify()
+        self.lift()
+        self.wait_visibility()  # A withdrawn window can't take the grab
+        self.grab_set()  # Make window modal
+        self.query_entry.focus_set()
+
+        self._closed.set(False)
+        self.wait_variable(self._closed)
+        return self.result
+
+    def _close(self):
+        """Hide the window; it is shown again by the next choose()"""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+
+    def _on_query_change(self):
+        """Search every category once something is typed; a category can be picked afterwards"""
+        if not self.rows.query.strip() and self.query_var.get().strip():
+            self.category_var.set(ALL)
+        self._on_filter_change()
+
+    def _on_filter_change(self):
+        """Filter the list by the category and the search field"""
+        self.rows.filter(self.category_var.get(), self.query_var.get())
+        # Rows filtered out can't be bought
+        hidden = [entry_id for entry_id in self.shop_tree.selection() if entry_id not in self.rows.shown]
+        if hidden:
+            self.shop_tree.selection_remove(hidden)
+
+    def _on_sort(self, column):
+        """Sort by a column heading; clicking it again reverses the order"""
+        self.rows.sort_by(column)
+        for heading in SORT_KEYS:
+            marker = ""
+            if heading == self.rows.sort_column:
+                marker = " ▼" if self.rows.descending else " ▲"
+            self.shop_tree.heading(heading, text=HEADINGS[heading] + marker)
+
+    def _on_entry_select(self, event):
+        """Handle entry selection in treeview"""
+        selected = self.shop_tree.selection()
+        if selected:
+            self.description_var.set(self.catalog.get(selected[0]).description)
+
+    def _on_select(self, transaction_type):
+        """Handle entry selection - buy or give"""
+        selected = self.shop_tree.selection()
+        if not selected:
+            messagebox.showinfo("Select Equipment", "Please select an entry from the list.", parent=self)
+            return
+
+        entry = self.catalog.get(selected[0])
+
+        # If buying, check if they have enough gold
+        if transaction_type == "buy" and self.available_gold < entry.price:
+            messagebox.showerror("Not Enough Gold",
+                                 f"You need {entry.price} gold to buy {entry.name}, but you only have "
+                                 f"{self.available_gold} gold.", parent=self)
+            return
+
+        # Return equipment referring to the rulebook entry, the transaction type and the entry
+        self.result = (entry.create(), transaction_type, entry)
+        self._close()
@@ -1,21 +1,45 @@
 import tkinter as tk
 from tkinter import ttk
 from models.stats import Stat
+from models.derived_stats import DEPENDENTS
+from controllers.view_updates import update_var, update_text
 
 
 class StatsTab(ttk.Frame):
     """Tab for character stats and skills"""
 
+    # Derived values (see models/derived_stats.py) shown on this tab
+    DISPLAYED_DERIVED = ("initiative", "max_hp", "max_mp", "movement_check", "direction_check", "camp_check",
+                         "total_stats")
+
     def __init__(self, parent, app_controller):
         super().__init__(parent)
         self.app_controller = app_controller
 
-        # Register with controller
-        self.app_controller.register_ui_element("stats_tab", self)
-
         # Setup UI
         self._setup_ui()
 
+        # Derived values follow the current character (see Character.hand_over_observers)
+        for name in self.DISPLAYED_DERIVED:
+            self.app_controller.character.derived.subscribe(name, self._on_derived_change)
+
+        # Character attribute -> view showing it (see AppController.register_ui_element)
+        self.field_views = {
+            "str": self._show_stat,
+            "dex": self._show_stat,
+            "int": self._show_stat,
+            "spi": self._show_stat,
+            "hp": self._show_pool,
+            "mp": self._show_pool,
+            "initiative": lambda field, value: update_var(self.initiative_var, value),
+            "fumble_points": lambda field, value: update_var(self.fumble_var, value),
+            "condition_checks": self._show_condition_checks,
+            "abilities": self._show_abilities,
+        }
+
+        # Register with controller (after the widgets exist, so the fields can be shown)
+        self.app_controller.register_ui_element("stats_tab", self)
+
     def _setup_ui(self):
         """Setup the UI elements"""
         self.columnconfigure(0, weight=1)
@@ -295,30 +319,32 @@ class StatsTab(ttk.Frame):
         avg_value = Stat.get_average_value(die_size)
         value_var.set(round(avg_value))
 
-        # Keep current value in sync with base value (since we don't display it separately)
-        if stat_name == "str" or stat_name == "spi":
-            current_var = getattr(self, f"{stat_name}_current_var")
-            current_var.set(value_var.get())
-
-        # Update character model
-        self._update_character_from_ui()
-        self._update_derived_stats()
-        self._calculate_hp_mp()  # Also update HP/MP when STR/SPI change
-        self.app_controller.mark_unsaved_changes()
+        self._set_stat(stat_name, value_var.get(), die_size)
 
     def _on_value_change(self, stat_name):
         """Handle value change for a stat"""
+        value_var = getattr(self, f"{stat_name}_value_var")
+        try:
+            value = value_var.get()
+        except tk.TclError:
+            return  # Empty or partly typed value
+
+        self._set_stat(stat_name, value)
+
+    def _set_stat(self, stat_name, value, die_size=None):
+        """Store one stat on the character; subscribed derived values update themselves"""
+        character = self.app_controller.character
+
         # Keep current value in sync with base value (since we don't display it separately)
         if stat_name == "str" or stat_name == "spi":
-            value_var = getattr(self, f"{stat_name}_value_var")
-            current_var = getattr(self, f"{stat_name}_current_var")
-            current_var.set(value_var.get())
+            getattr(self, f"{stat_name}_current_var").set(value)
+            stat = getattr(character, stat_name)
+            stat.max_value = value  # Max STR/SPI is the base value
+            stat.current_value = value  # Keep this for backward compatibility
 
-        # Update character model
-        self._update_character_from_ui()
-        self._update_derived_stats()
-        self._calculate_hp_mp()  # Also update HP/MP when STR/SPI change
-        self.app_controller.mark_unsaved_changes()
+        if character.set_stat(stat_name, value=value, die_size=die_size):
+            # The derived values shown here may have changed initiative and max HP/MP
+            self.app_controller.ui_sync.changed(stat_name, "initiative", "hp", "mp")
 
     def _on_hp_change(self, event=None):
         """Handle HP change"""
@@ -327,8 +353,8 @@ class StatsTab(ttk.Frame):
         if self.current_hp_var.get() > max_hp:
             self.current_hp_var.set(max_hp)
 
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
+        self.app_controller.character.hp.current = self.current_hp_var.get()
+        self.app_controller.ui_sync.changed("hp")
 
     def _on_mp_change(self, event=None):
         """Handle MP change"""
@@ -337,133 +363,26 @@ class StatsTab(ttk.Frame):
         if self.current_mp_var.get() > max_mp:
             self.current_mp_var.set(max_mp)
 
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
+        self.app_controller.character.mp.current = self.current_mp_var.get()
+        self.app_controller.ui_sync.changed("mp")
 
     def _calculate_hp_mp(self):
         """Calculate HP and MP based on STR and SPI"""
-        # Calculate Max HP (STR * 2)
-        str_value = self.str_value_var.get()
-        max_hp = str_value * 2
-        self.max_hp_var.set(str(max_hp))
-
-        # Calculate Max MP (SPI * 2)
-        spi_value = self.spi_value_var.get()
-        max_mp = spi_value * 2
-        self.max_mp_var.set(str(max_mp))
-
-        # Adjust current values if they exceed max
-        if self.current_hp_var.get() > max_hp:
-            self.current_hp_var.set(max_hp)
-        if self.current_mp_var.get() > max_mp:
-            self.current_mp_var.set(max_mp)
-
-        # Update character model
-        self._update_character_from_ui()
+        fields = self.app_controller.character.apply_derived("max_hp", "max_mp")
+        if fields:
+            self.app_controller.mark_unsaved_changes(*fields)
 
     def _on_fumble_change(self, event=None):
         """Handle fumble points change"""
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
+        self.app_controller.ui_sync.mark(
+            "fumble_points", lambda character: setattr(character, "fumble_points", self.fumble_var.get()))
 
     def _on_condition_change(self, event=None):
         """Handle condition check value change"""
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
-
-    def _on_ability_change(self, level):
-        """Handle ability text change for a level"""
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
-
-    def _calculate_initiative(self):
-        """Calculate initiative from DEX and INT"""
-        dex_value = self.dex_value_var.get()
-        int_value = self.int_value_var.get()
-        initiative = dex_value + int_value
-
-        self.initiative_var.set(initiative)
-        self._update_character_from_ui()
-        self.app_controller.mark_unsaved_changes()
-
-    def _calculate_travel_checks(self):
-        """Calculate all travel check values from stats"""
-        str_value = self.str_value_var.get()
-        dex_value = self.dex_value_var.get()
-        int_value = self.int_value_var.get()
-
-        # Movement Check (STR + DEX)
-        self.movement_check_var.set(str(str_value + dex_value))
-
-        # Direction Check (INT + INT)
-        self.direction_check_var.set(str(int_value + int_value))
-
-        # Camp Check (DEX + INT)
-        self.camp_check_var.set(str(dex_value + int_value))
+        self.app_controller.ui_sync.mark("condition_checks", self._apply_condition_checks)
 
-        self._update_character_from_ui()
-
-    def _update_total_stats(self):
-        """Update the total stats display"""
-        str_value = self.str_value_var.get()
-        dex_value = self.dex_value_var.get()
-        int_value = self.int_value_var.get()
-        spi_value = self.spi_value_var.get()
-
-        total = str_value + dex_value + int_value + spi_value
-        self.total_stat_var.set(str(total))
-
-        # Update bonus text based on total
-        if total > 10:
-            self.stat_bonus_var.set("Bonus: Add 1 dice size to any 1 stat")
-        else:
-            self.stat_bonus_var.set("No bonus (total ≤ 10)")
-
-    def _update_derived_stats(self):
-        """Update all derived stats based on current stat values"""
-        self._update_total_stats()
-        self._calculate_initiative()
-        self._calculate_travel_checks()
-
-    def _update_character_from_ui(self):
-        """Update character model from UI values"""
-        character = self.app_controller.character
-
-        # Update stat values
-        character.str["die_size"] = self.str_die_var.get()
-        character.str["value"] = self.str_value_var.get()
-        character.str["max"] = self.str_value_var.get()  # Max STR is the base value
-        character.str["current"] = self.str_current_var.get()  # Keep this for backward compatibility
-
-        character.dex["die_size"] = self.dex_die_var.get()
-        character.dex["value"] = self.dex_value_var.get()
-
-        character.int["die_size"] = self.int_die_var.get()
-        character.int["value"] = self.int_value_var.get()
-
-        character.spi["die_size"] = self.spi_die_var.get()
-        character.spi["value"] = self.spi_value_var.get()
-        character.spi["max"] = self.spi_value_var.get()  # Max SPI is the base value
-        character.spi["current"] = self.spi_current_var.get()  # Keep this for backward compatibility
-
-        # Update HP and MP values
-        # Make sure the character has hp and mp attributes
-        if not hasattr(character, 'hp'):
-            character.hp = {}
-        if not hasattr(character, 'mp'):
-            character.mp = {}
-
-        character.hp["max"] = int(self.max_hp_var.get())
-        character.hp["current"] = self.current_hp_var.get()
-
-        character.mp["max"] = int(self.max_mp_var.get())
-        character.mp["current"] = self.current_mp_var.get()
-
-        # Update derived stats
-        character.initiative = self.initiative_var.get()
-        character.fumble_points = self.fumble_var.get()
-
-        # Update condition checks
+    def _apply_condition_checks(self, character):
+        """Copy the condition check values into the character"""
         character.condition_checks = {
             "str": self.str_condition_var.get(),
             "dex": self.dex_condition_var.get(),
@@ -471,62 +390,74 @@ class StatsTab(ttk.Frame):
             "spi": self.spi_condition_var.get()
         }
 
-        # Update abilities for each level
-        for level in range(1, 6):
-            text_widget = self.ability_texts[level]
-            character.abilities[level] = text_widget.get("1.0", tk.END).strip()
-
-    def update_from_character(self, character):
-        """Update UI from character model"""
-        # Update stat values
-        self.str_die_var.set(character.str["die_size"])
-        self.str_value_var.set(character.str["value"])
-        self.str_current_var.set(character.str["current"])  # Keep this for backward compatibility
-
-        self.dex_die_var.set(character.dex["die_size"])
-        self.dex_value_var.set(character.dex["value"])
-
-        self.int_die_var.set(character.int["die_size"])
-        self.int_value_var.set(character.int["value"])
-
-        self.spi_die_var.set(character.spi["die_size"])
-        self.spi_value_var.set(character.spi["value"])
-        self.spi_current_var.set(character.spi["current"])  # Keep this for backward compatibility
-
-        # Update derived stats
-        self.initiative_var.set(character.initiative)
-        self.fumble_var.set(character.fumble_points)
-
-        # Update HP and MP values
-        max_hp = character.str["value"] * 2
-        self.max_hp_var.set(str(max_hp))
-
-        max_mp = character.spi["value"] * 2
-        self.max_mp_var.set(str(max_mp))
-
-        # Handle updated HP/MP in character model
-        if hasattr(character, 'hp') and 'current' in character.hp:
-            self.current_hp_var.set(character.hp["current"])
-        else:
-            self.current_hp_var.set(max_hp)
-
-        if hasattr(character, 'mp') and 'current' in character.mp:
-            self.current_mp_var.set(character.mp["current"])
-        else:
-            self.current_mp_var.set(max_mp)
+    def _on_ability_change(self, level):
+        """Handle ability text change for a level"""
+        self.app_controller.ui_sync.mark(f"abilities.{level}", lambda character: self._apply_ability(character, level))
 
-        # Update condition checks
-        self.str_condition_var.set(character.condition_checks["str"])
-        self.dex_condition_var.set(character.condition_checks["dex"])
-        self.int_condition_var.set(character.condition_checks["int"])
-        self.spi_condition_var.set(character.condition_checks["spi"])
+    def _apply_ability(self, character, level):
+        """Copy the ability text of a level into the character"""
+        character.abilities[level] = self.ability_texts[level].get("1.0", tk.END).strip()
 
-        # Update abilities for each level
-        for level in range(1, 6):
-            text_widget = self.ability_texts[level]
-            text_widget.delete("1.0", tk.END)
-            if level in character.abilities and character.abilities[level]:
-                text_widget.insert("1.0", character.abilities[level])
+    def _calculate_initiative(self):
+        """Calculate initiative from DEX and INT"""
+        if self.app_controller.character.apply_derived("initiative"):
+            self.app_controller.mark_unsaved_changes("initiative")
 
-        # Update derived stats displays
-        self._update_derived_stats()
\ No newline at end of file
+    def _calculate_travel_checks(self):
+        """Calculate all travel check values from stats"""
+        derived = self.app_controller.character.derived
+        for name in ("movement_check", "direction_check", "camp_check"):
+            self._show_derived(name, derived.get(name))
+
+    def _on_derived_change(self, name, value):
+        """A derived value changed: show it (the character stores its own, see Character.apply_derived)"""
+        self.app_controller.view_updates.count(name, self._show_derived(name, value))
+
+    def _show_derived(self, name, value):
+        """Display a derived value; returns the number of widgets written"""
+        if name == "initiative":
+            return update_var(self.initiative_var, value)
+        elif name == "max_hp":
+            return update_var(self.max_hp_var, str(value))
+        elif name == "max_mp":
+            return update_var(self.max_mp_var, str(value))
+        elif name == "movement_check":
+            return update_var(self.movement_check_var, str(value))
+        elif name == "direction_check":
+            return update_var(self.direction_check_var, str(value))
+        elif name == "camp_check":
+            return update_var(self.camp_check_var, str(value))
+        elif name == "total_stats":
+            written = update_var(self.total_stat_var, str(value))
+            # Update bonus text based on total
+            if value > 10:
+                return written + update_var(self.stat_bonus_var, "Bonus: Add 1 dice size to any 1 stat")
+            return written + update_var(self.stat_bonus_var, "No bonus (total ≤ 10)")
+        return 0
+
+    def _show_stat(self, stat_name, stat):
+        """Show a stat and the derived values that depend on it"""
+        written = update_var(getattr(self, f"{stat_name}_die_var"), stat.die_size)
+        written += update_var(getattr(self, f"{stat_name}_value_var"), stat.value)
+        if stat_name == "str" or stat_name == "spi":
+            written += update_var(getattr(self, f"{stat_name}_current_var"), stat.current_value)
+
+        # Initiative shows the stored value (see the "initiative" view)
+        derived = self.app_controller.character.derived
+        for name in DEPENDENTS[stat_name]:
+            if name in self.DISPLAYED_DERIVED and name != "initiative":
+                written += self._show_derived(name, derived.get(name))
+        return written
+
+    def _show_pool(self, field, pool):
+        """Show current HP or MP"""
+        return update_var(self.current_hp_var if field == "hp" else self.current_mp_var, pool.current)
+
+    def _show_condition_checks(self, field, condition_checks):
+        """Show the condition check values"""
+        return sum(update_var(getattr(self, f"{stat_name}_condition_var"), condition_checks[stat_name])
+                   for stat_name in ("str", "dex", "int", "spi"))
+
+    def _show_abilities(self, field, abilities):
+        """Show the abilities of each level"""
+        return sum(update_text(self.ability_texts[level], abilities.get(level) or "") for level in range(1, 6))
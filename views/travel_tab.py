@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
-from models.conditions import TerrainEffect, WeatherEffect
+from models.conditions import TerrainEffect, WeatherEffect, TRAVEL_CHECKS, travel_conditions
+from controllers.view_updates import update_var
 
 
 class TravelTab(ttk.Frame):
@@ -10,12 +11,18 @@ class TravelTab(ttk.Frame):
         super().__init__(parent)
         self.app_controller = app_controller
 
-        # Register with controller
-        self.app_controller.register_ui_element("travel_tab", self)
-
         # Setup UI
         self._setup_ui()
 
+        # Character attribute -> view showing it (see AppController.register_ui_element)
+        self.field_views = {
+            "current_terrain": self._show_terrain,
+            "current_weather": self._show_weather,
+        }
+
+        # Register with controller (after the widgets exist, so the fields can be shown)
+        self.app_controller.register_ui_element("travel_tab", self)
+
     def _setup_ui(self):
         """Setup the UI elements"""
         self.columnconfigure(0, weight=1)
@@ -219,6 +226,12 @@ class TravelTab(ttk.Frame):
                                                                                                                 pady=5,
                                                                                                                 sticky="w")
 
+        # Target number of the travel checks
+        ttk.Label(effects_display_frame, text="Target Number:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
+        self.target_number_var = tk.StringVar(value="Choose a terrain")
+        ttk.Label(effects_display_frame, textvariable=self.target_number_var, font=("Helvetica", 10, "bold")).grid(
+            row=2, column=1, columnspan=3, padx=5, pady=5, sticky="w")
+
         # Set column weights for effects display
         for i in range(4):
             effects_display_frame.columnconfigure(i, weight=1)
@@ -266,7 +279,7 @@ class TravelTab(ttk.Frame):
         self._calculate_effects()
 
         # Mark unsaved changes
-        self.app_controller.mark_unsaved_changes()
+        self.app_controller.mark_unsaved_changes("current_terrain")
 
     def _on_weather_change(self, weather_type):
         """Handle weather selection change"""
@@ -308,95 +321,51 @@ class TravelTab(ttk.Frame):
         self._calculate_effects()
 
         # Mark unsaved changes
-        self.app_controller.mark_unsaved_changes()
+        self.app_controller.mark_unsaved_changes("current_weather")
 
     def _calculate_effects(self):
-        """Calculate the combined effects of terrain and weather"""
-        # Initialize effects dictionary
-        effects = {
-            "str": 0,
-            "dex": 0,
-            "int": 0,
-            "spi": 0
-        }
-
-        # Get current terrain and calculate its effects
-        current_terrain = self.app_controller.character.current_terrain
-        if current_terrain:
-            terrain_effect = TerrainEffect(current_terrain)
-            for stat, bonus in terrain_effect.effects.items():
-                if stat == "all":
-                    # Apply to all stats
-                    for key in effects:
-                        effects[key] += bonus
-                else:
-                    effects[stat] += bonus
-
-        # Get current weather and calculate its effects
-        current_weather = self.app_controller.character.current_weather
-        if current_weather:
-            weather_effect = WeatherEffect(current_weather)
-            for stat, bonus in weather_effect.effects.items():
-                if stat == "all":
-                    # Apply to all stats
-                    for key in effects:
-                        effects[key] += bonus
-                else:
-                    effects[stat] += bonus
+        """Show the combined effects of terrain and weather; returns the number of widgets written"""
+        character = self.app_controller.character
+        conditions = travel_conditions(character.current_terrain, character.current_weather)
 
         # Update the UI
-        for stat, effect in effects.items():
+        written = 0
+        for stat, effect in conditions.stat_modifiers.items():
+            effect += conditions.all_modifier
             if effect > 0:
-                self.__dict__[f"{stat}_effect_var"].set(f"+{effect}")
+                written += update_var(self.__dict__[f"{stat}_effect_var"], f"+{effect}")
             else:
-                self.__dict__[f"{stat}_effect_var"].set(str(effect))
-
-    def update_from_character(self, character):
-        """Update UI from character model"""
-        # Reset all checkboxes
-        terrain_types = [
-            "grassland", "wasteland", "woods", "highlands", "rocky_terrain",
-            "deep_forest", "swamp", "mountain", "desert", "jungle", "alpine"
-        ]
-
-        weather_types = [
-            "rain", "strong_wind", "fog", "hot", "cold",
-            "hardrain", "snow", "deep_fog", "dark", "hurricane", "blizzard"
-        ]
-
-        # Reset all terrain checkboxes
-        for terrain_type in terrain_types:
-            self.__dict__[f"terrain_{terrain_type}_var"].set(False)
-
-        # Reset all weather checkboxes
-        for weather_type in weather_types:
-            self.__dict__[f"weather_{weather_type}_var"].set(False)
-
-        # Set current terrain if any
-        if character.current_terrain:
-            self.__dict__[f"terrain_{character.current_terrain}_var"].set(True)
-            pretty_name = character.current_terrain.replace('_', ' ').title()
-            self.current_terrain_var.set(pretty_name)
-
-            # Update the description
-            effect = TerrainEffect(character.current_terrain)
-            self.terrain_description_var.set(effect.description)
+                written += update_var(self.__dict__[f"{stat}_effect_var"], str(effect))
+
+        if conditions.target_number is None:
+            return written + update_var(self.target_number_var, "Choose a terrain")
+        checks = [f"{check.capitalize()} {conditions.check_modifiers[check]:+d}" for check in TRAVEL_CHECKS]
+        return written + update_var(self.target_number_var, f"{conditions.target_number}  ({', '.join(checks)})")
+
+    def _show_terrain(self, field, terrain):
+        """Show the current terrain and the effects"""
+        written = 0
+        for terrain_type in TerrainEffect.TERRAINS:
+            written += update_var(self.__dict__[f"terrain_{terrain_type}_var"], terrain_type == terrain)
+
+        if terrain:
+            written += update_var(self.current_terrain_var, terrain.replace('_', ' ').title())
+            written += update_var(self.terrain_description_var, TerrainEffect(terrain).description)
         else:
-            self.current_terrain_var.set("None")
-            self.terrain_description_var.set("")
-
-        # Set current weather if any
-        if character.current_weather:
-            self.__dict__[f"weather_{character.current_weather}_var"].set(True)
-            pretty_name = character.current_weather.replace('_', ' ').title()
-            self.current_weather_var.set(pretty_name)
-
-            # Update the description
-            effect = WeatherEffect(character.current_weather)
-            self.weather_description_var.set(effect.description)
+            written += update_var(self.current_terrain_var, "None")
+            written += update_var(self.terrain_description_var, "")
+        return written + self._calculate_effects()
+
+    def _show_weather(self, field, weather):
+        """Show the current weather and the effects"""
+        written = 0
+        for weather_type in WeatherEffect.WEATHER:
+            written += update_var(self.__dict__[f"weather_{weather_type}_var"], weather_type == weather)
+
+        if weather:
+            written += update_var(self.current_weather_var, weather.replace('_', ' ').title())
+            written += update_var(self.weather_description_var, WeatherEffect(weather).description)
         else:
-            self.current_weather_var.set("None")
-            self.weather_description_var.set("")
-
-        # Calculate effects
-        self._calculate_effects()
\ No newline at end of file
+            written += update_var(self.current_weather_var, "None")
+            written += update_var(self.weather_description_var, "")
+        return written + self._calculate_effects()